@@ -1,6 +1,5 @@
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from alembic import context
@@ -9,13 +8,19 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from src.database.config import Base
+from src.core.config import settings
+from src.database.backfill import BACKFILL_PROGRESS_TABLE
+from src.database.config import Base, create_db_engine, to_sync_url
 from src.database.models.project import Project
+from src.database.search import FTS_TABLES
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
+# 迁移与应用使用同一个数据库（DATABASE_URL）；ini 取值会做 % 插值，需要转义
+config.set_main_option("sqlalchemy.url", to_sync_url(settings.DATABASE_URL).replace("%", "%%"))
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
@@ -25,6 +30,16 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    # FTS5 虚拟表及其影子表（*_fts_data 等）由迁移中的 SQL 维护，不参与自动生成
+    if type_ == "table" and name.startswith(FTS_TABLES):
+        return False
+    # 回填进度表由 src/database/backfill.py 按需创建
+    if type_ == "table" and name == BACKFILL_PROGRESS_TABLE:
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -47,6 +62,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -62,15 +78,15 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
+    connectable = create_db_engine(
+        config.get_main_option("sqlalchemy.url"),
         poolclass=pool.NullPool,
     )
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
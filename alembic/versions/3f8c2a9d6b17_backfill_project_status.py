@@ -0,0 +1,44 @@
+"""backfill project status
+
+Revision ID: 3f8c2a9d6b17
+Revises: e7b19d4c6a53
+Create Date: 2026-10-19 23:41:12.617350
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.core.config import settings
+from src.database.backfill import backfill, create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8c2a9d6b17'
+down_revision: Union[str, None] = 'e7b19d4c6a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 没有状态的项目（状态列加入前写入或手工导入的行）补为 active；分批提交，中断后重新执行从断点继续
+    with op.get_context().autocommit_block():
+        backfill(
+            op.get_bind().engine,
+            'projects_status',
+            'projects',
+            {'status': 'active'},
+            "status IS NULL OR status = ''",
+            batch_size=settings.MIGRATION_BATCH_SIZE,
+            max_rows_per_second=settings.MIGRATION_MAX_ROWS_PER_SECOND,
+        )
+    # 回填完成后再建索引，汇总核对按 (owner_id, status) 统计未删除的项目
+    create_index_online('ix_projects_owner_id_status', 'projects', ['owner_id', 'status'], where='deleted_at IS NULL')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 回填的状态值与默认值相同，降级时不恢复
+    drop_index_online('ix_projects_owner_id_status', 'projects')
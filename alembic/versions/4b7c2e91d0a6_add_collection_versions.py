@@ -0,0 +1,58 @@
+"""add collection versions
+
+Revision ID: 4b7c2e91d0a6
+Revises: 20e5033af50f
+Create Date: 2026-10-19 18:42:37.105284
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7c2e91d0a6'
+down_revision: Union[str, None] = '20e5033af50f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 版本号由触发器维护，只在 SQLite 上创建
+VERSIONED_TABLES = ('projects', 'models')
+
+
+def _bump(table: str, row: str, condition: str = '') -> str:
+    return (
+        f"INSERT INTO collection_versions (owner_id, collection, version) "
+        f"SELECT {row}.owner_id, '{table}', 1 WHERE {row}.owner_id IS NOT NULL{condition} "
+        f"ON CONFLICT (owner_id, collection) DO UPDATE SET version = version + 1;"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('collection_versions',
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('collection', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('owner_id', 'collection')
+    )
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table in VERSIONED_TABLES:
+        op.execute(f"CREATE TRIGGER {table}_version_ai AFTER INSERT ON {table} BEGIN {_bump(table, 'new')} END")
+        op.execute(f"CREATE TRIGGER {table}_version_ad AFTER DELETE ON {table} BEGIN {_bump(table, 'old')} END")
+        # 更换所有者时新旧所有者的版本号都递增
+        op.execute(
+            f"CREATE TRIGGER {table}_version_au AFTER UPDATE ON {table} BEGIN "
+            f"{_bump(table, 'new')} {_bump(table, 'old', ' AND old.owner_id IS NOT new.owner_id')} END"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        for table in VERSIONED_TABLES:
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_version_{suffix}")
+    op.drop_table('collection_versions')
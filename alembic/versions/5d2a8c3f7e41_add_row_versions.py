@@ -0,0 +1,31 @@
+"""add row versions
+
+Revision ID: 5d2a8c3f7e41
+Revises: c41d8a6e9f20
+Create Date: 2026-10-19 16:52:08.417215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a8c3f7e41'
+down_revision: Union[str, None] = 'c41d8a6e9f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 已有的行从版本 1 开始
+    op.add_column('projects', sa.Column('row_version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('models', sa.Column('row_version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('models', 'row_version')
+    op.drop_column('projects', 'row_version')
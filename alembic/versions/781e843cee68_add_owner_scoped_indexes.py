@@ -0,0 +1,36 @@
+"""add owner scoped indexes
+
+Revision ID: 781e843cee68
+Revises: 2a60c2d52d08
+Create Date: 2026-10-19 10:12:41.305118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '781e843cee68'
+down_revision: Union[str, None] = '2a60c2d52d08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 列表查询：WHERE owner_id = ? ORDER BY created_at DESC（id 作为同一时间的排序键）
+    op.create_index('ix_projects_owner_id_created_at', 'projects', ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_models_owner_id_created_at', 'models', ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    # 单条查询：WHERE id = ? AND owner_id = ?
+    op.create_index('ix_projects_owner_id_id', 'projects', ['owner_id', 'id'], unique=False)
+    op.create_index('ix_models_owner_id_id', 'models', ['owner_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_models_owner_id_id', table_name='models')
+    op.drop_index('ix_projects_owner_id_id', table_name='projects')
+    op.drop_index('ix_models_owner_id_created_at', table_name='models')
+    op.drop_index('ix_projects_owner_id_created_at', table_name='projects')
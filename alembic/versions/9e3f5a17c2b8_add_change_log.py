@@ -0,0 +1,68 @@
+"""add change log
+
+Revision ID: 9e3f5a17c2b8
+Revises: 4b7c2e91d0a6
+Create Date: 2026-10-19 20:14:08.631947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3f5a17c2b8'
+down_revision: Union[str, None] = '4b7c2e91d0a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 变更日志由触发器写入，只在 SQLite 上创建触发器
+CHANGE_TABLES = ('projects', 'models')
+
+
+def _log(table: str, row: str, change: str, condition: str = '') -> str:
+    return (
+        f"INSERT INTO change_log (owner_id, collection, entity_id, op) "
+        f"SELECT {row}.owner_id, '{table}', {row}.id, '{change}' WHERE {row}.owner_id IS NOT NULL{condition};"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('change_log',
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('collection', sa.String(), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('op', sa.String(), nullable=False),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('seq'),
+    sqlite_autoincrement=True
+    )
+    op.create_index('ix_change_log_owner_id_seq', 'change_log', ['owner_id', 'seq'], unique=False)
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table in CHANGE_TABLES:
+        op.execute(f"CREATE TRIGGER {table}_changes_ai AFTER INSERT ON {table} BEGIN {_log(table, 'new', 'insert')} END")
+        op.execute(f"CREATE TRIGGER {table}_changes_ad AFTER DELETE ON {table} BEGIN {_log(table, 'old', 'delete')} END")
+        # 更换所有者时旧所有者收到删除记录
+        op.execute(
+            f"CREATE TRIGGER {table}_changes_au AFTER UPDATE ON {table} BEGIN "
+            f"{_log(table, 'new', 'update')} {_log(table, 'old', 'delete', ' AND old.owner_id IS NOT new.owner_id')} END"
+        )
+        # 已有数据记为插入，客户端从 since=0 开始同步即可得到全部数据
+        op.execute(
+            f"INSERT INTO change_log (owner_id, collection, entity_id, op) "
+            f"SELECT owner_id, '{table}', id, 'insert' FROM {table} WHERE owner_id IS NOT NULL ORDER BY id"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        for table in CHANGE_TABLES:
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_changes_{suffix}")
+    op.drop_index('ix_change_log_owner_id_seq', table_name='change_log')
+    op.drop_table('change_log')
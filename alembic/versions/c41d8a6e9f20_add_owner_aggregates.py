@@ -0,0 +1,77 @@
+"""add owner aggregates
+
+Revision ID: c41d8a6e9f20
+Revises: 9e3f5a17c2b8
+Create Date: 2026-10-19 22:03:51.284476
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d8a6e9f20'
+down_revision: Union[str, None] = '9e3f5a17c2b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 汇总计数由触发器维护，只在 SQLite 上创建触发器
+AGGREGATES = {'projects': ('status',), 'models': ('type', 'status')}
+
+
+def _bump(table: str, field: str, row: str, delta: int, condition: str = '') -> str:
+    return (
+        f"INSERT INTO owner_aggregates (owner_id, collection, field, value, count) "
+        f"SELECT {row}.owner_id, '{table}', '{field}', {row}.{field}, {delta} "
+        f"WHERE {row}.owner_id IS NOT NULL AND {row}.{field} IS NOT NULL{condition} "
+        f"ON CONFLICT (owner_id, collection, field, value) DO UPDATE SET count = count + excluded.count;"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('owner_aggregates',
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('collection', sa.String(), nullable=False),
+    sa.Column('field', sa.String(), nullable=False),
+    sa.Column('value', sa.String(), nullable=False),
+    sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('owner_id', 'collection', 'field', 'value')
+    )
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, fields in AGGREGATES.items():
+        changed = ' OR '.join(f'old.{column} IS NOT new.{column}' for column in ('owner_id', *fields))
+        on_insert = ' '.join(_bump(table, field, 'new', 1) for field in fields)
+        on_delete = ' '.join(_bump(table, field, 'old', -1) for field in fields)
+        # 只有所有者或该字段变化时才把计数从旧值移到新值
+        on_update = ' '.join(
+            _bump(table, field, 'old', -1, f' AND (old.owner_id IS NOT new.owner_id OR old.{field} IS NOT new.{field})')
+            + ' '
+            + _bump(table, field, 'new', 1, f' AND (old.owner_id IS NOT new.owner_id OR old.{field} IS NOT new.{field})')
+            for field in fields
+        )
+        op.execute(f"CREATE TRIGGER {table}_aggregates_ai AFTER INSERT ON {table} BEGIN {on_insert} END")
+        op.execute(f"CREATE TRIGGER {table}_aggregates_ad AFTER DELETE ON {table} BEGIN {on_delete} END")
+        op.execute(
+            f"CREATE TRIGGER {table}_aggregates_au AFTER UPDATE OF owner_id, {', '.join(fields)} ON {table} "
+            f"WHEN {changed} BEGIN {on_update} END"
+        )
+        # 按已有数据计算初始计数
+        for field in fields:
+            op.execute(
+                f"INSERT INTO owner_aggregates (owner_id, collection, field, value, count) "
+                f"SELECT owner_id, '{table}', '{field}', {field}, COUNT(*) FROM {table} "
+                f"WHERE owner_id IS NOT NULL AND {field} IS NOT NULL GROUP BY owner_id, {field}"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        for table in AGGREGATES:
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_aggregates_{suffix}")
+    op.drop_table('owner_aggregates')
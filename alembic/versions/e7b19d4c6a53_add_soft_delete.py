@@ -0,0 +1,112 @@
+"""add soft delete
+
+Revision ID: e7b19d4c6a53
+Revises: 5d2a8c3f7e41
+Create Date: 2026-10-19 17:20:44.905127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b19d4c6a53'
+down_revision: Union[str, None] = '5d2a8c3f7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AGGREGATES = {'projects': ('status',), 'models': ('type', 'status')}
+
+
+def _bump(table: str, field: str, row: str, delta: int, condition: str = '') -> str:
+    return (
+        f"INSERT INTO owner_aggregates (owner_id, collection, field, value, count) "
+        f"SELECT {row}.owner_id, '{table}', '{field}', {row}.{field}, {delta} "
+        f"WHERE {row}.owner_id IS NOT NULL AND {row}.{field} IS NOT NULL{condition} "
+        f"ON CONFLICT (owner_id, collection, field, value) DO UPDATE SET count = count + excluded.count;"
+    )
+
+
+def _moved(field: str) -> str:
+    return f'old.owner_id IS NOT new.owner_id OR old.{field} IS NOT new.{field}'
+
+
+def _aggregate_triggers(table: str, fields: Sequence[str], soft_delete: bool) -> None:
+    """创建汇总计数触发器；soft_delete 为真时只统计未删除的行（与 c41d8a6e9f20 中的版本相对）"""
+    for suffix in ('ai', 'ad', 'au'):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_aggregates_{suffix}")
+    if soft_delete:
+        columns = ('owner_id', 'deleted_at', *fields)
+        on_insert = ' '.join(_bump(table, field, 'new', 1, ' AND new.deleted_at IS NULL') for field in fields)
+        on_delete = ' '.join(_bump(table, field, 'old', -1, ' AND old.deleted_at IS NULL') for field in fields)
+        on_update = ' '.join(
+            _bump(table, field, 'old', -1, f' AND old.deleted_at IS NULL AND (new.deleted_at IS NOT NULL OR {_moved(field)})')
+            + ' '
+            + _bump(table, field, 'new', 1, f' AND new.deleted_at IS NULL AND (old.deleted_at IS NOT NULL OR {_moved(field)})')
+            for field in fields
+        )
+    else:
+        columns = ('owner_id', *fields)
+        on_insert = ' '.join(_bump(table, field, 'new', 1) for field in fields)
+        on_delete = ' '.join(_bump(table, field, 'old', -1) for field in fields)
+        on_update = ' '.join(
+            _bump(table, field, 'old', -1, f' AND ({_moved(field)})')
+            + ' '
+            + _bump(table, field, 'new', 1, f' AND ({_moved(field)})')
+            for field in fields
+        )
+    changed = ' OR '.join(f'old.{column} IS NOT new.{column}' for column in columns)
+    op.execute(f"CREATE TRIGGER {table}_aggregates_ai AFTER INSERT ON {table} BEGIN {on_insert} END")
+    op.execute(f"CREATE TRIGGER {table}_aggregates_ad AFTER DELETE ON {table} BEGIN {on_delete} END")
+    op.execute(
+        f"CREATE TRIGGER {table}_aggregates_au AFTER UPDATE OF {', '.join(columns)} ON {table} "
+        f"WHEN {changed} BEGIN {on_update} END"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('projects', 'models'):
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+        live = sa.text('deleted_at IS NULL')
+        # 按所有者的索引改为只包含未删除行的部分索引
+        op.drop_index(f'ix_{table}_owner_id_created_at', table_name=table)
+        op.drop_index(f'ix_{table}_owner_id_id', table_name=table)
+        op.create_index(
+            f'ix_{table}_owner_id_created_at', table, ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False, sqlite_where=live, postgresql_where=live,
+        )
+        op.create_index(
+            f'ix_{table}_owner_id_id', table, ['owner_id', 'id'],
+            unique=False, sqlite_where=live, postgresql_where=live,
+        )
+        deleted = sa.text('deleted_at IS NOT NULL')
+        op.create_index(
+            f'ix_{table}_deleted_at', table, ['deleted_at'],
+            unique=False, sqlite_where=deleted, postgresql_where=deleted,
+        )
+    if op.get_bind().dialect.name == 'sqlite':
+        for table, fields in AGGREGATES.items():
+            _aggregate_triggers(table, fields, soft_delete=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('projects', 'models'):
+        # 尚未清理的软删除行直接删除（此时的触发器不会再减去它们的计数）
+        op.execute(f"DELETE FROM {table} WHERE deleted_at IS NOT NULL")
+    if op.get_bind().dialect.name == 'sqlite':
+        for table, fields in AGGREGATES.items():
+            _aggregate_triggers(table, fields, soft_delete=False)
+    for table in ('projects', 'models'):
+        op.drop_index(f'ix_{table}_deleted_at', table_name=table)
+        op.drop_index(f'ix_{table}_owner_id_id', table_name=table)
+        op.drop_index(f'ix_{table}_owner_id_created_at', table_name=table)
+        op.create_index(f'ix_{table}_owner_id_id', table, ['owner_id', 'id'], unique=False)
+        op.create_index(
+            f'ix_{table}_owner_id_created_at', table, ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+        )
+        op.drop_column(table, 'deleted_at')
@@ -1,30 +0,0 @@
-from pydantic_settings import BaseSettings
-from typing import Optional
-
-class Settings(BaseSettings):
-    # API Settings
-    API_V1_STR: str = "/api/v1"
-    PROJECT_NAME: str = "AI CodeHub"
-    
-    # Server Settings
-    HOST: str = "0.0.0.0"
-    PORT: int = 8000
-    
-    # Security
-    SECRET_KEY: str = "your-secret-key-here"  # Change this in production
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-    
-    # Database
-    DATABASE_URL: str = "sqlite:///./ai_codehub.db"
-    
-    # Model Storage
-    MODEL_STORAGE_PATH: str = "models/"
-    
-    # Logging
-    LOG_LEVEL: str = "INFO"
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-
-settings = Settings() 
\ No newline at end of file
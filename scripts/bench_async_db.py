@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Async Database Load Test
+Compares request concurrency when handlers run slow queries through a
+synchronous Session on the event loop (before) and through an AsyncSession
+(after). A lightweight /ping endpoint is polled during the load to show how
+much unrelated requests are delayed.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import httpx
+from fastapi import FastAPI, Depends
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.database.config import to_async_url
+
+def register_slow_query(dbapi_connection, connection_record):
+    """SQL function slow_query(ms) that blocks the executing thread like a slow query would."""
+    dbapi_connection.create_function("slow_query", 1, lambda ms: time.sleep(ms / 1000) or 1)
+
+def build_app(database_url: str, query_ms: int) -> FastAPI:
+    engine = create_engine(database_url, connect_args={"check_same_thread": False}, pool_size=64)
+    event.listen(engine, "connect", register_slow_query)
+    SessionLocal = sessionmaker(bind=engine)
+
+    async_engine = create_async_engine(to_async_url(database_url))
+    event.listen(async_engine.sync_engine, "connect", register_slow_query)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    def get_sync_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+
+    # Same shape as the routers before the change: async def handler, sync Session
+    @app.get("/sync")
+    async def sync_query(db: Session = Depends(get_sync_db)):
+        return {"value": db.execute(text("SELECT slow_query(:ms)"), {"ms": query_ms}).scalar()}
+
+    @app.get("/async")
+    async def async_query(db: AsyncSession = Depends(get_async_db)):
+        result = await db.execute(text("SELECT slow_query(:ms)"), {"ms": query_ms})
+        return {"value": result.scalar()}
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    return app
+
+async def run_scenario(app: FastAPI, path: str, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        ping_latencies = []
+        done = asyncio.Event()
+
+        async def poll_ping():
+            # Timing includes a 10 ms sleep so stalls of the event loop are counted too
+            while not done.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                await client.get("/ping")
+                ping_latencies.append((time.perf_counter() - started) * 1000 - 10)
+
+        poller = asyncio.create_task(poll_ping())
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(client.get(path) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await poller
+
+    assert all(r.status_code == 200 for r in responses)
+    return {
+        "elapsed_s": elapsed,
+        "throughput_rps": concurrency / elapsed,
+        "ping_p50_ms": statistics.median(ping_latencies),
+        "ping_max_ms": max(ping_latencies),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test sync vs async database sessions")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent slow requests")
+    parser.add_argument("--query-ms", type=int, default=100, help="Duration of each slow query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = build_app(f"sqlite:///{Path(tmp) / 'bench.db'}", args.query_ms)
+        print(f"{args.concurrency} concurrent requests, {args.query_ms} ms per query")
+        for label, path in (("before (sync Session)", "/sync"), ("after (AsyncSession)", "/async")):
+            result = asyncio.run(run_scenario(app, path, args.concurrency))
+            print(
+                f"{label:24s} elapsed {result['elapsed_s']:.2f}s  "
+                f"throughput {result['throughput_rps']:.1f} req/s  "
+                f"/ping p50 {result['ping_p50_ms']:.1f} ms  max {result['ping_max_ms']:.1f} ms"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Backfill Benchmark
+Backfills project status on a large table the way the status migration
+used to (one UPDATE statement) and with the batched, resumable helper in
+src/database/backfill.py, while another thread keeps inserting projects.
+Reports the backfill time and the writer's latency, which shows how long
+the backfill held the SQLite write lock at a stretch.
+"""
+
+import sys
+import time
+import argparse
+import statistics
+import tempfile
+import threading
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import insert, text, update
+from sqlalchemy.orm import Session
+
+from src.database import Base, Project, User, create_db_engine
+from src.database.backfill import backfill
+
+def single_statement(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(update(Project).where(text("status IS NULL OR status = ''")).values(status="active"))
+
+def batched(engine, batch_size: int, max_rows_per_second: float = 0) -> None:
+    backfill(
+        engine, "projects_status", "projects", {"status": "active"}, "status IS NULL OR status = ''",
+        batch_size=batch_size, max_rows_per_second=max_rows_per_second,
+    )
+
+def measure(engine, label: str, run) -> None:
+    with engine.begin() as conn:
+        conn.execute(update(Project).values(status=""))
+    # Checkpoint the reset first, so the writer does not pay for it
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    timings = []
+    done = threading.Event()
+
+    def writer() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            with engine.begin() as conn:
+                conn.execute(insert(Project).values(name="written during the backfill", owner_id=1, status="active"))
+            timings.append((time.perf_counter() - started) * 1000)
+            time.sleep(0.001)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    time.sleep(0.05)
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    done.set()
+    thread.join()
+    p99 = statistics.quantiles(timings, n=100, method="inclusive")[98]
+    print(
+        f"{label:20s} backfill {elapsed:6.2f} s  writes {len(timings):5d}  "
+        f"write p50 {statistics.median(timings):7.2f} ms  p99 {p99:8.2f} ms  "
+        f"max {max(timings):8.2f} ms"
+    )
+
+def run(tmp: Path, rows: int, batch_size: int, max_rows_per_second: float) -> None:
+    engine = create_db_engine(f"sqlite:///{tmp / 'backfill.db'}")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add(User(username="bench", hashed_password="x"))
+        db.commit()
+    with engine.begin() as conn:
+        for start in range(0, rows, 10000):
+            conn.execute(insert(Project), [
+                {"name": f"project {i}", "owner_id": 1} for i in range(start, min(start + 10000, rows))
+            ])
+    print(f"seeded {rows} projects")
+    measure(engine, "single statement", lambda: single_statement(engine))
+    measure(engine, f"batches of {batch_size}", lambda: batched(engine, batch_size))
+    measure(engine, f"{max_rows_per_second:.0f} rows/s", lambda: batched(engine, batch_size, max_rows_per_second))
+    engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a single-statement backfill vs batched backfills under writes")
+    parser.add_argument("--rows", type=int, default=500000, help="Projects to backfill")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per batch for the batched backfill")
+    parser.add_argument("--max-rows-per-second", type=float, default=20000, help="Rate limit for the throttled run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run(Path(tmp), args.rows, args.batch_size, args.max_rows_per_second)
+
+if __name__ == "__main__":
+    main()
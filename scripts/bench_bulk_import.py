@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Bulk Import Benchmark
+Imports projects and models through the API one item per request (POST
+/api/v1/projects, POST /api/v1/models/) and through the bulk endpoints
+(POST .../bulk with BULK_MAX_ITEMS items per request).
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.security import create_access_token
+from src.database import Base, Model, Project, User, create_db_engine, get_db
+from src.database.config import to_async_url
+from src.api.routers.model_router import router as model_router
+from src.api.routers.project_router import router as project_router
+
+def build_app(database_url: str):
+    engine = create_db_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add(User(username="bench", email="bench@example.com", hashed_password="x"))
+        db.commit()
+
+    async_engine = create_db_engine(to_async_url(database_url), is_async=True)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def bench_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = bench_db
+    app.include_router(project_router, prefix="/api/v1/projects")
+    app.include_router(model_router, prefix="/api/v1/models")
+    return app, engine, async_engine
+
+def payloads(kind: str, items: int, tag: str) -> list:
+    if kind == "projects":
+        return [{"name": f"{tag}-project-{i}", "description": "imported"} for i in range(items)]
+    return [{"name": f"{tag}-model-{i}", "type": "classification", "version": "1.0"} for i in range(items)]
+
+async def import_items(client: httpx.AsyncClient, kind: str, items: list, bulk: bool) -> float:
+    single_path = "/api/v1/projects" if kind == "projects" else "/api/v1/models/"
+    started = time.perf_counter()
+    if bulk:
+        for offset in range(0, len(items), settings.BULK_MAX_ITEMS):
+            response = await client.post(f"/api/v1/{kind}/bulk", json=items[offset:offset + settings.BULK_MAX_ITEMS])
+            assert response.status_code == 200 and response.json()["failed"] == 0, response.text
+    else:
+        for item in items:
+            response = await client.post(single_path, json=item)
+            assert response.status_code == 200, response.text
+    return time.perf_counter() - started
+
+async def run(database_url: str, items: int) -> None:
+    app, engine, async_engine = build_app(database_url)
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench'})}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers, timeout=600) as client:
+        for kind in ("projects", "models"):
+            for label, bulk in (("one per request", False), (f"bulk of {settings.BULK_MAX_ITEMS}", True)):
+                elapsed = await import_items(client, kind, payloads(kind, items, label.split()[0]), bulk)
+                print(f"{items} {kind:8s} {label:16s} {elapsed:8.2f} s  {items / elapsed:9.0f} items/s")
+    await async_engine.dispose()
+
+    with Session(engine) as db:
+        totals = [db.execute(select(func.count()).select_from(entity)).scalar_one() for entity in (Project, Model)]
+    engine.dispose()
+    assert totals == [2 * items, 2 * items], totals
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark one-at-a-time vs bulk imports")
+    parser.add_argument("--items", type=int, default=10000, help="Items to import per kind and method")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(f"sqlite:///{Path(tmp) / 'bench.db'}", args.items))
+
+if __name__ == "__main__":
+    main()
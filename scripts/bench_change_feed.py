@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Change Feed Benchmark
+A client mirrors one user's projects and models. After a small number of
+edits (updates and deletes), compares refetching both lists page by page
+with following GET /api/v1/changes from the last sync position. Prints the
+time and bytes transferred for each approach as the dataset grows.
+"""
+
+import sys
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.api.listing_cache import listing_cache
+from src.core.config import settings
+from src.core.security import create_access_token
+from src.database import Base, create_db_engine, get_db
+from src.database.config import to_async_url
+from src.api.routers.change_router import router as change_router
+from src.api.routers.model_router import router as model_router
+from src.api.routers.project_router import router as project_router
+
+def seed(engine, rows: int) -> None:
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO users (id, username, email, hashed_password, is_active, is_superuser) "
+            "VALUES (1, 'bench', 'bench@example.com', 'x', 1, 0)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO projects (name, description, status, owner_id) VALUES (?, ?, 'active', 1)",
+            [(f"project {i}", f"description of project {i}") for i in range(rows)],
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO models (name, type, version, status, description, owner_id) VALUES (?, 'CLASSIFICATION', '1.0', 'READY', ?, 1)",
+            [(f"model-{i}", f"description of model {i}") for i in range(rows)],
+        )
+
+def edit(engine, rows: int, changes: int) -> None:
+    rng = random.Random(0)
+    ids = rng.sample(range(1, rows + 1), changes)
+    with engine.begin() as conn:
+        for n, id in enumerate(ids):
+            if n % 4 == 3:
+                conn.exec_driver_sql("DELETE FROM models WHERE id = ?", (id,))
+            else:
+                conn.exec_driver_sql("UPDATE projects SET description = 'edited' WHERE id = ?", (id,))
+
+async def full_refetch(client: httpx.AsyncClient) -> int:
+    transferred = 0
+    for path in ("/api/v1/projects", "/api/v1/models/"):
+        cursor = None
+        while True:
+            params = {"limit": settings.PAGINATION_MAX_LIMIT, **({"cursor": cursor} if cursor else {})}
+            response = await client.get(path, params=params)
+            transferred += len(response.content)
+            cursor = response.json()["next_cursor"]
+            if not cursor:
+                break
+    return transferred
+
+async def delta_sync(client: httpx.AsyncClient, since: int) -> tuple:
+    transferred = 0
+    while True:
+        response = await client.get("/api/v1/changes", params={"since": since, "limit": settings.PAGINATION_MAX_LIMIT})
+        transferred += len(response.content)
+        page = response.json()
+        since = page["next_since"]
+        if not page["has_more"]:
+            return transferred, since
+
+async def run(tmp: Path, sizes: list, changes: int) -> None:
+    # Measure the queries, not the list response cache
+    listing_cache.max_size = 0
+    for rows in sizes:
+        url = f"sqlite:///{tmp / f'changes-{rows}.db'}"
+        engine = create_db_engine(url)
+        Base.metadata.create_all(bind=engine)
+        seed(engine, rows)
+
+        async_engine = create_db_engine(to_async_url(url), is_async=True)
+        AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+        async def bench_db():
+            async with AsyncSessionLocal() as db:
+                yield db
+
+        app = FastAPI()
+        app.dependency_overrides[get_db] = bench_db
+        app.include_router(project_router, prefix="/api/v1/projects")
+        app.include_router(model_router, prefix="/api/v1/models")
+        app.include_router(change_router, prefix="/api/v1/changes")
+
+        transport = httpx.ASGITransport(app=app)
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench'})}"}
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers, timeout=600) as client:
+            # Initial sync brings the client to the current position
+            _, since = await delta_sync(client, 0)
+            edit(engine, rows, changes)
+
+            started = time.perf_counter()
+            full_bytes = await full_refetch(client)
+            full_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            delta_bytes, _ = await delta_sync(client, since)
+            delta_ms = (time.perf_counter() - started) * 1000
+        await async_engine.dispose()
+        engine.dispose()
+        print(
+            f"{rows:7d} projects + {rows:7d} models, {changes} changes  "
+            f"full refetch {full_ms:9.1f} ms {full_bytes / 1024:9.1f} KiB  "
+            f"change feed {delta_ms:7.1f} ms {delta_bytes / 1024:6.1f} KiB"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full list refetch vs the change feed")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Rows per table for one owner")
+    parser.add_argument("--changes", type=int, default=20, help="Edits between two syncs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(Path(tmp), args.sizes, args.changes))
+
+if __name__ == "__main__":
+    main()
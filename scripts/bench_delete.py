@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Delete Benchmark
+Compares the previous delete path (SELECT, session delete, commit) with the
+soft delete used by DELETE /api/v1/projects/{id} (one UPDATE), checks that
+listing a user's projects stays on the partial index after half of them
+are soft-deleted, and measures the background purge with and without its
+rate limit.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.database import Base, Project, User, create_db_engine
+from src.database.config import to_async_url
+from src.database.pagination import keyset_page
+from src.database.soft_delete import purge_deleted, soft_delete
+
+async def hard_delete(db, project_id: int, owner_id: int) -> None:
+    project = (await db.execute(select(Project).filter(Project.id == project_id, Project.owner_id == owner_id))).scalars().first()
+    await db.delete(project)
+    await db.commit()
+
+async def soft(db, project_id: int, owner_id: int) -> None:
+    await soft_delete(db, Project, owner_id, Project.id == project_id)
+    await db.commit()
+
+def p50(timings: list) -> float:
+    return statistics.median(timings) * 1000
+
+async def deletes(session_factory, ids: list, owner_id: int) -> None:
+    half = len(ids) // 2
+    for label, delete, targets in (("select + delete", hard_delete, ids[:half]), ("soft delete", soft, ids[half:])):
+        timings = []
+        for project_id in targets:
+            async with session_factory() as db:
+                started = time.perf_counter()
+                await delete(db, project_id, owner_id)
+                timings.append(time.perf_counter() - started)
+        print(f"{label:16s} p50 {p50(timings):6.2f} ms over {len(targets)} deletes")
+
+async def listing(session_factory, owner_id: int, samples: int) -> None:
+    query = keyset_page(
+        select(Project).filter(Project.owner_id == owner_id, Project.deleted_at.is_(None)), Project, None, 20
+    )
+    async with session_factory() as db:
+        plan = (await db.execute(text("EXPLAIN QUERY PLAN " + str(query.compile(compile_kwargs={"literal_binds": True}))))).all()
+        timings = []
+        for _ in range(samples):
+            started = time.perf_counter()
+            (await db.execute(query)).scalars().all()
+            timings.append(time.perf_counter() - started)
+            db.expunge_all()
+    print(f"first page with half the rows soft-deleted  p50 {p50(timings):6.2f} ms  plan: {plan[0][-1]}")
+
+def purge(engine, owner_id: int, rows: int, rate: float) -> None:
+    with engine.begin() as conn:
+        conn.execute(insert(Project), [{"name": f"doomed {i}", "owner_id": owner_id} for i in range(rows)])
+        conn.execute(text("UPDATE projects SET deleted_at = CURRENT_TIMESTAMP WHERE name LIKE 'doomed %'"))
+    started = time.perf_counter()
+    report = purge_deleted(engine, batch_size=500, max_rows_per_second=rate)
+    elapsed = time.perf_counter() - started
+    label = f"capped at {rate:.0f} rows/s" if rate else "uncapped"
+    print(f"purge {report['projects']} rows {label:22s} {elapsed:6.2f} s  {report['projects'] / elapsed:8.0f} rows/s")
+
+async def run(tmp: Path, rows: int, deleted: int, purged: int) -> None:
+    url = f"sqlite:///{tmp / 'delete.db'}"
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        owner = User(username="bench", hashed_password="x")
+        db.add(owner)
+        db.commit()
+        owner_id = owner.id
+    with engine.begin() as conn:
+        conn.execute(insert(Project), [{"name": f"project {i}", "owner_id": owner_id} for i in range(rows)])
+        ids = conn.execute(select(Project.id).order_by(Project.id)).scalars().all()
+
+    async_engine = create_db_engine(to_async_url(url), is_async=True)
+    session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    await deletes(session_factory, ids[:deleted], owner_id)
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE projects SET deleted_at = CURRENT_TIMESTAMP WHERE id % 2 = 0"))
+    await listing(session_factory, owner_id, 200)
+    await async_engine.dispose()
+
+    for rate in (0, purged / 4):
+        purge(engine, owner_id, purged, rate)
+    engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hard vs soft deletes and the background purge")
+    parser.add_argument("--rows", type=int, default=20000, help="Projects owned by the benchmark user")
+    parser.add_argument("--deletes", type=int, default=1000, help="Single deletes, split between both approaches")
+    parser.add_argument("--purge", type=int, default=20000, help="Soft-deleted rows to purge per run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(Path(tmp), args.rows, args.deletes, args.purge))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Group Commit Benchmark
+Concurrent clients create projects through POST /api/v1/projects with one
+commit per request and with group commit, on the default SQLite profile
+(rollback journal, synchronous=FULL) and on the production profile (WAL,
+synchronous=NORMAL). Prints throughput, latency and the batch sizes.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.security import create_access_token
+from src.database import Base, User, create_db_engine, get_db
+from src.database.config import to_async_url
+from src.database.group_commit import group_commit
+from src.api.routers.project_router import router as project_router
+
+async def run_scenario(database_url: str, clients: int, requests: int, grouped: bool) -> dict:
+    engine = create_db_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add(User(username="bench", email="bench@example.com", hashed_password="x"))
+        db.commit()
+    engine.dispose()
+
+    async_engine = create_db_engine(to_async_url(database_url), is_async=True)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def bench_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = bench_db
+    app.include_router(project_router, prefix="/api/v1/projects")
+    group_commit.session_factory = AsyncSessionLocal
+    group_commit.enabled = grouped
+    group_commit.stats.reset()
+
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench'})}"}
+    latencies = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers, timeout=120) as client:
+        async def worker(worker_id: int) -> None:
+            for i in range(requests // clients):
+                started = time.perf_counter()
+                response = await client.post("/api/v1/projects", json={"name": f"w{worker_id}-{i}"})
+                latencies.append((time.perf_counter() - started) * 1000)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(clients)))
+        elapsed = time.perf_counter() - started
+    await group_commit.close()
+    await async_engine.dispose()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1],
+        "stats": group_commit.stats.snapshot(),
+    }
+
+async def run(tmp: Path, clients: int, requests: int) -> None:
+    profile = settings.SQLITE_PROFILE
+    for sqlite_profile in ("default", "production"):
+        settings.SQLITE_PROFILE = sqlite_profile
+        for label, grouped in (("commit per request", False), ("group commit", True)):
+            result = await run_scenario(f"sqlite:///{tmp / f'{sqlite_profile}-{grouped}.db'}", clients, requests, grouped)
+            line = (
+                f"{sqlite_profile:10s} {label:18s} {result['rps']:7.0f} req/s  "
+                f"p50 {result['p50_ms']:6.1f} ms  p95 {result['p95_ms']:6.1f} ms"
+            )
+            if grouped:
+                stats = result["stats"]
+                histogram = {bucket: count for bucket, count in stats["batch_histogram"].items() if count}
+                line += f"  commits {stats['commits']}  avg batch {stats['avg_batch']:.1f}  {histogram}"
+            print(line)
+    settings.SQLITE_PROFILE = profile
+    group_commit.enabled = settings.GROUP_COMMIT_ENABLED
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-request commits vs group commit")
+    parser.add_argument("--clients", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=3200, help="Total create requests per scenario")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(Path(tmp), args.clients, args.requests))
+
+if __name__ == "__main__":
+    main()
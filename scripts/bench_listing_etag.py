@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Listing ETag Benchmark
+A dashboard polls GET /api/v1/projects and GET /api/v1/models/ (one page of
+200) while nothing changes. Compares plain polling with the response cache
+disabled, polling that hits the per-version response cache, and conditional
+polling with If-None-Match that is answered with 304 Not Modified.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.api.listing_cache import listing_cache
+from src.core.security import create_access_token
+from src.database import Base, create_db_engine, get_db
+from src.database.config import to_async_url
+from src.api.routers.model_router import router as model_router
+from src.api.routers.project_router import router as project_router
+
+PATHS = ("/api/v1/projects?limit=200", "/api/v1/models/?limit=200")
+
+def seed(engine, rows: int) -> None:
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO users (id, username, email, hashed_password, is_active, is_superuser) "
+            "VALUES (1, 'bench', 'bench@example.com', 'x', 1, 0)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO projects (name, description, status, owner_id) VALUES (?, ?, 'active', 1)",
+            [(f"project {i}", f"description of project {i}") for i in range(rows)],
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO models (name, type, version, status, description, owner_id) VALUES (?, 'CLASSIFICATION', '1.0', 'READY', ?, 1)",
+            [(f"model-{i}", f"description of model {i}") for i in range(rows)],
+        )
+
+async def poll(client: httpx.AsyncClient, polls: int, cache_size: int, conditional: bool) -> dict:
+    listing_cache.max_size = cache_size
+    listing_cache.clear()
+    etags = {}
+    latencies, transferred = [], 0
+    for _ in range(polls):
+        for path in PATHS:
+            headers = {"If-None-Match": etags[path]} if conditional and path in etags else {}
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append((time.perf_counter() - started) * 1000)
+            assert response.status_code in (200, 304), response.text
+            etags[path] = response.headers.get("etag")
+            transferred += len(response.content)
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1],
+        "kb_per_poll": transferred / 1024 / len(latencies),
+    }
+
+async def run(tmp: Path, rows: int, polls: int) -> None:
+    url = f"sqlite:///{tmp / 'listing.db'}"
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+    seed(engine, rows)
+    engine.dispose()
+
+    async_engine = create_db_engine(to_async_url(url), is_async=True)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def bench_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = bench_db
+    app.include_router(project_router, prefix="/api/v1/projects")
+    app.include_router(model_router, prefix="/api/v1/models")
+
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench'})}"}
+    scenarios = {
+        "no cache": (0, False),
+        "response cache": (256, False),
+        "if-none-match (304)": (256, True),
+    }
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        # Warm up connections, the user cache and the SQLite page cache
+        await poll(client, 5, 0, False)
+        for label, (cache_size, conditional) in scenarios.items():
+            result = await poll(client, polls, cache_size, conditional)
+            print(
+                f"{label:20s} p50 {result['p50_ms']:7.2f} ms  p95 {result['p95_ms']:7.2f} ms  "
+                f"{result['kb_per_poll']:7.1f} KiB per response"
+            )
+    await async_engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark polling list endpoints with and without ETags")
+    parser.add_argument("--rows", type=int, default=10000, help="Projects and models for the polling user")
+    parser.add_argument("--polls", type=int, default=200, help="Polls of both list endpoints per scenario")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(Path(tmp), args.rows, args.polls))
+
+if __name__ == "__main__":
+    main()
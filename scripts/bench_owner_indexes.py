@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Owner Index Benchmark
+Seeds projects and models (1M rows each by default) on the schema before the
+owner-scoped index migration, measures the router queries, applies the
+migration and measures again. Query plans are printed for both runs.
+"""
+
+import sys
+import time
+import random
+import argparse
+import statistics
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import select, text
+
+from src.core.config import settings
+from src.database import Model, Project, create_db_engine
+
+BASE_REVISION = "2a60c2d52d08"
+INDEX_REVISION = "781e843cee68"
+
+def migrate(database_url: str, revision: str) -> None:
+    # alembic/env.py migrates settings.DATABASE_URL
+    settings.DATABASE_URL = database_url
+    config = Config(str(project_root / "alembic.ini"))
+    config.set_main_option("script_location", str(project_root / "alembic"))
+    command.upgrade(config, revision)
+
+def seed(engine, rows: int, owners: int) -> None:
+    rng = random.Random(0)
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO users (id, username, email, hashed_password, is_active, is_superuser) VALUES (?, ?, ?, 'x', 1, 0)",
+            [(i, f"user{i}", f"user{i}@example.com") for i in range(1, owners + 1)],
+        )
+        for table, extra_columns, extra_values in (
+            ("projects", "description, status", "'bench project', 'active'"),
+            ("models", "type, version, status", "'CLASSIFICATION', '1.0', 'READY'"),
+        ):
+            conn.exec_driver_sql(
+                f"INSERT INTO {table} (name, {extra_columns}, created_at, owner_id) VALUES (?, {extra_values}, ?, ?)",
+                [
+                    (f"{table}-{i}", (start + timedelta(seconds=rng.randrange(365 * 86400))).isoformat(" "), rng.randrange(1, owners + 1))
+                    for i in range(rows)
+                ],
+            )
+
+def router_queries(owner_id: int, project_id: int, model_id: int) -> dict:
+    """The same queries project_router and model_router run."""
+    return {
+        "projects list": select(Project).filter(Project.owner_id == owner_id).order_by(Project.created_at.desc()),
+        "projects list limit 20": select(Project).filter(Project.owner_id == owner_id).order_by(Project.created_at.desc()).limit(20),
+        "project get": select(Project).filter(Project.id == project_id, Project.owner_id == owner_id),
+        "models list": select(Model).filter(Model.owner_id == owner_id).order_by(Model.created_at.desc()),
+        "model get": select(Model).filter(Model.id == model_id, Model.owner_id == owner_id),
+    }
+
+def measure(engine, rows: int, owners: int, samples: int) -> dict:
+    rng = random.Random(1)
+    timings = {}
+    with engine.connect() as conn:
+        for _ in range(samples):
+            queries = router_queries(rng.randrange(1, owners + 1), rng.randrange(1, rows + 1), rng.randrange(1, rows + 1))
+            for label, query in queries.items():
+                started = time.perf_counter()
+                conn.execute(query).fetchall()
+                timings.setdefault(label, []).append((time.perf_counter() - started) * 1000)
+
+        plans = {}
+        for label, query in router_queries(1, 1, 1).items():
+            sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+            plans[label] = [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+    return {label: (statistics.median(values), plans[label]) for label, values in timings.items()}
+
+def report(title: str, results: dict) -> None:
+    print(f"\n{title}")
+    for label, (median_ms, plan) in results.items():
+        print(f"  {label:24s} p50 {median_ms:9.3f} ms  plan: {' / '.join(plan)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark owner-scoped queries before and after the index migration")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows seeded into projects and into models")
+    parser.add_argument("--owners", type=int, default=1000, help="Distinct owners")
+    parser.add_argument("--samples", type=int, default=50, help="Queries per access path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        migrate(database_url, BASE_REVISION)
+        engine = create_db_engine(database_url)
+
+        started = time.perf_counter()
+        seed(engine, args.rows, args.owners)
+        print(f"Seeded {args.rows} projects and {args.rows} models for {args.owners} owners in {time.perf_counter() - started:.1f}s")
+
+        before = measure(engine, args.rows, args.owners, args.samples)
+        report(f"before ({BASE_REVISION})", before)
+
+        started = time.perf_counter()
+        migrate(database_url, INDEX_REVISION)
+        # Drop pooled connections and their statement caches from before the schema change
+        engine.dispose()
+        print(f"\nMigration {INDEX_REVISION} applied in {time.perf_counter() - started:.1f}s")
+
+        after = measure(engine, args.rows, args.owners, args.samples)
+        report(f"after ({INDEX_REVISION})", after)
+
+        print("\nspeedup (p50)")
+        for label in before:
+            print(f"  {label:24s} {before[label][0] / after[label][0]:8.1f}x")
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Password Hashing Benchmark
+Runs a login storm against the handler shape used before the change (bcrypt
+verify inline in the async handler) and against the current /login endpoint
+(bcrypt on the bounded password hashing pool), while polling an unrelated
+/ping endpoint. A final storm against a hasher with a small queue shows the
+503s returned once the pool is saturated.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import httpx
+from fastapi import FastAPI, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.core.password_hasher import PasswordHasherBusy
+from src.core.security import create_access_token, get_password_hash, password_hasher, verify_password
+from src.database import Base, User, create_db_engine, get_db
+from src.database.config import to_async_url
+from src.api.routers.auth import router as auth_router
+
+PASSWORD = "benchmark-password"
+
+def build_app(database_url: str):
+    engine = create_db_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add(User(username="bench", email="bench@example.com", hashed_password=get_password_hash(PASSWORD)))
+        db.commit()
+    engine.dispose()
+
+    async_engine = create_db_engine(to_async_url(database_url), is_async=True)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def bench_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = bench_db
+    app.include_router(auth_router, prefix="/api/v1/auth")
+
+    @app.exception_handler(PasswordHasherBusy)
+    async def busy_handler(request: Request, exc: PasswordHasherBusy):
+        return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": str(exc.retry_after)})
+
+    # Same shape as /login before the change: bcrypt runs on the event loop
+    @app.post("/before/login")
+    async def login_before(request: Request, db: AsyncSession = Depends(bench_db)):
+        data = await request.json()
+        result = await db.execute(select(User).filter(User.username == data["username"]))
+        user = result.scalars().first()
+        if not user or not verify_password(data["password"], user.hashed_password):
+            raise HTTPException(status_code=401)
+        return {"access_token": create_access_token({"sub": user.username}), "token_type": "bearer"}
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    return app, async_engine
+
+async def storm(app: FastAPI, path: str, logins: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        ping_latencies = []
+        done = asyncio.Event()
+
+        async def poll_ping():
+            # Timing includes a 10 ms sleep so stalls of the event loop are counted too
+            while not done.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                await client.get("/ping")
+                ping_latencies.append((time.perf_counter() - started) * 1000 - 10)
+
+        poller = asyncio.create_task(poll_ping())
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(
+            client.post(path, json={"username": "bench", "password": PASSWORD}) for _ in range(logins)
+        ))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await poller
+
+    statuses = [r.status_code for r in responses]
+    return {
+        "ok": statuses.count(200),
+        "rejected": statuses.count(503),
+        "logins_per_s": statuses.count(200) / elapsed,
+        "ping_p50_ms": statistics.median(ping_latencies),
+        "ping_max_ms": max(ping_latencies),
+    }
+
+async def run(database_url: str, logins: int) -> None:
+    app, async_engine = build_app(database_url)
+    print(f"{password_hasher.workers} hashing workers, queue limit {password_hasher.queue_limit}")
+    queue_limit = password_hasher.queue_limit
+    scenarios = (
+        ("before", "/before/login", queue_limit),
+        ("after", "/api/v1/auth/login", queue_limit),
+        ("after, queue 2", "/api/v1/auth/login", 2),
+    )
+    for label, path, limit in scenarios:
+        # Sessions are held while hashing, so the database pool caps concurrency
+        # well below the default queue; a small queue is needed to see 503s
+        password_hasher.queue_limit = limit
+        result = await storm(app, path, logins)
+        print(
+            f"{label:16s} ok {result['ok']:3d}  503 {result['rejected']:3d}  "
+            f"{result['logins_per_s']:6.1f} logins/s  "
+            f"/ping p50 {result['ping_p50_ms']:7.1f} ms  max {result['ping_max_ms']:7.1f} ms"
+        )
+    password_hasher.queue_limit = queue_limit
+    await async_engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark logins with inline vs pooled bcrypt")
+    parser.add_argument("--logins", type=int, default=16, help="Concurrent logins per storm")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(f"sqlite:///{Path(tmp) / 'bench.db'}", args.logins))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Project List Benchmark
+Lists 10k projects through the handler shape used before the change (full
+ORM objects, a hand-built dict and ProjectInDB validation per row, default
+JSON encoding) and through the current get_projects endpoint (column select,
+no per-row validation, orjson).
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+from typing import List
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import httpx
+from fastapi import FastAPI, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.security import get_current_active_user
+from src.database import Base, Project, User, create_db_engine, get_db
+from src.database.config import to_async_url
+from src.database.schemas.project import ProjectInDB
+from src.api.routers.project_router import router as project_router
+
+def seed(database_url: str, rows: int) -> User:
+    engine = create_db_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine, expire_on_commit=False) as db:
+        user = User(username="bench", hashed_password="x", is_active=True)
+        db.add(user)
+        db.flush()
+        db.add_all([
+            Project(name=f"project-{i}", description="benchmark project " * 4, owner_id=user.id)
+            for i in range(rows)
+        ])
+        db.commit()
+    engine.dispose()
+    return user
+
+def build_app(database_url: str, user: User) -> FastAPI:
+    async_engine = create_db_engine(to_async_url(database_url), is_async=True)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def bench_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = bench_db
+    app.dependency_overrides[get_current_active_user] = lambda: user
+
+    # Same shape as get_projects before the change
+    @app.get("/before", response_model=List[ProjectInDB])
+    async def list_before(db: AsyncSession = Depends(bench_db)):
+        result = await db.execute(select(Project).filter(
+            Project.owner_id == user.id
+        ).order_by(Project.created_at.desc()))
+        projects = result.scalars().all()
+
+        result = []
+        for project in projects:
+            project_dict = {
+                "id": project.id,
+                "name": project.name,
+                "description": project.description,
+                "status": project.status,
+                "owner_id": project.owner_id,
+                "created_at": project.created_at,
+                "updated_at": project.updated_at
+            }
+            result.append(ProjectInDB(**project_dict))
+        return result
+
+    app.include_router(project_router, prefix="/after")
+    app.state.async_engine = async_engine
+    return app
+
+async def run(app: FastAPI, rows: int, repeat: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, path, params in (
+            ("before", "/before", {}),
+            ("after", "/after", {"limit": rows}),
+        ):
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                response = await client.get(path, params=params)
+                timings.append((time.perf_counter() - started) * 1000)
+                assert response.status_code == 200, response.text
+            body = response.json()
+            items = body if isinstance(body, list) else body["items"]
+            assert len(items) == rows
+            results[label] = (statistics.median(timings), len(response.content), items[0])
+    await app.state.async_engine.dispose()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark listing projects before and after the fast serialization path")
+    parser.add_argument("--rows", type=int, default=10000, help="Projects listed per request")
+    parser.add_argument("--repeat", type=int, default=10, help="Requests per variant")
+    args = parser.parse_args()
+
+    # One page holds every row so both variants return the same data
+    settings.PAGINATION_MAX_LIMIT = max(settings.PAGINATION_MAX_LIMIT, args.rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        user = seed(database_url, args.rows)
+        results = asyncio.run(run(build_app(database_url, user), args.rows, args.repeat))
+
+    before, after = results["before"], results["after"]
+    assert before[2] == after[2], "responses differ"
+    print(f"{args.rows} projects per request, {args.repeat} requests")
+    for label, (median_ms, size, _) in results.items():
+        print(f"  {label:8s} p50 {median_ms:8.1f} ms  body {size / 1024:8.1f} KiB")
+    print(f"  speedup  {before[0] / after[0]:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Read Replica Benchmark
+Runs concurrent list readers alongside a client that keeps creating
+projects, through the project router and ReplicaRoutingMiddleware, with
+reads served by the primary only and by one or more SQLite copies of it.
+Reports read and write latency, read throughput, and how the reads were
+split between the primary and the replicas.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.api.middleware import ReplicaRoutingMiddleware
+from src.api.routers.project_router import router as project_router
+from src.core.security import create_access_token
+from src.core.user_cache import user_cache
+from src.database import Base, Project, User, create_db_engine
+from src.database.config import to_async_url
+from src.database.pagination import owner_counts
+from src.database.replicas import ReplicaRouter, copy_sqlite_database, replica_session_factory
+
+def percentile(timings: list, n: int) -> float:
+    return statistics.quantiles(timings, n=100)[n - 1] if len(timings) > 1 else timings[0]
+
+async def measure(primary_url: str, replica_urls: list, readers: int, seconds: float) -> None:
+    primary_engine = create_db_engine(to_async_url(primary_url), is_async=True)
+    router = ReplicaRouter(
+        async_sessionmaker(bind=primary_engine, expire_on_commit=False),
+        [replica_session_factory(url, name=f"replica{index}") for index, url in enumerate(replica_urls)],
+    )
+    app = FastAPI()
+    app.add_middleware(ReplicaRoutingMiddleware, router=router)
+    app.include_router(project_router, prefix="/api/v1/projects")
+    user_cache.clear()
+    owner_counts.clear()
+
+    reads, writes = [], []
+    deadline = time.perf_counter() + seconds
+
+    async def client(username: str, timings: list, method: str, path: str, json=None) -> None:
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': username})}"}
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as http:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await http.request(method, path, json=json)
+                response.raise_for_status()
+                timings.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(
+        client("writer", writes, "POST", "/api/v1/projects", {"name": "written during the benchmark"}),
+        *(client(f"reader{number}", reads, "GET", "/api/v1/projects?limit=50") for number in range(readers)),
+    )
+    stats = router.stats()
+    await router.dispose()
+    await primary_engine.dispose()
+    print(
+        f"{len(replica_urls)} replicas  reads {len(reads) / seconds:7.1f}/s  "
+        f"read p50 {statistics.median(reads):6.2f} ms  p95 {percentile(reads, 95):6.2f} ms  "
+        f"write p95 {percentile(writes, 95):6.2f} ms  "
+        f"primary reads {stats['primary_reads']}  replica reads {stats['replica_reads']}"
+    )
+
+async def run(tmp: Path, rows: int, readers: int, seconds: float, replica_counts: list) -> None:
+    primary_url = f"sqlite:///{tmp / 'primary.db'}"
+    engine = create_db_engine(primary_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        users = [User(username=name, hashed_password="x") for name in ["writer", *(f"reader{i}" for i in range(readers))]]
+        db.add_all(users)
+        db.flush()
+        db.execute(insert(Project), [
+            {"name": f"project {i}", "owner_id": users[i % len(users)].id} for i in range(rows)
+        ])
+        db.commit()
+    engine.dispose()
+
+    for count in replica_counts:
+        replica_urls = [f"sqlite:///{tmp / f'replica{index}.db'}" for index in range(count)]
+        for url in replica_urls:
+            copy_sqlite_database(primary_url, url)
+        await measure(primary_url, replica_urls, readers, seconds)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list reads on the primary vs read replicas under writes")
+    parser.add_argument("--rows", type=int, default=20000, help="Seeded projects, spread over the readers and the writer")
+    parser.add_argument("--readers", type=int, default=16, help="Concurrent reading clients")
+    parser.add_argument("--seconds", type=float, default=5, help="Duration of each run")
+    parser.add_argument("--replicas", type=int, nargs="+", default=[0, 1, 2], help="Replica counts to compare")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(Path(tmp), args.rows, args.readers, args.seconds, args.replicas))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Search Benchmark
+For growing catalogs, compares the previous approach (fetch the owner's full
+project and model lists, then filter by substring on the client) with
+GET /api/v1/search backed by the FTS5 tables (first page of 20 results).
+"""
+
+import sys
+import time
+import random
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.database import Base, Model, Project, create_db_engine
+from src.database.config import to_async_url
+from src.database.search import search_catalog
+
+WORDS = [
+    "image", "text", "audio", "vision", "speech", "resnet", "bert", "gpt", "detector", "classifier",
+    "segmentation", "translation", "summary", "embedding", "ranking", "forecast", "tabular", "graph",
+    "diffusion", "tokenizer", "sentiment", "ocr", "tracking", "pose", "depth", "anomaly", "retrieval",
+]
+QUERIES = ["resnet", "image classifier", "speech", "anomaly detector", "emb"]
+
+def phrase(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+def seed(engine, rows: int) -> None:
+    rng = random.Random(0)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO users (id, username, email, hashed_password, is_active, is_superuser) "
+            "VALUES (1, 'bench', 'bench@example.com', 'x', 1, 0)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO projects (name, description, status, owner_id) VALUES (?, ?, 'active', 1)",
+            [(f"{phrase(rng, 2)} {i}", phrase(rng, 8)) for i in range(rows)],
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO models (name, type, version, status, description, owner_id) VALUES (?, 'CLASSIFICATION', ?, 'READY', ?, 1)",
+            [(f"{phrase(rng, 2)}-{i}", f"{rng.randrange(5)}.{rng.randrange(10)}", phrase(rng, 8)) for i in range(rows)],
+        )
+
+async def client_side(db, q: str) -> list:
+    """The previous approach: full lists from the API, filtered in the browser."""
+    projects = (await db.execute(select(Project).filter(Project.owner_id == 1))).scalars().all()
+    models = (await db.execute(select(Model).filter(Model.owner_id == 1))).scalars().all()
+    q = q.lower()
+    return [
+        item for item in [*projects, *models]
+        if q in item.name.lower() or (item.description and q in item.description.lower())
+    ]
+
+async def measure(session_factory, samples: int) -> dict:
+    timings = {"client-side filter": [], "fts search": []}
+    async with session_factory() as db:
+        for _ in range(samples):
+            for q in QUERIES:
+                started = time.perf_counter()
+                await client_side(db, q)
+                timings["client-side filter"].append((time.perf_counter() - started) * 1000)
+                db.expunge_all()
+
+                started = time.perf_counter()
+                await search_catalog(db, 1, q, None, 20)
+                timings["fts search"].append((time.perf_counter() - started) * 1000)
+    return {label: statistics.median(values) for label, values in timings.items()}
+
+async def run(tmp: Path, sizes: list, samples: int) -> None:
+    for rows in sizes:
+        url = f"sqlite:///{tmp / f'search-{rows}.db'}"
+        engine = create_db_engine(url)
+        Base.metadata.create_all(bind=engine)
+        seed(engine, rows)
+        engine.dispose()
+
+        async_engine = create_db_engine(to_async_url(url), is_async=True)
+        results = await measure(async_sessionmaker(bind=async_engine, expire_on_commit=False), samples)
+        await async_engine.dispose()
+        print(
+            f"{rows:7d} projects + {rows:7d} models  "
+            + "  ".join(f"{label} {median_ms:9.2f} ms" for label, median_ms in results.items())
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark client-side filtering vs FTS5 search")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Rows per table for one owner")
+    parser.add_argument("--samples", type=int, default=3, help="Repetitions of the query set per size")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(Path(tmp), args.sizes, args.samples))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+SQLite Profile Benchmark
+Compares mixed read/write throughput of the original engine setup
+(check_same_thread only, SQLite defaults) against the production profile
+(WAL, synchronous=NORMAL, mmap, cache, busy_timeout, temp_store, tuned pool).
+"""
+
+import sys
+import time
+import random
+import argparse
+import statistics
+import tempfile
+import threading
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from src.database.config import apply_sqlite_pragmas, engine_options, sqlite_pragmas
+
+SCHEMA = """
+CREATE TABLE projects (
+    id INTEGER PRIMARY KEY,
+    name VARCHAR NOT NULL,
+    description TEXT,
+    status VARCHAR NOT NULL DEFAULT 'active',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    owner_id INTEGER NOT NULL
+)
+"""
+
+def build_engine(database_url: str, profile: str):
+    if profile == "default":
+        return create_engine(database_url, connect_args={"check_same_thread": False})
+    engine = create_engine(database_url, **engine_options(database_url))
+    apply_sqlite_pragmas(engine, sqlite_pragmas("production"))
+    return engine
+
+def seed(engine, rows: int, owners: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(text(SCHEMA))
+        conn.execute(text("CREATE INDEX ix_projects_owner ON projects (owner_id, created_at)"))
+        conn.execute(
+            text("INSERT INTO projects (name, description, owner_id) VALUES (:name, :description, :owner_id)"),
+            [{"name": f"project-{i}", "description": "x" * 200, "owner_id": i % owners} for i in range(rows)],
+        )
+
+def run_workload(engine, threads: int, duration: float, write_ratio: float, owners: int) -> dict:
+    latencies = {"read": [], "write": []}
+    errors = []
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def worker(seed_value: int) -> None:
+        rng = random.Random(seed_value)
+        local = {"read": [], "write": []}
+        while time.perf_counter() < stop_at:
+            kind = "write" if rng.random() < write_ratio else "read"
+            owner_id = rng.randrange(owners)
+            started = time.perf_counter()
+            try:
+                if kind == "read":
+                    with engine.connect() as conn:
+                        conn.execute(
+                            text("SELECT * FROM projects WHERE owner_id = :owner_id ORDER BY created_at DESC LIMIT 20"),
+                            {"owner_id": owner_id},
+                        ).fetchall()
+                else:
+                    with engine.begin() as conn:
+                        conn.execute(
+                            text("INSERT INTO projects (name, description, owner_id) VALUES ('bench', 'x', :owner_id)"),
+                            {"owner_id": owner_id},
+                        )
+            except OperationalError as e:
+                with lock:
+                    errors.append(str(e.orig))
+                continue
+            local[kind].append((time.perf_counter() - started) * 1000)
+        with lock:
+            for key in local:
+                latencies[key].extend(local[key])
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+    def p95(values):
+        return statistics.quantiles(values, n=20)[-1] if len(values) >= 20 else max(values, default=0.0)
+
+    return {
+        "ops_per_s": (len(latencies["read"]) + len(latencies["write"])) / duration,
+        "reads": len(latencies["read"]),
+        "writes": len(latencies["write"]),
+        "read_p95_ms": p95(latencies["read"]),
+        "write_p95_ms": p95(latencies["write"]),
+        "errors": len(errors),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SQLite default setup vs production profile")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent worker threads")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per run")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="Fraction of operations that write")
+    parser.add_argument("--rows", type=int, default=50000, help="Rows seeded before each run")
+    parser.add_argument("--owners", type=int, default=500, help="Distinct owner ids")
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads, {args.duration:.0f}s, {args.write_ratio:.0%} writes, {args.rows} seeded rows")
+    for profile in ("default", "production"):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = build_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", profile)
+            seed(engine, args.rows, args.owners)
+            result = run_workload(engine, args.threads, args.duration, args.write_ratio, args.owners)
+            engine.dispose()
+        print(
+            f"{profile:10s} {result['ops_per_s']:8.0f} ops/s  "
+            f"reads {result['reads']:6d} (p95 {result['read_p95_ms']:.2f} ms)  "
+            f"writes {result['writes']:6d} (p95 {result['write_p95_ms']:.2f} ms)  "
+            f"errors {result['errors']}"
+        )
+
+if __name__ == "__main__":
+    main()
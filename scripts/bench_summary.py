@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Dashboard Summary Benchmark
+On a seeded database, compares three ways to get one user's project counts
+by status and model counts by type and status: fetching every row and
+counting in Python (the previous approach), GROUP BY queries on the fly,
+and the maintained owner_aggregates table behind GET /api/v1/summary.
+Also reports the cost the aggregate triggers add to bulk inserts.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.database import Base, Model, Project, create_db_engine
+from src.database.aggregates import AGGREGATES, aggregate_triggers_ddl, owner_summary
+from src.database.config import to_async_url
+from src.database.seeding import seed_database
+
+async def fetch_and_count(db, owner_id: int) -> dict:
+    projects = (await db.execute(select(Project).filter(Project.owner_id == owner_id))).scalars().all()
+    models = (await db.execute(select(Model).filter(Model.owner_id == owner_id))).scalars().all()
+    return {
+        "projects": Counter(project.status for project in projects),
+        "model_types": Counter(model.type for model in models),
+        "model_statuses": Counter(model.status for model in models),
+    }
+
+async def group_by(db, owner_id: int) -> dict:
+    result = {}
+    for label, entity, column in (
+        ("projects", Project, Project.status), ("model_types", Model, Model.type), ("model_statuses", Model, Model.status),
+    ):
+        rows = await db.execute(select(column, func.count()).where(entity.owner_id == owner_id).group_by(column))
+        result[label] = dict(rows.all())
+    return result
+
+async def measure(session_factory, owners: dict, samples: int) -> None:
+    approaches = {"fetch and count": fetch_and_count, "group by": group_by, "aggregate table": owner_summary}
+    async with session_factory() as db:
+        for label, owner_id in owners.items():
+            line = f"{label:28s}"
+            for name, approach in approaches.items():
+                timings = []
+                for _ in range(samples):
+                    started = time.perf_counter()
+                    await approach(db, owner_id)
+                    timings.append((time.perf_counter() - started) * 1000)
+                    db.expunge_all()
+                line += f"  {name} {statistics.median(timings):8.2f} ms"
+            print(line)
+
+def write_overhead(engine, rows: int) -> None:
+    values = [{"name": f"bench {i}", "status": "active", "owner_id": 1} for i in range(rows)]
+    timings = {}
+    for label in ("with aggregate triggers", "without aggregate triggers"):
+        started = time.perf_counter()
+        with engine.begin() as conn:
+            conn.execute(insert(Project), values)
+        timings[label] = (time.perf_counter() - started) * 1000
+        with engine.begin() as conn:
+            for table in AGGREGATES:
+                for suffix in ("ai", "ad", "au"):
+                    conn.execute(text(f"DROP TRIGGER IF EXISTS {table}_aggregates_{suffix}"))
+    with engine.begin() as conn:
+        for table, fields in AGGREGATES.items():
+            for statement in aggregate_triggers_ddl(table, fields):
+                conn.execute(text(statement))
+    print(
+        f"bulk insert of {rows} projects  "
+        + "  ".join(f"{label} {ms:8.1f} ms" for label, ms in timings.items())
+    )
+
+async def run(tmp: Path, users: int, samples: int) -> None:
+    url = f"sqlite:///{tmp / 'summary.db'}"
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+    report = seed_database(engine, users=users, projects_per_user=50, models_per_user=25)
+    print(f"seeded {report['users']} users, {report['projects']} projects, {report['models']} models")
+    with engine.connect() as conn:
+        counts = conn.execute(
+            select(Project.owner_id, func.count()).group_by(Project.owner_id).order_by(func.count())
+        ).all()
+    owners = {
+        f"median user ({counts[len(counts) // 2][1]} projects)": counts[len(counts) // 2][0],
+        f"largest user ({counts[-1][1]} projects)": counts[-1][0],
+    }
+
+    async_engine = create_db_engine(to_async_url(url), is_async=True)
+    await measure(async_sessionmaker(bind=async_engine, expire_on_commit=False), owners, samples)
+    await async_engine.dispose()
+    write_overhead(engine, 10000)
+    engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard counts: full fetch vs GROUP BY vs aggregate table")
+    parser.add_argument("--users", type=int, default=2000, help="Seeded users (50 projects and 25 models on average)")
+    parser.add_argument("--samples", type=int, default=20, help="Repetitions per approach")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(Path(tmp), args.users, args.samples))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Project Update Benchmark
+Compares the previous update path (SELECT, setattr per field, commit,
+refresh) with the conditional UPDATE ... RETURNING used by PUT
+/api/v1/projects/{id}: latency and statements per update, and how many
+edits are lost when concurrent clients read-modify-write the same row
+with and without an If-Match version check.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.database import Base, Project, User, create_db_engine
+from src.database.concurrency import VersionConflict, update_row
+from src.database.config import to_async_url
+
+async def read_modify_write(db, project_id: int, owner_id: int, values: dict) -> Project:
+    project = (await db.execute(select(Project).filter(Project.id == project_id, Project.owner_id == owner_id))).scalars().first()
+    for field, value in values.items():
+        setattr(project, field, value)
+    await db.commit()
+    await db.refresh(project)
+    return project
+
+async def conditional_update(db, project_id: int, owner_id: int, values: dict) -> Project:
+    project = await update_row(db, Project, project_id, owner_id, values)
+    await db.commit()
+    return project
+
+async def sequential(session_factory, statements: list, ids: list, owner_id: int, updates: int) -> None:
+    for label, update in (("read-modify-write", read_modify_write), ("conditional update", conditional_update)):
+        timings = []
+        del statements[:]
+        for i in range(updates):
+            async with session_factory() as db:
+                started = time.perf_counter()
+                await update(db, ids[i % len(ids)], owner_id, {"name": f"{label} {i}", "status": "active"})
+                timings.append((time.perf_counter() - started) * 1000)
+        print(
+            f"{label:20s} p50 {statistics.median(timings):6.2f} ms  "
+            f"p95 {statistics.quantiles(timings, n=20)[18]:6.2f} ms  "
+            f"{len(statements) / updates:.1f} statements per update"
+        )
+
+async def contended(session_factory, project_id: int, owner_id: int, clients: int, edits: int, check: bool) -> None:
+    """Each client appends its own tags to the description; a lost edit is a tag missing at the end"""
+    retries = 0
+
+    async def client(number: int) -> None:
+        nonlocal retries
+        for edit in range(edits):
+            while True:
+                async with session_factory() as db:
+                    current = (await db.execute(
+                        select(Project.description, Project.row_version).where(Project.id == project_id)
+                    )).one()
+                    # Time between reading the row and writing it back, as for a client editing a form
+                    await asyncio.sleep(0.001)
+                    values = {"name": "contended", "description": f"{current.description} {number}.{edit}"}
+                    try:
+                        await update_row(db, Project, project_id, owner_id, values, [current.row_version] if check else None)
+                        await db.commit()
+                        break
+                    except VersionConflict:
+                        await db.rollback()
+                        retries += 1
+
+    async with session_factory() as db:
+        await update_row(db, Project, project_id, owner_id, {"description": ""})
+        await db.commit()
+    started = time.perf_counter()
+    await asyncio.gather(*(client(number) for number in range(clients)))
+    elapsed = time.perf_counter() - started
+    async with session_factory() as db:
+        kept = len((await db.get(Project, project_id)).description.split())
+    label = "with If-Match" if check else "without If-Match"
+    print(
+        f"{label:20s} {clients * edits} edits  {clients * edits - kept} lost  "
+        f"{retries} retried after 409  {elapsed:.2f} s"
+    )
+
+async def run(tmp: Path, updates: int, clients: int, edits: int) -> None:
+    url = f"sqlite:///{tmp / 'update.db'}"
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        owner = User(username="bench", hashed_password="x")
+        db.add(owner)
+        db.flush()
+        projects = [Project(name=f"project {i}", owner_id=owner.id) for i in range(1000)]
+        db.add_all(projects)
+        db.commit()
+        owner_id, ids = owner.id, [project.id for project in projects]
+    engine.dispose()
+
+    async_engine = create_db_engine(to_async_url(url), is_async=True)
+    statements = []
+    event.listen(async_engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    await sequential(session_factory, statements, ids, owner_id, updates)
+    for check in (False, True):
+        await contended(session_factory, ids[0], owner_id, clients, edits, check)
+    await async_engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark read-modify-write vs conditional single-statement updates")
+    parser.add_argument("--updates", type=int, default=2000, help="Sequential updates per approach")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent clients editing one row")
+    parser.add_argument("--edits", type=int, default=20, help="Edits per client")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(Path(tmp), args.updates, args.clients, args.edits))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+User Cache Benchmark
+Measures authenticated request latency (GET /api/v1/auth/me) with the user
+cache in get_current_user disabled and enabled, sequentially and with
+concurrent clients.
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.core.security import create_access_token
+from src.core.user_cache import user_cache
+from src.database import Base, User, create_db_engine, get_db
+from src.database.config import to_async_url
+from src.api.routers.auth import router as auth_router
+
+def build_app(database_url: str):
+    engine = create_db_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add(User(username="bench", email="bench@example.com", hashed_password="x"))
+        db.commit()
+    engine.dispose()
+
+    async_engine = create_db_engine(to_async_url(database_url), is_async=True)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    queries = []
+    event.listen(async_engine.sync_engine, "before_cursor_execute", lambda *args: queries.append(1))
+
+    async def bench_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = bench_db
+    app.include_router(auth_router, prefix="/api/v1/auth")
+    return app, async_engine, queries
+
+async def run_scenario(app: FastAPI, token: str, requests: int, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        latencies = []
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                started = time.perf_counter()
+                response = await client.get("/api/v1/auth/me")
+                latencies.append((time.perf_counter() - started) * 1000)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": statistics.quantiles(latencies, n=20)[-1],
+    }
+
+async def run(database_url: str, requests: int, concurrency: int) -> None:
+    app, async_engine, queries = build_app(database_url)
+    token = create_access_token({"sub": "bench"})
+    ttl = user_cache.ttl
+    for clients in (1, concurrency):
+        for label, cache_ttl in (("cache off", 0), ("cache on", ttl or 30)):
+            user_cache.ttl = cache_ttl
+            user_cache.clear()
+            user_cache.hits = user_cache.misses = 0
+            queries.clear()
+            result = await run_scenario(app, token, requests, clients)
+            print(
+                f"{clients:3d} clients  {label:10s} {result['rps']:8.0f} req/s  "
+                f"p50 {result['p50_ms']:6.2f} ms  p95 {result['p95_ms']:6.2f} ms  "
+                f"queries {len(queries):5d}  hit rate {user_cache.stats()['hit_rate']:.2%}"
+            )
+    user_cache.ttl = ttl
+    await async_engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark authenticated requests with and without the user cache")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent clients in the second run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(f"sqlite:///{Path(tmp) / 'bench.db'}", args.requests, args.concurrency))
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,19 @@
-from sqlalchemy.orm import Session
-from src.core.database import engine, Base
+import sys
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.database import Base, SessionLocal, engine, User
 from src.core.security import get_password_hash
-from src.models.user import User
 
 def init_db():
     # 创建所有表
     Base.metadata.create_all(bind=engine)
     
     # 创建数据库会话
-    db = Session(engine)
+    db = SessionLocal()
     
     try:
         # 检查是否已存在默认管理员用户
@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Load Test Harness
+Drives the full FastAPI app in-process with concurrent clients against a
+seeded database and reports throughput, latency percentiles and database
+queries (from the Server-Timing header) per endpoint. Results are saved as
+JSON so runs can be compared with --compare.
+"""
+
+import os
+import sys
+import time
+import json
+import random
+import asyncio
+import argparse
+import platform
+import subprocess
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+QUERIES = ["resnet", "image classifier", "speech", "anomaly detector", "emb", "pipeline v2"]
+
+# (label, weight): the label is the route and is used as the key in the results
+MIX = [
+    ("GET /api/v1/projects", 15),
+    ("GET /api/v1/projects If-None-Match", 10),
+    ("GET /api/v1/projects?cursor", 5),
+    ("GET /api/v1/models/", 20),
+    ("GET /api/v1/projects/count", 10),
+    ("GET /api/v1/projects/{id}", 10),
+    ("GET /api/v1/search", 10),
+    ("GET /api/v1/changes", 5),
+    ("POST /api/v1/projects", 8),
+    ("PUT /api/v1/projects/{id}", 7),
+]
+
+def percentile(values: list, q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, round(q / 100 * len(values)) - 1))
+    return values[index]
+
+def parse_server_timing(header: str) -> tuple:
+    """Return (queries, db_ms) from 'db;dur=1.23;desc="4 queries"'."""
+    queries, db_ms = 0, 0.0
+    for part in header.split(";"):
+        part = part.strip()
+        if part.startswith("dur="):
+            db_ms = float(part[4:])
+        elif part.startswith("desc="):
+            queries = int(part[5:].strip('"').split()[0])
+    return queries, db_ms
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def load_users(engine, prefix: str, users: int, ids_per_user: int, rng: random.Random) -> list:
+    """Pick active seeded users that own projects, with a sample of their project ids."""
+    from sqlalchemy import func, select
+    from src.database import Project, User
+
+    with engine.connect() as conn:
+        owners = conn.execute(
+            select(User.id, User.username)
+            .join(Project, Project.owner_id == User.id)
+            .where(User.username.like(f"{prefix}%"), User.is_active.is_(True))
+            .group_by(User.id)
+            .having(func.count(Project.id) > 0)
+        ).all()
+        owners = rng.sample(owners, min(users, len(owners)))
+        result = []
+        for owner_id, username in owners:
+            ids = conn.execute(
+                select(Project.id).where(Project.owner_id == owner_id).order_by(Project.id.desc()).limit(ids_per_user)
+            ).scalars().all()
+            result.append({"username": username, "project_ids": list(ids)})
+    return result
+
+async def request(client, label: str, user: dict, rng: random.Random):
+    headers = user["headers"]
+    if label == "GET /api/v1/projects":
+        return await client.get("/api/v1/projects", headers=headers)
+    if label == "GET /api/v1/projects If-None-Match":
+        return await client.get("/api/v1/projects", headers={**headers, "If-None-Match": user.get("etag", "")})
+    if label == "GET /api/v1/projects?cursor":
+        cursor = user.get("cursor")
+        return await client.get("/api/v1/projects", params={"cursor": cursor} if cursor else {}, headers=headers)
+    if label == "GET /api/v1/models/":
+        return await client.get("/api/v1/models/", headers=headers)
+    if label == "GET /api/v1/projects/count":
+        return await client.get("/api/v1/projects/count", headers=headers)
+    if label == "GET /api/v1/projects/{id}":
+        return await client.get(f"/api/v1/projects/{rng.choice(user['project_ids'])}", headers=headers)
+    if label == "GET /api/v1/search":
+        return await client.get("/api/v1/search", params={"q": rng.choice(QUERIES)}, headers=headers)
+    if label == "GET /api/v1/changes":
+        return await client.get("/api/v1/changes", params={"since": user.get("since", 0)}, headers=headers)
+    if label == "POST /api/v1/projects":
+        return await client.post("/api/v1/projects", json={"name": f"load test {rng.randrange(10 ** 6)}"}, headers=headers)
+    if label == "PUT /api/v1/projects/{id}":
+        body = {"name": f"renamed {rng.randrange(10 ** 6)}", "description": "updated by the load test"}
+        return await client.put(f"/api/v1/projects/{rng.choice(user['project_ids'])}", json=body, headers=headers)
+    raise ValueError(label)
+
+async def drive(app, users: list, clients: int, duration: float, warmup: float, seed: int) -> tuple:
+    import httpx
+
+    labels, weights = zip(*MIX)
+    samples = defaultdict(list)
+    errors = defaultdict(lambda: defaultdict(int))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load", timeout=120) as client:
+        async def worker(worker_id: int, until: float, record: bool) -> None:
+            rng = random.Random(seed * 1000 + worker_id)
+            while time.perf_counter() < until:
+                user = rng.choice(users)
+                label = rng.choices(labels, weights)[0]
+                started = time.perf_counter()
+                response = await request(client, label, user, rng)
+                elapsed = (time.perf_counter() - started) * 1000
+                if response.status_code < 400 and label == "GET /api/v1/changes":
+                    user["since"] = response.json()["next_since"]
+                elif response.status_code < 400 and label == "GET /api/v1/projects":
+                    # Later polls revalidate with this ETag and page on from this cursor
+                    user["etag"] = response.headers.get("etag", "")
+                    user["cursor"] = response.json()["next_cursor"]
+                if not record:
+                    continue
+                queries, db_ms = parse_server_timing(response.headers.get("server-timing", ""))
+                samples[label].append((elapsed, queries, db_ms))
+                if response.status_code >= 400:
+                    errors[label][str(response.status_code)] += 1
+
+        if warmup > 0:
+            until = time.perf_counter() + warmup
+            await asyncio.gather(*(worker(i, until, False) for i in range(clients)))
+        started = time.perf_counter()
+        until = started + duration
+        await asyncio.gather(*(worker(i, until, True) for i in range(clients)))
+        elapsed = time.perf_counter() - started
+    return samples, errors, elapsed
+
+def summarize(samples: dict, errors: dict, elapsed: float) -> dict:
+    endpoints = {}
+    for label, _ in MIX:
+        rows = samples.get(label, [])
+        latencies = sorted(row[0] for row in rows)
+        count = len(rows)
+        endpoints[label] = {
+            "requests": count,
+            "errors": sum(errors[label].values()),
+            "error_statuses": dict(errors[label]),
+            "rps": round(count / elapsed, 2),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p90_ms": round(percentile(latencies, 90), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+            "db_queries_avg": round(sum(row[1] for row in rows) / count, 2) if count else 0.0,
+            "db_ms_avg": round(sum(row[2] for row in rows) / count, 2) if count else 0.0,
+        }
+    every = [row for rows in samples.values() for row in rows]
+    latencies = sorted(row[0] for row in every)
+    totals = {
+        "requests": len(latencies),
+        "errors": sum(endpoint["errors"] for endpoint in endpoints.values()),
+        "rps": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "db_queries_avg": round(sum(row[1] for row in every) / len(every), 2) if every else 0.0,
+    }
+    return {"totals": totals, "endpoints": endpoints}
+
+def print_report(result: dict, baseline: dict = None) -> None:
+    print(f"{'endpoint':36s} {'req':>7s} {'err':>5s} {'rps':>8s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'queries':>8s}")
+    rows = list(result["endpoints"].items()) + [("TOTAL", result["totals"])]
+    for label, stats in rows:
+        line = (
+            f"{label:36s} {stats['requests']:7d} {stats['errors']:5d} {stats['rps']:8.1f} "
+            f"{stats['p50_ms']:8.2f} {stats['p95_ms']:8.2f} {stats['p99_ms']:8.2f} "
+            f"{stats['db_queries_avg']:8.2f}"
+        )
+        if baseline:
+            before = baseline["totals"] if label == "TOTAL" else baseline["endpoints"].get(label)
+            if before and before["rps"] and before["p95_ms"]:
+                line += (
+                    f"   rps {(stats['rps'] / before['rps'] - 1) * 100:+6.1f}%"
+                    f"  p95 {(stats['p95_ms'] / before['p95_ms'] - 1) * 100:+6.1f}%"
+                )
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the API in-process against a seeded database")
+    parser.add_argument("--database-url", default="sqlite:///./load_test.db", help="Database used by the app under test (relative to the project root)")
+    parser.add_argument("--seed-users", type=int, default=0, help="Seed this many users first (see seed_data.py)")
+    parser.add_argument("--prefix", default="seed", help="Username prefix of the seeded users")
+    parser.add_argument("--users", type=int, default=200, help="Seeded users the clients act as")
+    parser.add_argument("--clients", type=int, default=20, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=3, help="Unmeasured seconds before the run")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for users and the request mix")
+    parser.add_argument("--output", default=None, help="Result file (default: load_test_results/<timestamp>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier result file to compare against")
+    args = parser.parse_args()
+
+    # The app reads its settings at import time, so point it at the test database first;
+    # it also mounts its static directories relative to the project root
+    os.environ["DATABASE_URL"] = args.database_url
+    os.chdir(project_root)
+    from sqlalchemy import select, func
+    from src.core.config import settings
+    from src.core.security import create_access_token
+    from src.database import Model, Project, User, engine
+    from src.database.seeding import seed_database
+    from src.main import app
+
+    if args.seed_users:
+        print(json.dumps(seed_database(engine, users=args.seed_users, prefix=args.prefix, seed=args.seed)))
+
+    rng = random.Random(args.seed)
+    users = load_users(engine, args.prefix, args.users, 50, rng)
+    if not users:
+        print(f"Error: no seeded users with prefix {args.prefix!r}; run with --seed-users or seed_data.py first", file=sys.stderr)
+        sys.exit(1)
+    for user in users:
+        user["headers"] = {"Authorization": f"Bearer {create_access_token({'sub': user['username']})}"}
+    with engine.connect() as conn:
+        dataset = {
+            entity.__tablename__: conn.execute(select(func.count()).select_from(entity)).scalar_one()
+            for entity in (User, Project, Model)
+        }
+
+    async def run():
+        try:
+            return await drive(app, users, args.clients, args.duration, args.warmup, args.seed)
+        finally:
+            await app.router.shutdown()
+
+    samples, errors, elapsed = asyncio.run(run())
+    result = {
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "config": {
+            "clients": args.clients,
+            "duration": args.duration,
+            "users": len(users),
+            "seed": args.seed,
+            "mix": dict(MIX),
+            "group_commit": settings.GROUP_COMMIT_ENABLED,
+            "listing_cache_size": settings.LISTING_CACHE_SIZE,
+            "user_cache_ttl": settings.USER_CACHE_TTL,
+        },
+        "dataset": dataset,
+        **summarize(samples, errors, elapsed),
+    }
+
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    print_report(result, baseline)
+
+    output = Path(args.output or project_root / "load_test_results" / f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"Results saved to {output}")
+
+if __name__ == "__main__":
+    main()
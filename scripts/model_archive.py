@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Model Archive Script
+Export models from ModelManager storage into a tar archive and import them back.
+"""
+
+import sys
+import argparse
+import json
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.core.config import settings
+from src.models.model_manager import ModelManager
+
+def main():
+    parser = argparse.ArgumentParser(description="Export and import model archives")
+    parser.add_argument("--storage", default=settings.MODEL_SAVE_PATH, help="Model storage directory")
+    parser.add_argument("--workers", type=int, default=4, help="Number of I/O threads")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export models into an archive")
+    export_parser.add_argument("archive", help="Output archive path, or - for stdout")
+    export_parser.add_argument("models", nargs="*", help="Model names (default: all models)")
+    export_parser.add_argument("--compression", choices=["", "gz", "bz2", "xz"], default="",
+                               help="Compression applied to the archive")
+
+    import_parser = subparsers.add_parser("import", help="Import models from an archive")
+    import_parser.add_argument("archive", help="Input archive path, or - for stdin")
+
+    args = parser.parse_args()
+    model_manager = ModelManager(storage_path=args.storage)
+
+    try:
+        if args.command == "export":
+            models = args.models or model_manager.list_models()
+            if args.archive == "-":
+                report = model_manager.export_models(models, sys.stdout.buffer, args.compression, args.workers)
+            else:
+                with open(args.archive, "wb") as f:
+                    report = model_manager.export_models(models, f, args.compression, args.workers)
+        else:
+            if args.archive == "-":
+                report = model_manager.import_models(sys.stdin.buffer, args.workers)
+            else:
+                with open(args.archive, "rb") as f:
+                    report = model_manager.import_models(f, args.workers)
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(report, indent=2), file=sys.stderr)
+    if report.get("failed"):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
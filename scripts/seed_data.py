@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Seed Data Script
+Generate synthetic users, projects and models at production volume with
+bulk inserts. Every seeded user shares one password so the data can also be
+used through the login endpoint.
+"""
+
+import sys
+import argparse
+import json
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.core.config import settings
+from src.core.security import get_password_hash
+from src.database import Base, create_db_engine
+from src.database.seeding import seed_database
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the database with synthetic users, projects and models")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="Database to seed (tables are created if missing)")
+    parser.add_argument("--users", type=int, default=1000, help="Number of users")
+    parser.add_argument("--projects-per-user", type=float, default=20, help="Mean projects per user (log-normal)")
+    parser.add_argument("--models-per-user", type=float, default=10, help="Mean models per user (log-normal)")
+    parser.add_argument("--days", type=int, default=365, help="Spread creation times over this many days")
+    parser.add_argument("--password", default="password123", help="Password of every seeded user")
+    parser.add_argument("--prefix", default="seed", help="Username prefix; must not be in use yet")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (same seed, same data)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per executemany batch")
+    args = parser.parse_args()
+
+    engine = create_db_engine(args.database_url)
+    try:
+        Base.metadata.create_all(bind=engine)
+        report = seed_database(
+            engine,
+            users=args.users,
+            projects_per_user=args.projects_per_user,
+            models_per_user=args.models_per_user,
+            days=args.days,
+            hashed_password=get_password_hash(args.password),
+            prefix=args.prefix,
+            seed=args.seed,
+            batch_size=args.batch_size,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        engine.dispose()
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Storage GC Script
+Find and remove orphaned model directories and stale temporary files.
+Runs as a dry run unless --apply is given.
+"""
+
+import sys
+import argparse
+import json
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.core.config import settings
+from src.database import SessionLocal
+from src.models.storage_gc import collect_garbage, referenced_model_names
+
+def main():
+    parser = argparse.ArgumentParser(description="Garbage-collect orphaned model storage")
+    parser.add_argument("--storage", default=settings.MODEL_SAVE_PATH, help="Model storage directory")
+    parser.add_argument("--apply", action="store_true", help="Delete orphans instead of only reporting them")
+    parser.add_argument("--min-age", type=float, default=3600, help="Ignore items modified within this many seconds")
+    parser.add_argument("--keep-catalog-entries", action="store_true",
+                        help="Keep directories with metadata.json or weights.pt even without a Model row")
+    parser.add_argument("--batch-size", type=int, default=100, help="Items deleted per batch")
+    parser.add_argument("--pause", type=float, default=0.1, help="Seconds to sleep between batches")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        names = referenced_model_names(db)
+    finally:
+        db.close()
+
+    report = collect_garbage(
+        Path(args.storage),
+        names,
+        dry_run=not args.apply,
+        min_age=args.min_age,
+        keep_catalog_entries=args.keep_catalog_entries,
+        batch_size=args.batch_size,
+        pause=args.pause,
+    )
+    print(json.dumps(report, indent=2))
+    if report["errors"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+from collections import OrderedDict
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import threading
+
+from src.core.config import settings
+from src.database.collection_versions import collection_version, versions_supported
+
+CACHE_CONTROL = "private, no-cache"
+
+# (集合, 所有者, 版本号, 查询字符串)
+CacheKey = Tuple[str, int, int, str]
+
+def etag_for(collection: str, owner_id: int, version: int) -> str:
+    return f'"{collection}-{owner_id}-{version}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 是否命中（支持逗号分隔的多个值、弱校验前缀 W/ 和 *）"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+class ListingCache:
+    """按集合版本号缓存已序列化的列表响应，条目数受限（LRU）
+
+    版本号是键的一部分，集合变化后旧条目不会再被命中，只等待淘汰，不需要主动失效。
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: CacheKey, body: bytes) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def record_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "max_size": self.max_size,
+                "entries": len(self._entries),
+                "bytes": sum(len(body) for body in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "not_modified": self.not_modified,
+                "evictions": self.evictions,
+            }
+
+listing_cache = ListingCache(settings.LISTING_CACHE_SIZE)
+
+async def cached_listing(
+    request: Request,
+    db: AsyncSession,
+    entity: Any,
+    owner_id: int,
+    build: Callable[[], Awaitable[bytes]],
+) -> Response:
+    """返回带 ETag 的列表响应
+
+    先读取所有者的集合版本号：If-None-Match 命中时直接返回 304，不查询数据行；否则返回
+    缓存中该版本的响应体，缓存未命中时调用 build 查询并序列化。版本号在查询数据行之前读取，
+    期间发生的写入只会让响应比 ETag 更新，下一次请求时版本号不同，会重新获取。
+    """
+    if not versions_supported(db):
+        return Response(await build(), media_type="application/json")
+
+    collection = entity.__tablename__
+    version = await collection_version(db, entity, owner_id)
+    etag = etag_for(collection, owner_id, version)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        listing_cache.record_not_modified()
+        return Response(status_code=304, headers=headers)
+
+    key = (collection, owner_id, version, request.url.query)
+    body = listing_cache.get(key)
+    if body is None:
+        body = await build()
+        listing_cache.put(key, body)
+    return Response(body, media_type="application/json", headers=headers)
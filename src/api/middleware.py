@@ -0,0 +1,71 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import logging
+
+from src.database.config import routed_session_factory
+from src.database.instrumentation import QueryStats, track_queries
+from src.database.replicas import SAFE_METHODS, ReplicaRouter, client_key
+
+logger = logging.getLogger(__name__)
+
+class QueryStatsMiddleware:
+    """统计每个请求执行的 SQL 语句数量和耗时
+
+    在响应中添加 ``Server-Timing: db;dur=...;desc="N queries"``，同一语句形态在一个请求内
+    执行超过 n_plus_one_threshold 次时记录警告。使用纯 ASGI 实现，路由与中间件在同一
+    上下文中执行，引擎事件可以读取到本请求的统计对象。
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 10):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._warn_repeated(scope, stats)
+
+    def _warn_repeated(self, scope: Scope, stats: QueryStats) -> None:
+        if self.n_plus_one_threshold <= 0:
+            return
+        for shape, count in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "Possible N+1 query: %d executions in %s %s (%d queries, %.1f ms total): %s",
+                count, scope["method"], scope["path"], stats.count, stats.total_ms, shape,
+            )
+
+class ReplicaRoutingMiddleware:
+    """按请求方法选择主库或只读副本，get_db 依赖使用本请求选定的会话工厂
+
+    写请求结束后记录客户端，之后短时间内该客户端的读请求仍使用主库（读己之写）。使用纯
+    ASGI 实现，路由处理函数与中间件在同一上下文中执行，可以读取到设置的会话工厂。
+    """
+
+    def __init__(self, app: ASGIApp, router: ReplicaRouter):
+        self.app = app
+        self.router = router
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = client_key(scope)
+        token = routed_session_factory.set(self.router.route(scope["method"], client))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            routed_session_factory.reset(token)
+            if scope["method"] not in SAFE_METHODS:
+                self.router.mark_write(client)
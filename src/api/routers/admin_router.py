@@ -0,0 +1,138 @@
+from fastapi import APIRouter, Depends
+from typing import Dict, Any, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from src.api.listing_cache import listing_cache
+from src.core.security import get_current_active_superuser, password_hasher
+from src.core.config import settings
+from src.core.user_cache import user_cache
+from src.database import get_db, User, engine, async_engine
+from src.database.pool import pool_status
+from src.database.group_commit import group_commit
+from src.database.replicas import replica_router
+from src.database.aggregates import reconcile_aggregates
+from src.database.soft_delete import purge_deleted
+from src.models.memory_ledger import memory_ledger
+from src.models.inference import inference_runner
+from src.models.model_manager import ModelManager
+from src.models.storage_gc import collect_garbage, referenced_model_names
+
+router = APIRouter()
+
+@router.get("/memory")
+async def get_memory_ledger(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Dict[str, Any]:
+    """获取已加载模型的内存占用"""
+    return memory_ledger.snapshot()
+
+@router.get("/inference")
+async def get_inference_stats(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Dict[str, Any]:
+    """获取推理队列统计（包括过期和取消的请求数）"""
+    return inference_runner.stats()
+
+@router.get("/user-cache")
+async def get_user_cache_stats(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Dict[str, Any]:
+    """获取已认证用户缓存的命中率和条目数"""
+    return user_cache.stats()
+
+@router.get("/listing-cache")
+async def get_listing_cache_stats(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Dict[str, Any]:
+    """获取列表响应缓存的命中率、条目数和 304 响应数"""
+    return listing_cache.stats()
+
+@router.get("/password-hasher")
+async def get_password_hasher_stats(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Dict[str, Any]:
+    """获取密码哈希线程池的排队、完成和拒绝统计"""
+    return password_hasher.stats()
+
+@router.get("/database/pool")
+async def get_database_pool_stats(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Dict[str, Any]:
+    """获取数据库连接池状态以及获取连接的次数、等待时间和超时数"""
+    return {
+        "sync": pool_status(engine),
+        "async": pool_status(async_engine.sync_engine),
+    }
+
+@router.get("/database/group-commit")
+async def get_group_commit_stats(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Dict[str, Any]:
+    """获取组提交的提交吞吐量、批大小直方图和提交耗时"""
+    return {
+        "enabled": group_commit.enabled,
+        "max_batch": group_commit.max_batch,
+        "max_delay_ms": group_commit.max_delay * 1000,
+        **group_commit.stats.snapshot(),
+    }
+
+@router.get("/database/replicas")
+async def get_replica_stats(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Dict[str, Any]:
+    """获取只读副本数量，以及分配到主库和各副本的请求数"""
+    return replica_router.stats()
+
+@router.post("/aggregates/reconcile")
+async def run_aggregate_reconcile(
+    owner_id: Optional[int] = None,
+    dry_run: bool = False,
+    current_user: User = Depends(get_current_active_superuser),
+) -> Dict[str, Any]:
+    """按源表核对统计汇总表并修复偏差（可只核对一个用户，dry_run 时只报告）"""
+    return await run_in_threadpool(
+        reconcile_aggregates,
+        engine,
+        owner_id=owner_id,
+        dry_run=dry_run,
+        batch_size=settings.AGGREGATE_RECONCILE_BATCH_SIZE,
+    )
+
+@router.post("/soft-delete/purge")
+async def run_soft_delete_purge(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Dict[str, Any]:
+    """立即清理已超过保留时间的软删除项目和模型，并删除不再使用的模型存储"""
+    return await run_in_threadpool(
+        purge_deleted,
+        engine,
+        ModelManager(settings.MODEL_SAVE_PATH).delete_model,
+        retention=settings.SOFT_DELETE_RETENTION,
+        batch_size=settings.SOFT_DELETE_PURGE_BATCH_SIZE,
+        max_rows_per_second=settings.SOFT_DELETE_PURGE_MAX_ROWS_PER_SECOND,
+    )
+
+@router.post("/storage/gc")
+async def run_storage_gc(
+    dry_run: bool = True,
+    keep_catalog_entries: bool = False,
+    current_user: User = Depends(get_current_active_superuser),
+    db: AsyncSession = Depends(get_db),
+) -> Dict[str, Any]:
+    """清理模型存储中的孤立目录和临时文件（默认仅预览）
+
+    以 Model 表为准：没有对应行的模型目录都会被清理；keep_catalog_entries 为真时保留有
+    metadata.json 或 weights.pt 的目录。
+    """
+    names = await db.run_sync(referenced_model_names)
+    return await run_in_threadpool(
+        collect_garbage,
+        ModelManager(settings.MODEL_SAVE_PATH).storage_path,
+        names,
+        dry_run=dry_run,
+        min_age=settings.STORAGE_GC_MIN_AGE,
+        keep_catalog_entries=keep_catalog_entries,
+        batch_size=settings.STORAGE_GC_BATCH_SIZE,
+        pause=settings.STORAGE_GC_PAUSE,
+    )
@@ -1,28 +1,26 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from typing import Optional, Any
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from pydantic import BaseModel
 
 from src.core.config import settings
 from src.core.security import (
     create_access_token,
     get_current_active_user,
-    get_password_hash,
-    verify_password,
+    password_hasher,
 )
+from src.core.password_hasher import PasswordHasherBusy
+from src.core.user_cache import user_cache
 from src.database import get_db, User
 from src.database.schemas.user import UserCreate, UserInDB, Token, TokenData
 
 router = APIRouter()
 
-# 密码上下文
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 密码Bearer方案
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
@@ -34,19 +32,12 @@ class UserUpdate(BaseModel):
     email: Optional[str] = None
     current_password: Optional[str] = None
     new_password: Optional[str] = None
+    is_active: Optional[bool] = None
 
 class ClientCredentialsData(BaseModel):
     client_id: str
     client_secret: str
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """验证密码"""
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    """获取密码哈希"""
-    return pwd_context.hash(password)
-
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """创建访问令牌"""
     to_encode = data.copy()
@@ -58,7 +49,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
     """获取当前用户"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -73,7 +64,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         token_data = TokenData(username=username)
     except JWTError:
         raise credentials_exception
-    user = db.query(User).filter(User.username == token_data.username).first()
+    result = await db.execute(select(User).filter(User.username == token_data.username))
+    user = result.scalars().first()
     if user is None:
         raise credentials_exception
     return user
@@ -81,7 +73,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
 @router.post("/login", response_model=Token)
 async def login(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Any:
     """用户登录
     支持两种格式：
@@ -111,8 +103,9 @@ async def login(
             detail="Missing username or password",
         )
 
-    user = db.query(User).filter(User.username == username).first()
-    if not user or not verify_password(password, user.hashed_password):
+    result = await db.execute(select(User).filter(User.username == username))
+    user = result.scalars().first()
+    if not user or not await password_hasher.verify(password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="用户名或密码错误",
@@ -132,13 +125,14 @@ async def login(
 @router.post("/register", response_model=Token)
 async def register_user(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_in: UserCreate,
 ) -> Any:
     """注册新用户"""
     try:
         # 检查用户名是否已存在
-        user = db.query(User).filter(User.username == user_in.username).first()
+        result = await db.execute(select(User).filter(User.username == user_in.username))
+        user = result.scalars().first()
         if user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -147,7 +141,8 @@ async def register_user(
         
         # 检查邮箱是否已存在
         if user_in.email:
-            user = db.query(User).filter(User.email == user_in.email).first()
+            result = await db.execute(select(User).filter(User.email == user_in.email))
+            user = result.scalars().first()
             if user:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -155,7 +150,7 @@ async def register_user(
                 )
         
         # 创建新用户
-        hashed_password = get_password_hash(user_in.password)
+        hashed_password = await password_hasher.hash(user_in.password)
         db_user = User(
             username=user_in.username,
             email=user_in.email,
@@ -164,8 +159,8 @@ async def register_user(
             is_superuser=False
         )
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         
         # 创建访问令牌
         access_token = create_access_token(
@@ -177,8 +172,10 @@ async def register_user(
             "username": db_user.username,
             "is_superuser": db_user.is_superuser,
         }
+    except PasswordHasherBusy:
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -200,12 +197,12 @@ async def get_current_user(current_user: User = Depends(get_current_active_user)
 async def update_user(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Any:
     """更新用户资料"""
     try:
         # 验证当前密码
-        if user_update.current_password and not verify_password(user_update.current_password, current_user.hashed_password):
+        if user_update.current_password and not await password_hasher.verify(user_update.current_password, current_user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="当前密码错误"
@@ -214,10 +211,11 @@ async def update_user(
         # 更新邮箱
         if user_update.email is not None:
             # 检查邮箱是否已被其他用户使用
-            existing_user = db.query(User).filter(
+            result = await db.execute(select(User).filter(
                 User.email == user_update.email,
                 User.id != current_user.id
-            ).first()
+            ))
+            existing_user = result.scalars().first()
             if existing_user:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -227,10 +225,14 @@ async def update_user(
         
         # 更新密码
         if user_update.new_password:
-            current_user.hashed_password = get_password_hash(user_update.new_password)
+            current_user.hashed_password = await password_hasher.hash(user_update.new_password)
+        
+        # 停用账户
+        if user_update.is_active is not None:
+            current_user.is_active = user_update.is_active
         
-        db.commit()
-        db.refresh(current_user)
+        await db.commit()
+        await db.refresh(current_user)
         
         return {
             "id": current_user.id,
@@ -240,12 +242,18 @@ async def update_user(
             "is_superuser": current_user.is_superuser,
             "hashed_password": current_user.hashed_password
         }
+    except PasswordHasherBusy:
+        await db.rollback()
+        raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    finally:
+        # 资料变更后下一次请求重新从数据库读取用户
+        user_cache.invalidate(current_user.username)
 
 @router.post("/logout")
 async def logout():
@@ -255,7 +263,7 @@ async def logout():
 @router.post("/client-credentials", response_model=Token)
 async def get_client_credentials(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Any:
     """获取客户端凭证
     支持两种格式：
@@ -301,7 +309,7 @@ async def get_client_credentials(
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """刷新访问令牌"""
     try:
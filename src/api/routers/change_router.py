@@ -0,0 +1,45 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.security import get_current_active_user
+from src.database import get_db, User
+from src.database.change_feed import change_feed_supported, changes_since
+from src.database.pagination import clamp_limit
+from src.database.schemas.change import Change, ChangePage
+from src.database.schemas.model import ModelInDB
+from src.database.schemas.project import ProjectInDB
+
+router = APIRouter()
+
+SCHEMAS = {"projects": ProjectInDB, "models": ModelInDB}
+
+@router.get("", response_model=ChangePage)
+async def get_changes(
+    since: int = Query(0, ge=0),
+    limit: Optional[int] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """获取当前用户的项目和模型在 since 之后的变更（增量同步）
+
+    since 为 0 时返回全部数据；之后把响应中的 next_since 作为下一次请求的 since，
+    has_more 为 true 时立即继续请求。删除的行以 op 为 delete 的墓碑返回。
+    """
+    if not change_feed_supported(db):
+        raise HTTPException(status_code=501, detail="当前数据库不支持变更日志")
+    changes, next_since, has_more = await changes_since(db, current_user.id, since, clamp_limit(limit))
+    return ChangePage(
+        changes=[
+            Change(
+                seq=change["seq"],
+                collection=change["collection"],
+                id=change["id"],
+                op=change["op"],
+                data=SCHEMAS[change["collection"]].from_orm(change["data"]) if change["data"] is not None else None,
+            )
+            for change in changes
+        ],
+        next_since=next_since,
+        has_more=has_more,
+    )
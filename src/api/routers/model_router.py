@@ -1,30 +1,84 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Body, Header, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
 import json
+import logging
 
-from src.core.security import get_current_active_user
+from src.api.listing_cache import cached_listing
+from src.core.config import settings
+from src.core.security import get_current_active_user, get_current_active_superuser
 from src.database import get_db, Model, User
-from src.database.schemas.model import ModelCreate, ModelUpdate, ModelInDB
+from src.database.concurrency import InvalidIfMatch, VersionConflict, parse_if_match, row_etag
+from src.database.group_commit import group_commit, insert_op, update_op
+from src.database.bulk import bulk_delete, bulk_insert, bulk_result, bulk_update, validate_items
+from src.database.soft_delete import soft_delete
+from src.database.pagination import InvalidCursor, clamp_limit, keyset_page, owner_counts, page_items
+from src.database.schemas.model import ModelCreate, ModelUpdate, ModelBulkUpdate, ModelInDB
+from src.database.schemas.pagination import Count, Page
+from src.database.schemas.bulk import BulkDelete, BulkResult
 from src.database.models.model import ModelType, ModelStatus
 from src.models.model_manager import ModelManager
+from src.models.model_archive import ArchiveError, COMPRESSIONS
+from src.models.tokenizer_registry import batch_tokenizer
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-@router.get("/", response_model=List[ModelInDB])
+async def _list_models(request: Request, db: AsyncSession, owner_id: int, cursor: Optional[str], limit: Optional[int]):
+    """分页列出所有者的模型，响应带 ETag 并按集合版本号缓存"""
+    limit = clamp_limit(limit)
+    try:
+        query = keyset_page(
+            select(Model).filter(Model.owner_id == owner_id, Model.deleted_at.is_(None)), Model, cursor, limit
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="无效的分页游标")
+
+    async def build() -> bytes:
+        result = await db.execute(query)
+        models, next_cursor = page_items(result.scalars().all(), limit)
+        page = Page[ModelInDB](items=[ModelInDB.from_orm(model) for model in models], next_cursor=next_cursor)
+        return page.model_dump_json().encode()
+
+    return await cached_listing(request, db, Model, owner_id, build)
+
+async def _insert_model(db: AsyncSession, model_in: ModelCreate, owner_id: int) -> Model:
+    values = {**model_in.dict(), "owner_id": owner_id, "status": ModelStatus.DRAFT}
+    if group_commit.enabled:
+        # 与并发请求的写操作合并提交，批次提交后返回
+        return await group_commit.submit(insert_op(Model, values))
+    db_model = Model(**values)
+    db.add(db_model)
+    await db.commit()
+    await db.refresh(db_model)
+    return db_model
+
+@router.get("/", response_model=Page[ModelInDB])
 async def get_models(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """获取当前用户的所有模型"""
+    """获取当前用户的模型（按创建时间倒序分页，next_cursor 为空表示没有下一页；集合未变化时 If-None-Match 返回 304）"""
     if not current_user:
         raise HTTPException(status_code=404, detail="用户不存在")
-    models = db.query(Model).filter(Model.owner_id == current_user.id).all()
-    return [ModelInDB.from_orm(model) for model in models]
+    return await _list_models(request, db, current_user.id, cursor, limit)
+
+@router.get("/count", response_model=Count)
+async def count_models(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """获取当前用户的模型总数（按用户缓存，增删模型时失效）"""
+    return Count(total=await owner_counts.count(db, Model, current_user.id))
 
 class ModelMetadata(BaseModel):
     name: str
@@ -41,105 +95,172 @@ class ModelMetadata(BaseModel):
 async def create_model(
     model_in: ModelCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """创建新模型"""
     if not current_user:
         raise HTTPException(status_code=404, detail="用户不存在")
     
-    db_model = Model(
-        **model_in.dict(),
-        owner_id=current_user.id,
-        status=ModelStatus.DRAFT
-    )
-    db.add(db_model)
-    db.commit()
-    db.refresh(db_model)
+    db_model = await _insert_model(db, model_in, current_user.id)
+    owner_counts.invalidate(Model, current_user.id)
     return ModelInDB.from_orm(db_model)
 
 @router.post("/db/create", response_model=ModelInDB)
 async def create_db_model(
     model_in: ModelCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """在数据库中创建新模型"""
     if not current_user:
         raise HTTPException(status_code=404, detail="用户不存在")
     
-    db_model = Model(
-        **model_in.dict(),
-        owner_id=current_user.id,
-        status=ModelStatus.DRAFT
-    )
-    db.add(db_model)
-    db.commit()
-    db.refresh(db_model)
+    db_model = await _insert_model(db, model_in, current_user.id)
+    owner_counts.invalidate(Model, current_user.id)
     return db_model
 
-@router.get("/db/list", response_model=List[ModelInDB])
+@router.post("/bulk", response_model=BulkResult)
+async def bulk_create_models(
+    items: List[Any] = Body(..., max_length=settings.BULK_MAX_ITEMS),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """批量创建模型（一个事务），按条目返回结果；未通过校验的条目不影响其他条目"""
+    valid, results = validate_items(items, ModelCreate)
+    rows = [
+        (index, {**item.model_dump(), "owner_id": current_user.id, "status": ModelStatus.DRAFT})
+        for index, item in valid
+    ]
+    try:
+        results += await bulk_insert(db, Model, rows)
+        await db.commit()
+    except Exception:
+        logger.exception("Bulk create models failed")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="批量创建模型失败")
+    owner_counts.invalidate(Model, current_user.id)
+    return bulk_result(results)
+
+@router.put("/bulk", response_model=BulkResult)
+async def bulk_update_models(
+    items: List[Any] = Body(..., max_length=settings.BULK_MAX_ITEMS),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """批量更新模型（一个事务），不存在的模型返回 404，不影响其他条目"""
+    valid, results = validate_items(items, ModelBulkUpdate)
+    try:
+        results += await bulk_update(db, Model, current_user.id, valid)
+        await db.commit()
+    except Exception:
+        logger.exception("Bulk update models failed")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="批量更新模型失败")
+    return bulk_result(results)
+
+@router.post("/bulk/delete", response_model=BulkResult)
+async def bulk_delete_models(
+    delete_in: BulkDelete,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """批量删除模型（一个事务），不存在的模型返回 404，不影响其他条目"""
+    try:
+        results = await bulk_delete(db, Model, current_user.id, delete_in.ids)
+        await db.commit()
+    except Exception:
+        logger.exception("Bulk delete models failed")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="批量删除模型失败")
+    owner_counts.invalidate(Model, current_user.id)
+    return bulk_result(results)
+
+@router.get("/db/list", response_model=Page[ModelInDB])
 async def get_db_models(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """获取数据库中的模型列表"""
+    """获取数据库中的模型列表（分页）"""
     if not current_user:
         raise HTTPException(status_code=404, detail="用户不存在")
-    return db.query(Model).filter(Model.owner_id == current_user.id).all()
+    return await _list_models(request, db, current_user.id, cursor, limit)
 
 @router.get("/db/{model_id}", response_model=ModelInDB)
 async def get_db_model(
     model_id: int,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """获取数据库中的单个模型"""
+    """获取数据库中的单个模型（ETag 为行版本号，更新时可放入 If-Match）"""
     if not current_user:
         raise HTTPException(status_code=404, detail="用户不存在")
     
-    model = db.query(Model).filter(Model.id == model_id, Model.owner_id == current_user.id).first()
+    result = await db.execute(select(Model).filter(
+        Model.id == model_id, Model.owner_id == current_user.id, Model.deleted_at.is_(None)
+    ))
+    model = result.scalars().first()
     if not model:
         raise HTTPException(status_code=404, detail="模型不存在")
+    response.headers["ETag"] = row_etag(model.row_version)
     return model
 
 @router.put("/db/{model_id}", response_model=ModelInDB)
 async def update_db_model(
     model_id: int,
     model_in: ModelUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """更新数据库中的模型"""
+    """更新数据库中的模型（一条条件 UPDATE ... RETURNING）
+
+    带 If-Match 时只在行版本号一致时更新，否则返回 409 和当前的 ETag；不带时直接更新。
+    """
     if not current_user:
         raise HTTPException(status_code=404, detail="用户不存在")
+    try:
+        expected = parse_if_match(if_match)
+    except InvalidIfMatch as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    model = db.query(Model).filter(Model.id == model_id, Model.owner_id == current_user.id).first()
+    op = update_op(Model, model_id, current_user.id, model_in.dict(exclude_unset=True), expected)
+    try:
+        if group_commit.enabled:
+            model = await group_commit.submit(op)
+        else:
+            model = await op(db)
+            await db.commit()
+    except VersionConflict as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="模型已被修改，请重新获取后再更新",
+            headers={"ETag": row_etag(e.current)}
+        )
     if not model:
         raise HTTPException(status_code=404, detail="模型不存在")
-    
-    for field, value in model_in.dict(exclude_unset=True).items():
-        setattr(model, field, value)
-    
-    db.commit()
-    db.refresh(model)
+    response.headers["ETag"] = row_etag(model.row_version)
     return model
 
-@router.delete("/{model_id}")
+@router.delete("/{model_id:int}")
 async def delete_model(
     model_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """从数据库中删除模型"""
+    """从数据库中删除模型（软删除，行和模型存储由后台任务清理）"""
     if not current_user:
         raise HTTPException(status_code=404, detail="用户不存在")
     
-    model = db.query(Model).filter(Model.id == model_id, Model.owner_id == current_user.id).first()
-    if not model:
+    if not await soft_delete(db, Model, current_user.id, Model.id == model_id):
         raise HTTPException(status_code=404, detail="模型不存在")
-    
-    db.delete(model)
-    db.commit()
+    await db.commit()
+    owner_counts.invalidate(Model, current_user.id)
     return {"message": "模型已删除"}
 
 @router.post("/upload")
@@ -151,11 +272,11 @@ async def upload_model(
     framework: str = Form(...),
     task_type: str = Form(...),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """上传模型文件"""
     try:
-        model_manager = ModelManager()
+        model_manager = ModelManager(settings.MODEL_SAVE_PATH)
         
         # 保存模型文件
         file_path = os.path.join(model_manager.model_dir, file.filename)
@@ -186,14 +307,69 @@ async def upload_model(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+class ModelExportRequest(BaseModel):
+    names: List[str]
+    compression: str = ""
+
+@router.post("/archive/export")
+async def export_model_archive(
+    export_in: ModelExportRequest,
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """导出模型归档（流式 tar，可选压缩）"""
+    if export_in.compression not in COMPRESSIONS:
+        raise HTTPException(status_code=400, detail=f"Unsupported compression: {export_in.compression}")
+    model_manager = ModelManager(settings.MODEL_SAVE_PATH)
+    try:
+        chunks = model_manager.stream_export(export_in.names, export_in.compression)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    suffix = f".tar.{export_in.compression}" if export_in.compression else ".tar"
+    return StreamingResponse(
+        chunks,
+        media_type="application/x-tar",
+        headers={"Content-Disposition": f'attachment; filename="models{suffix}"'},
+    )
+
+@router.post("/archive/import")
+async def import_model_archive(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """导入模型归档，跳过已存在的文件并校验校验和"""
+    model_manager = ModelManager(settings.MODEL_SAVE_PATH)
+    try:
+        report = await run_in_threadpool(model_manager.import_models, file.file)
+    except ArchiveError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return report
+
+class TokenizeRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=settings.BULK_MAX_ITEMS)
+
+@router.post("/tokenizers/{name}/tokenize")
+async def tokenize_texts(
+    name: str,
+    tokenize_in: TokenizeRequest,
+    current_user: User = Depends(get_current_active_user),
+):
+    """用共享的分词器对文本分词：编码结果有进程内缓存，并发请求合批执行，结果按长度桶补齐"""
+    try:
+        batch = await batch_tokenizer.tokenize(name, tokenize_in.texts)
+    except OSError:
+        raise HTTPException(status_code=404, detail="分词器不存在")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {key: tensor.tolist() for key, tensor in batch.items()}
+
 @router.get("/list", response_model=List[ModelMetadata])
 async def list_models(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """获取模型列表"""
     try:
-        model_manager = ModelManager()
+        model_manager = ModelManager(settings.MODEL_SAVE_PATH)
         models = model_manager.list_models()
         return models
     except Exception as e:
@@ -203,11 +379,11 @@ async def list_models(
 async def get_model_metadata(
     model_name: str,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """获取模型元数据"""
     try:
-        model_manager = ModelManager()
+        model_manager = ModelManager(settings.MODEL_SAVE_PATH)
         model = model_manager.get_model_metadata(model_name)
         if not model:
             raise HTTPException(status_code=404, detail="Model not found")
@@ -216,31 +392,34 @@ async def get_model_metadata(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/{model_name}")
-async def delete_model(
+async def delete_model_by_name(
     model_name: str,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """删除模型"""
-    try:
-        model_manager = ModelManager()
-        if not model_manager.delete_model(model_name):
-            raise HTTPException(status_code=404, detail="Model not found")
-        return {"message": "Model deleted successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    """按名称删除当前用户的模型（软删除），没有其他模型使用该名称时后台任务同时删除模型存储"""
+    if not await soft_delete(db, Model, current_user.id, Model.name == model_name):
+        raise HTTPException(status_code=404, detail="Model not found")
+    await db.commit()
+    owner_counts.invalidate(Model, current_user.id)
+    return {"message": "Model deleted successfully"}
 
 @router.get("/{model_id}", response_model=ModelInDB)
 async def get_model(
     model_id: int,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """获取单个模型"""
     if not current_user:
         raise HTTPException(status_code=404, detail="用户不存在")
     
-    model = db.query(Model).filter(Model.id == model_id, Model.owner_id == current_user.id).first()
+    result = await db.execute(select(Model).filter(
+        Model.id == model_id, Model.owner_id == current_user.id, Model.deleted_at.is_(None)
+    ))
+    model = result.scalars().first()
     if not model:
         raise HTTPException(status_code=404, detail="模型不存在")
+    response.headers["ETag"] = row_etag(model.row_version)
     return ModelInDB.from_orm(model) 
\ No newline at end of file
@@ -1,49 +1,66 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict, Any
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Body, Header, Request, Response
+from typing import List, Dict, Any, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import logging
+import orjson
 
+from src.api.listing_cache import cached_listing
+from src.core.config import settings
 from src.core.security import get_current_active_user
 from src.database import get_db, Project, User
-from src.database.schemas.project import ProjectCreate, ProjectUpdate, ProjectInDB
+from src.database.concurrency import InvalidIfMatch, VersionConflict, parse_if_match, row_etag
+from src.database.group_commit import group_commit, insert_op, update_op
+from src.database.bulk import bulk_delete, bulk_insert, bulk_result, bulk_update, validate_items
+from src.database.soft_delete import soft_delete
+from src.database.pagination import InvalidCursor, clamp_limit, keyset_page, owner_counts, page_items
+from src.database.schemas.project import ProjectCreate, ProjectUpdate, ProjectBulkUpdate, ProjectInDB
+from src.database.schemas.pagination import Count, Page
+from src.database.schemas.bulk import BulkDelete, BulkResult
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-@router.get("", response_model=List[ProjectInDB])
+# 列表接口只读取响应需要的列，不构造 ORM 对象
+PROJECT_COLUMNS = (
+    Project.id,
+    Project.name,
+    Project.description,
+    Project.status,
+    Project.owner_id,
+    Project.created_at,
+    Project.updated_at,
+    Project.row_version,
+)
+
+@router.get("", response_model=Page[ProjectInDB])
 async def get_projects(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """获取项目列表"""
+    """获取项目列表（按创建时间倒序分页，next_cursor 为空表示没有下一页）
+
+    各列与 ProjectInDB 的字段一一对应且来自数据库，因此不逐行做 Pydantic 校验，
+    直接用 orjson 序列化。响应带 ETag，项目集合未变化时 If-None-Match 返回 304。
+    """
+    limit = clamp_limit(limit)
+    try:
+        query = keyset_page(select(*PROJECT_COLUMNS), Project, cursor, limit)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="无效的分页游标")
     try:
         if not current_user:
             raise HTTPException(status_code=404, detail="用户不存在")
         
-        projects = db.query(Project).filter(
-            Project.owner_id == current_user.id
-        ).order_by(Project.created_at.desc()).all()
-        
-        result = []
-        for project in projects:
-            try:
-                project_dict = {
-                    "id": project.id,
-                    "name": project.name,
-                    "description": project.description,
-                    "status": project.status,
-                    "owner_id": project.owner_id,
-                    "created_at": project.created_at,
-                    "updated_at": project.updated_at
-                }
-                project_data = ProjectInDB(**project_dict)
-                result.append(project_data)
-            except Exception as validation_error:
-                print(f"Project validation error: {str(validation_error)}")
-                print(f"Project data: {project_dict}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"项目数据验证失败: {str(validation_error)}"
-                )
-        return result
+        async def build() -> bytes:
+            result = await db.execute(query.filter(Project.owner_id == current_user.id, Project.deleted_at.is_(None)))
+            rows, next_cursor = page_items(result.all(), limit)
+            return orjson.dumps({"items": [row._asdict() for row in rows], "next_cursor": next_cursor})
+
+        return await cached_listing(request, db, Project, current_user.id, build)
     except Exception as e:
         print(f"Get projects error: {str(e)}")
         raise HTTPException(
@@ -51,11 +68,19 @@ async def get_projects(
             detail=f"获取项目列表失败: {str(e)}"
         )
 
+@router.get("/count", response_model=Count)
+async def count_projects(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """获取项目总数（按用户缓存，增删项目时失效）"""
+    return Count(total=await owner_counts.count(db, Project, current_user.id))
+
 @router.post("", response_model=ProjectInDB)
 async def create_project(
     project_in: ProjectCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """创建新项目"""
     try:
@@ -63,61 +88,107 @@ async def create_project(
             raise HTTPException(status_code=404, detail="用户不存在")
         
         project_data = project_in.dict()
-        db_project = Project(
-            **project_data,
-            owner_id=current_user.id
-        )
-        db.add(db_project)
-        db.commit()
-        db.refresh(db_project)
+        if group_commit.enabled:
+            # 与并发请求的写操作合并提交，批次提交后返回
+            db_project = await group_commit.submit(insert_op(Project, {**project_data, "owner_id": current_user.id}))
+        else:
+            db_project = Project(
+                **project_data,
+                owner_id=current_user.id
+            )
+            db.add(db_project)
+            await db.commit()
+            await db.refresh(db_project)
+        owner_counts.invalidate(Project, current_user.id)
         
-        project_dict = {
-            "id": db_project.id,
-            "name": db_project.name,
-            "description": db_project.description,
-            "status": db_project.status,
-            "owner_id": db_project.owner_id,
-            "created_at": db_project.created_at,
-            "updated_at": db_project.updated_at
-        }
-        return ProjectInDB(**project_dict)
+        return ProjectInDB.model_validate(db_project)
     except Exception as e:
         print(f"Create project error: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"创建项目失败: {str(e)}"
         )
 
+@router.post("/bulk", response_model=BulkResult)
+async def bulk_create_projects(
+    items: List[Any] = Body(..., max_length=settings.BULK_MAX_ITEMS),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """批量创建项目（一个事务），按条目返回结果；未通过校验的条目不影响其他条目"""
+    valid, results = validate_items(items, ProjectCreate)
+    try:
+        rows = [(index, {**item.model_dump(), "owner_id": current_user.id}) for index, item in valid]
+        results += await bulk_insert(db, Project, rows)
+        await db.commit()
+    except Exception:
+        logger.exception("Bulk create projects failed")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="批量创建项目失败")
+    owner_counts.invalidate(Project, current_user.id)
+    return bulk_result(results)
+
+@router.put("/bulk", response_model=BulkResult)
+async def bulk_update_projects(
+    items: List[Any] = Body(..., max_length=settings.BULK_MAX_ITEMS),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """批量更新项目（一个事务），不存在的项目返回 404，不影响其他条目"""
+    valid, results = validate_items(items, ProjectBulkUpdate)
+    try:
+        results += await bulk_update(db, Project, current_user.id, valid)
+        await db.commit()
+    except Exception:
+        logger.exception("Bulk update projects failed")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="批量更新项目失败")
+    return bulk_result(results)
+
+@router.post("/bulk/delete", response_model=BulkResult)
+async def bulk_delete_projects(
+    delete_in: BulkDelete,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """批量删除项目（一个事务），不存在的项目返回 404，不影响其他条目"""
+    try:
+        results = await bulk_delete(db, Project, current_user.id, delete_in.ids)
+        await db.commit()
+    except Exception:
+        logger.exception("Bulk delete projects failed")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="批量删除项目失败")
+    owner_counts.invalidate(Project, current_user.id)
+    return bulk_result(results)
+
 @router.get("/{project_id}", response_model=ProjectInDB)
 async def get_project(
     project_id: int,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """获取单个项目"""
+    """获取单个项目（ETag 为行版本号，更新时可放入 If-Match）"""
     try:
         if not current_user:
             raise HTTPException(status_code=404, detail="用户不存在")
         
-        project = db.query(Project).filter(
+        result = await db.execute(select(Project).filter(
             Project.id == project_id,
-            Project.owner_id == current_user.id
-        ).first()
+            Project.owner_id == current_user.id,
+            Project.deleted_at.is_(None)
+        ))
+        project = result.scalars().first()
         
         if not project:
             raise HTTPException(status_code=404, detail="项目不存在")
         
-        project_dict = {
-            "id": project.id,
-            "name": project.name,
-            "description": project.description,
-            "status": project.status,
-            "owner_id": project.owner_id,
-            "created_at": project.created_at,
-            "updated_at": project.updated_at
-        }
-        return ProjectInDB(**project_dict)
+        response.headers["ETag"] = row_etag(project.row_version)
+        return ProjectInDB.model_validate(project)
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Get project error: {str(e)}")
         raise HTTPException(
@@ -129,41 +200,47 @@ async def get_project(
 async def update_project(
     project_id: int,
     project_in: ProjectUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """更新项目"""
+    """更新项目（一条条件 UPDATE ... RETURNING）
+
+    带 If-Match 时只在行版本号一致时更新，否则返回 409 和当前的 ETag；不带时直接更新。
+    """
+    try:
+        expected = parse_if_match(if_match)
+    except InvalidIfMatch as e:
+        raise HTTPException(status_code=400, detail=str(e))
     try:
         if not current_user:
             raise HTTPException(status_code=404, detail="用户不存在")
         
-        project = db.query(Project).filter(
-            Project.id == project_id,
-            Project.owner_id == current_user.id
-        ).first()
+        op = update_op(Project, project_id, current_user.id, project_in.dict(exclude_unset=True), expected)
+        if group_commit.enabled:
+            project = await group_commit.submit(op)
+        else:
+            project = await op(db)
+            await db.commit()
         
         if not project:
             raise HTTPException(status_code=404, detail="项目不存在")
         
-        for field, value in project_in.dict(exclude_unset=True).items():
-            setattr(project, field, value)
-        
-        db.commit()
-        db.refresh(project)
-        
-        project_dict = {
-            "id": project.id,
-            "name": project.name,
-            "description": project.description,
-            "status": project.status,
-            "owner_id": project.owner_id,
-            "created_at": project.created_at,
-            "updated_at": project.updated_at
-        }
-        return ProjectInDB(**project_dict)
+        response.headers["ETag"] = row_etag(project.row_version)
+        return ProjectInDB.model_validate(project)
+    except VersionConflict as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="项目已被修改，请重新获取后再更新",
+            headers={"ETag": row_etag(e.current)}
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Update project error: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"更新项目失败: {str(e)}"
@@ -173,23 +250,20 @@ async def update_project(
 async def delete_project(
     project_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """删除项目"""
+    """删除项目（软删除，行由后台任务清理）"""
     try:
         if not current_user:
             raise HTTPException(status_code=404, detail="用户不存在")
         
-        project = db.query(Project).filter(
-            Project.id == project_id,
-            Project.owner_id == current_user.id
-        ).first()
-        
-        if not project:
+        if not await soft_delete(db, Project, current_user.id, Project.id == project_id):
             raise HTTPException(status_code=404, detail="项目不存在")
         
-        db.delete(project)
-        db.commit()
+        await db.commit()
+        owner_counts.invalidate(Project, current_user.id)
         return {"message": "项目已删除"}
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e)) 
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.security import get_current_active_user
+from src.database import get_db, User
+from src.database.pagination import InvalidCursor, clamp_limit
+from src.database.search import search_catalog
+from src.database.schemas.pagination import Page
+from src.database.schemas.search import SearchResult
+
+router = APIRouter()
+
+@router.get("", response_model=Page[SearchResult])
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """全文搜索当前用户的项目和模型（按相关度排序分页，next_cursor 为空表示没有下一页）"""
+    limit = clamp_limit(limit)
+    try:
+        items, next_cursor = await search_catalog(db, current_user.id, q, cursor, limit)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="无效的分页游标")
+    return ORJSONResponse({"items": items, "next_cursor": next_cursor})
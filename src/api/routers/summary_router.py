@@ -0,0 +1,19 @@
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.security import get_current_active_user
+from src.database import get_db, User
+from src.database.aggregates import owner_summary
+from src.database.schemas.summary import Summary
+
+router = APIRouter()
+
+@router.get("", response_model=Summary)
+async def get_summary(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """获取当前用户的项目按状态、模型按类型和状态的数量（读取预先维护的汇总表，不扫描数据行）"""
+    if db.get_bind().dialect.name != "sqlite":
+        raise HTTPException(status_code=501, detail="当前数据库不支持统计汇总")
+    return await owner_summary(db, current_user.id)
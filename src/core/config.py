@@ -22,6 +22,74 @@ class Settings(BaseModel):
     
     # Database settings
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./ai_codehub.db")
+    DATABASE_POOL_SIZE: int = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+    DATABASE_MAX_OVERFLOW: int = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
+    DATABASE_POOL_TIMEOUT: float = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+    DATABASE_POOL_RECYCLE: int = int(os.getenv("DATABASE_POOL_RECYCLE", "3600"))
+    DATABASE_POOL_PRE_PING: bool = os.getenv("DATABASE_POOL_PRE_PING", "true").lower() == "true"
+    DATABASE_STATEMENT_CACHE_SIZE: int = int(os.getenv("DATABASE_STATEMENT_CACHE_SIZE", "500"))
+    
+    # Read replicas (comma-separated URLs, empty disables routing): GET/HEAD requests go to the replicas round-robin,
+    # other requests and reads from clients that wrote within the read-your-writes window go to the primary
+    DATABASE_REPLICA_URLS: List[str] = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+    REPLICA_READ_YOUR_WRITES_SECONDS: float = float(os.getenv("REPLICA_READ_YOUR_WRITES_SECONDS", "5"))
+    
+    # Data migrations: backfills run in batches of primary-key ranges, one transaction each (0 disables the rate limit)
+    MIGRATION_BATCH_SIZE: int = int(os.getenv("MIGRATION_BATCH_SIZE", "1000"))
+    MIGRATION_MAX_ROWS_PER_SECOND: float = float(os.getenv("MIGRATION_MAX_ROWS_PER_SECOND", "0"))
+    
+    # Query instrumentation: Server-Timing header per request, slow query log with query plans (0 disables), N+1 warnings
+    QUERY_INSTRUMENTATION: bool = os.getenv("QUERY_INSTRUMENTATION", "true").lower() == "true"
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "100"))
+    # Debug only: log parameter values of slow queries (they may contain password hashes and emails)
+    SLOW_QUERY_LOG_PARAMETERS: bool = os.getenv("SLOW_QUERY_LOG_PARAMETERS", "false").lower() == "true"
+    N_PLUS_ONE_THRESHOLD: int = int(os.getenv("N_PLUS_ONE_THRESHOLD", "10"))
+    
+    # SQLite profile: "production" applies the pragmas below on every connection, "default" leaves SQLite defaults
+    SQLITE_PROFILE: str = os.getenv("SQLITE_PROFILE", "production")
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE: int = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))  # 负数表示 KiB，即 64 MiB
+    SQLITE_BUSY_TIMEOUT: int = int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000"))
+    SQLITE_TEMP_STORE: str = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+    
+    # Pagination settings (list endpoints page on (created_at, id); counts are cached per owner)
+    PAGINATION_DEFAULT_LIMIT: int = int(os.getenv("PAGINATION_DEFAULT_LIMIT", "50"))
+    PAGINATION_MAX_LIMIT: int = int(os.getenv("PAGINATION_MAX_LIMIT", "200"))
+    COUNT_CACHE_TTL: float = float(os.getenv("COUNT_CACHE_TTL", "60"))
+    
+    # Bulk create/update/delete endpoints: maximum items per request
+    BULK_MAX_ITEMS: int = int(os.getenv("BULK_MAX_ITEMS", "1000"))
+    
+    # Group commit: create/update writes from concurrent requests share one transaction
+    GROUP_COMMIT_ENABLED: bool = os.getenv("GROUP_COMMIT_ENABLED", "false").lower() == "true"
+    GROUP_COMMIT_MAX_BATCH: int = int(os.getenv("GROUP_COMMIT_MAX_BATCH", "100"))
+    GROUP_COMMIT_MAX_DELAY_MS: float = float(os.getenv("GROUP_COMMIT_MAX_DELAY_MS", "2"))
+    
+    # Serialized list responses cached per (owner, collection version, query); 0 disables it
+    LISTING_CACHE_SIZE: int = int(os.getenv("LISTING_CACHE_SIZE", "256"))
+    
+    # Per-user summary counts: periodic reconcile against the source tables (seconds, 0 disables it)
+    AGGREGATE_RECONCILE_INTERVAL: float = float(os.getenv("AGGREGATE_RECONCILE_INTERVAL", "0"))
+    AGGREGATE_RECONCILE_BATCH_SIZE: int = int(os.getenv("AGGREGATE_RECONCILE_BATCH_SIZE", "1000"))
+    
+    # Soft-deleted projects and models: background purge of rows and model storage (seconds, 0 disables it;
+    # off by default, and only one worker per database runs it); rows are kept for SOFT_DELETE_RETENTION
+    # seconds (7 days by default) so deletes can be undone until then, purge speed is capped (0 means no cap)
+    SOFT_DELETE_PURGE_INTERVAL: float = float(os.getenv("SOFT_DELETE_PURGE_INTERVAL", "0"))
+    SOFT_DELETE_RETENTION: float = float(os.getenv("SOFT_DELETE_RETENTION", str(7 * 24 * 3600)))
+    SOFT_DELETE_PURGE_BATCH_SIZE: int = int(os.getenv("SOFT_DELETE_PURGE_BATCH_SIZE", "500"))
+    SOFT_DELETE_PURGE_MAX_ROWS_PER_SECOND: float = float(os.getenv("SOFT_DELETE_PURGE_MAX_ROWS_PER_SECOND", "1000"))
+    
+    # Authenticated user cache (0 disables it)
+    USER_CACHE_TTL: float = float(os.getenv("USER_CACHE_TTL", "30"))
+    USER_CACHE_SIZE: int = int(os.getenv("USER_CACHE_SIZE", "1024"))
+    
+    # Password hashing pool (requests beyond workers + queue limit get 503)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+    PASSWORD_HASH_QUEUE_LIMIT: int = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "32"))
+    PASSWORD_HASH_RETRY_AFTER: int = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "1"))
     
     # CORS settings
     BACKEND_CORS_ORIGINS: List[str] = ["*"]
@@ -33,6 +101,27 @@ class Settings(BaseModel):
     MODEL_SAVE_PATH: str = "models"
     MODEL_CONFIG_PATH: str = "config"
     
+    # Model memory settings (0 disables the limit; policy is evict, queue or reject)
+    MODEL_MEMORY_LIMIT_MB: int = int(os.getenv("MODEL_MEMORY_LIMIT_MB", "0"))
+    MODEL_MEMORY_POLICY: str = os.getenv("MODEL_MEMORY_POLICY", "evict")
+    MODEL_MEMORY_QUEUE_TIMEOUT: float = float(os.getenv("MODEL_MEMORY_QUEUE_TIMEOUT", "30"))
+    MODEL_MEMORY_RETRY_AFTER: int = int(os.getenv("MODEL_MEMORY_RETRY_AFTER", "5"))
+    
+    # Inference settings (0 disables the default deadline)
+    INFERENCE_DEFAULT_TIMEOUT_MS: float = float(os.getenv("INFERENCE_DEFAULT_TIMEOUT_MS", "0"))
+    INFERENCE_MAX_CONCURRENCY: int = int(os.getenv("INFERENCE_MAX_CONCURRENCY", "1"))
+    
+    # Storage GC settings (0 disables the background task)
+    STORAGE_GC_INTERVAL: float = float(os.getenv("STORAGE_GC_INTERVAL", "0"))
+    STORAGE_GC_MIN_AGE: float = float(os.getenv("STORAGE_GC_MIN_AGE", "3600"))
+    STORAGE_GC_BATCH_SIZE: int = int(os.getenv("STORAGE_GC_BATCH_SIZE", "100"))
+    STORAGE_GC_PAUSE: float = float(os.getenv("STORAGE_GC_PAUSE", "0.1"))
+    
+    # Tokenizer settings
+    TOKENIZER_CACHE_SIZE: int = int(os.getenv("TOKENIZER_CACHE_SIZE", "10000"))
+    TOKENIZER_BATCH_SIZE: int = int(os.getenv("TOKENIZER_BATCH_SIZE", "64"))
+    TOKENIZER_BATCH_WAIT_MS: float = float(os.getenv("TOKENIZER_BATCH_WAIT_MS", "2"))
+    
     # Server settings
     HOST: str = "0.0.0.0"
     PORT: int = 8000
@@ -0,0 +1,87 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+import asyncio
+import threading
+import time
+
+class PasswordHasherBusy(Exception):
+    """密码哈希线程池已满"""
+
+    def __init__(self, in_flight: int, limit: int, retry_after: int):
+        self.in_flight = in_flight
+        self.limit = limit
+        self.retry_after = retry_after
+        super().__init__(f"Password hashing is saturated ({in_flight}/{limit} requests in flight)")
+
+class PasswordHasher:
+    """在独立的有界线程池中执行 bcrypt 哈希和校验
+
+    bcrypt 每次调用耗时数百毫秒，在事件循环中直接执行会阻塞同一进程内的所有请求。
+    正在执行和排队的调用总数超过 workers + queue_limit 时直接拒绝，由调用方返回 503。
+    """
+
+    def __init__(self, context: Any, workers: int = 4, queue_limit: int = 32, retry_after: int = 1):
+        self.context = context
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.max_in_flight = 0
+        self._total_wait = 0.0
+        self._total_run = 0.0
+
+    @property
+    def limit(self) -> int:
+        return self.workers + self.queue_limit
+
+    def _release(self, future: Future) -> None:
+        # 完成或在排队时被取消都会回调，保证计数准确
+        with self._lock:
+            self._in_flight -= 1
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._in_flight >= self.limit:
+                self.rejected += 1
+                raise PasswordHasherBusy(self._in_flight, self.limit, self.retry_after)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        submitted = time.perf_counter()
+
+        def timed() -> Any:
+            started = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self.completed += 1
+                    self._total_wait += started - submitted
+                    self._total_run += finished - started
+
+        future = self._executor.submit(timed)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(self.context.verify, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "in_flight": self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self._total_wait * 1000 / self.completed, 3) if self.completed else 0.0,
+                "avg_run_ms": round(self._total_run * 1000 / self.completed, 3) if self.completed else 0.0,
+            }
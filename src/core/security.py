@@ -7,10 +7,21 @@ from fastapi.security import OAuth2PasswordBearer
 
 from src.core.config import settings
 from src.database import get_db, User
-from sqlalchemy.orm import Session
+from src.database.replicas import is_replica
+from src.core.user_cache import user_cache, user_from_snapshot, user_snapshot
+from src.core.password_hasher import PasswordHasher
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # 创建密码上下文，使用 bcrypt 方案
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+# 请求处理中通过 password_hasher 异步执行哈希，避免阻塞事件循环；下面的同步函数供脚本使用
+password_hasher = PasswordHasher(
+    pwd_context,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -34,7 +45,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """获取当前用户"""
     credentials_exception = HTTPException(
@@ -49,9 +60,18 @@ async def get_current_user(
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    user = db.query(User).filter(User.username == username).first()
+    # 命中缓存时不查询数据库，合并进本次请求的会话以便后续修改和提交
+    cached = user_cache.get(username)
+    if cached is not None:
+        return await db.merge(user_from_snapshot(cached), load=False)
+    generation = user_cache.generation
+    result = await db.execute(select(User).filter(User.username == username))
+    user = result.scalars().first()
     if user is None:
         raise credentials_exception
+    # 副本上读到的用户可能落后于主库（如刚停用或修改密码），不写入缓存
+    if not is_replica(db):
+        user_cache.put(username, user_snapshot(user), generation)
     return user
 
 async def get_current_active_user(
@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from typing import Any, Dict, Optional
+import threading
+import time
+
+from src.core.config import settings
+from src.database import User
+
+def user_snapshot(user: User) -> Dict[str, Any]:
+    """复制用户的列值（缓存中不保存绑定会话的 ORM 对象）"""
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+def user_from_snapshot(values: Dict[str, Any]) -> User:
+    """由列值重建游离状态的用户对象，可通过 session.merge(load=False) 无查询地加入会话"""
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+class UserCache:
+    """按令牌主体（用户名）缓存已解析的用户，条目数受限且过期时间较短"""
+
+    def __init__(self, ttl: float = 30, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # 用户名 -> (用户字段, 写入时间)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # 每次失效递增；查询开始后发生过失效的结果不写入缓存
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(self, subject: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry and time.monotonic() - entry[1] < self.ttl:
+                self._entries.move_to_end(subject)
+                self.hits += 1
+                return entry[0]
+            if entry:
+                del self._entries[subject]
+            self.misses += 1
+            return None
+
+    def put(self, subject: str, values: Dict[str, Any], generation: int) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[subject] = (values, time.monotonic())
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, subject: str) -> None:
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+            self._entries.pop(subject, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "ttl": self.ttl,
+                "max_size": self.max_size,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+user_cache = UserCache(settings.USER_CACHE_TTL, settings.USER_CACHE_SIZE)
@@ -1,6 +1,16 @@
-from .config import Base, SessionLocal, engine, get_db
+from .config import Base, SessionLocal, engine, get_db, AsyncSessionLocal, async_engine, get_sync_db, create_db_engine
 from .models.user import User
 from .models.project import Project
 from .models.model import Model
+from .models.collection_version import CollectionVersion
+from .models.change_log import ChangeLogEntry
+from .models.owner_aggregate import OwnerAggregate
+from . import search  # 注册 FTS5 搜索表的创建和删除
+from . import collection_versions  # 注册集合版本号触发器的创建
+from . import change_feed  # 注册变更日志触发器的创建
+from . import aggregates  # 注册统计汇总触发器的创建
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db", "User", "Project", "Model"] 
\ No newline at end of file
+__all__ = [
+    "Base", "SessionLocal", "engine", "get_db", "AsyncSessionLocal", "async_engine", "get_sync_db", "create_db_engine",
+    "User", "Project", "Model", "CollectionVersion", "ChangeLogEntry", "OwnerAggregate",
+] 
\ No newline at end of file
@@ -0,0 +1,178 @@
+from sqlalchemy import DDL, delete, event, func, insert, select, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
+
+from src.database.config import Base
+from src.database.models.model import Model, ModelStatus, ModelType
+from src.database.models.owner_aggregate import OwnerAggregate
+from src.database.models.project import Project
+
+logger = logging.getLogger(__name__)
+
+# 汇总的集合及字段（表名即集合名，对应迁移 c41d8a6e9f20）
+AGGREGATES = {"projects": ("status",), "models": ("type", "status")}
+ENTITIES = {"projects": Project, "models": Model}
+
+# 枚举列在数据库中存储的是成员名，返回给客户端时转换为枚举值
+ENUMS = {("models", "type"): ModelType, ("models", "status"): ModelStatus}
+
+AggregateKey = Tuple[int, str, str, str]
+
+def _bump(table: str, field: str, row: str, delta: int, condition: str = "") -> str:
+    return (
+        f"INSERT INTO owner_aggregates (owner_id, collection, field, value, count) "
+        f"SELECT {row}.owner_id, '{table}', '{field}', {row}.{field}, {delta} "
+        f"WHERE {row}.owner_id IS NOT NULL AND {row}.{field} IS NOT NULL{condition} "
+        f"ON CONFLICT (owner_id, collection, field, value) DO UPDATE SET count = count + excluded.count;"
+    )
+
+def _moved(field: str) -> str:
+    return f"old.owner_id IS NOT new.owner_id OR old.{field} IS NOT new.{field}"
+
+def aggregate_triggers_ddl(table: str, fields: Tuple[str, ...]) -> List[str]:
+    """插入、删除、软删除以及所有者或汇总字段变化时调整计数，与写入在同一事务中提交
+
+    只统计未删除的行：软删除时减去计数，之后清理该行时不再减。
+    """
+    changed = " OR ".join(f"old.{column} IS NOT new.{column}" for column in ("owner_id", "deleted_at", *fields))
+    on_insert = " ".join(_bump(table, field, "new", 1, " AND new.deleted_at IS NULL") for field in fields)
+    on_delete = " ".join(_bump(table, field, "old", -1, " AND old.deleted_at IS NULL") for field in fields)
+    on_update = " ".join(
+        _bump(table, field, "old", -1, f" AND old.deleted_at IS NULL AND (new.deleted_at IS NOT NULL OR {_moved(field)})")
+        + " "
+        + _bump(table, field, "new", 1, f" AND new.deleted_at IS NULL AND (old.deleted_at IS NOT NULL OR {_moved(field)})")
+        for field in fields
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table}_aggregates_ai AFTER INSERT ON {table} BEGIN {on_insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_aggregates_ad AFTER DELETE ON {table} BEGIN {on_delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_aggregates_au AFTER UPDATE OF owner_id, deleted_at, {', '.join(fields)} "
+        f"ON {table} WHEN {changed} BEGIN {on_update} END",
+    ]
+
+for _table, _fields in AGGREGATES.items():
+    for _statement in aggregate_triggers_ddl(_table, _fields):
+        event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+def _display(collection: str, field: str, value: str) -> str:
+    enum = ENUMS.get((collection, field))
+    return enum[value].value if enum is not None and value in enum.__members__ else value
+
+async def owner_summary(db: AsyncSession, owner_id: int) -> Dict[str, Any]:
+    """读取所有者的汇总计数（按主键前缀的一次范围查询），各集合的总数由第一个字段的计数相加得到"""
+    result = await db.execute(
+        select(OwnerAggregate.collection, OwnerAggregate.field, OwnerAggregate.value, OwnerAggregate.count)
+        .where(OwnerAggregate.owner_id == owner_id, OwnerAggregate.count != 0)
+    )
+    summary = {
+        collection: {"total": 0, **{f"by_{field}": {} for field in fields}}
+        for collection, fields in AGGREGATES.items()
+    }
+    for collection, field, value, count in result:
+        if collection not in summary or field not in AGGREGATES[collection]:
+            continue
+        summary[collection][f"by_{field}"][_display(collection, field, value)] = count
+        if field == AGGREGATES[collection][0]:
+            summary[collection]["total"] += count
+    return summary
+
+def _actual_counts(conn, low: int, high: int) -> Dict[AggregateKey, int]:
+    counts: Dict[AggregateKey, int] = {}
+    for collection, fields in AGGREGATES.items():
+        entity = ENTITIES[collection]
+        for field in fields:
+            column = getattr(entity, field)
+            rows = conn.execute(
+                select(entity.owner_id, column, func.count())
+                .where(entity.owner_id.between(low, high), entity.deleted_at.is_(None), column.is_not(None))
+                .group_by(entity.owner_id, column)
+            )
+            for owner_id, value, count in rows:
+                value = value.name if hasattr(value, "name") else value
+                counts[(owner_id, collection, field, value)] = count
+    return counts
+
+def _owner_range(conn) -> Optional[Tuple[int, int]]:
+    bounds = [
+        conn.execute(select(func.min(column), func.max(column))).one()
+        for column in (Project.owner_id, Model.owner_id, OwnerAggregate.owner_id)
+    ]
+    lows = [low for low, _ in bounds if low is not None]
+    highs = [high for _, high in bounds if high is not None]
+    return (min(lows), max(highs)) if lows else None
+
+def reconcile_aggregates(
+    engine: Engine,
+    owner_id: Optional[int] = None,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """按源表中未删除的行重新计数并修复汇总表中的偏差（例如绕过触发器的手工修改）
+
+    按所有者 id 分段处理，每段一个事务：先删除计数为 0 的行，这条写语句使事务取得写锁，
+    之后读取的计数与修复之间不会有其他写入插入。dry_run 时只报告偏差，不做修改。
+    """
+    report: Dict[str, Any] = {"dry_run": dry_run, "checked": 0, "drifted": 0, "owners": 0, "samples": []}
+    with engine.connect() as conn:
+        bounds = (owner_id, owner_id) if owner_id is not None else _owner_range(conn)
+    if bounds is None:
+        return report
+
+    affected = set()
+    for low in range(bounds[0], bounds[1] + 1, batch_size):
+        high = min(low + batch_size - 1, bounds[1])
+        in_range = OwnerAggregate.owner_id.between(low, high)
+        with engine.begin() as conn:
+            if not dry_run:
+                conn.execute(delete(OwnerAggregate).where(in_range, OwnerAggregate.count == 0))
+            actual = _actual_counts(conn, low, high)
+            stored = {
+                (row.owner_id, row.collection, row.field, row.value): row.count
+                for row in conn.execute(select(OwnerAggregate).where(in_range, OwnerAggregate.count != 0))
+            }
+            drift = [
+                (key, stored.get(key, 0), actual.get(key, 0))
+                for key in sorted(stored.keys() | actual.keys())
+                if stored.get(key, 0) != actual.get(key, 0)
+            ]
+            report["checked"] += len(stored.keys() | actual.keys())
+            report["drifted"] += len(drift)
+            for key, before, after in drift:
+                affected.add(key[0])
+                if len(report["samples"]) < 20:
+                    report["samples"].append({
+                        "owner_id": key[0], "collection": key[1], "field": key[2], "value": key[3],
+                        "stored": before, "actual": after,
+                    })
+            if dry_run or not drift:
+                continue
+            # 逐段删除偏差行（每行 4 个参数，避免超过 SQLite 的参数数量上限），再写入实际计数
+            keys = [key for key, _, _ in drift]
+            for start in range(0, len(keys), 1000):
+                conn.execute(delete(OwnerAggregate).where(
+                    tuple_(OwnerAggregate.owner_id, OwnerAggregate.collection, OwnerAggregate.field, OwnerAggregate.value)
+                    .in_(keys[start:start + 1000])
+                ))
+            fresh = [
+                {"owner_id": key[0], "collection": key[1], "field": key[2], "value": key[3], "count": after}
+                for key, _, after in drift if after != 0
+            ]
+            if fresh:
+                conn.execute(insert(OwnerAggregate), fresh)
+    report["owners"] = len(affected)
+    if report["drifted"] and not dry_run:
+        logger.warning(f"Repaired {report['drifted']} drifted aggregate rows for {report['owners']} owners")
+    return report
+
+async def run_periodic_reconcile(engine: Engine, interval: float, batch_size: int = 1000) -> None:
+    """后台任务：每隔 interval 秒核对并修复一次汇总表"""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await loop.run_in_executor(None, lambda: reconcile_aggregates(engine, batch_size=batch_size))
+        except Exception as e:
+            logger.error(f"Aggregate reconcile failed: {str(e)}")
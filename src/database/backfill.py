@@ -0,0 +1,152 @@
+from sqlalchemy import column, func, insert, select, table, text, update
+from sqlalchemy.engine import Connection, Engine
+from typing import Any, Dict, List, Optional
+from alembic import op
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# 记录进行中的回填进度（每个回填一行），迁移中断后重新执行时从记录的主键继续
+BACKFILL_PROGRESS_TABLE = "alembic_backfill_progress"
+
+progress_table = table(
+    BACKFILL_PROGRESS_TABLE,
+    column("name"),
+    column("last_id"),
+    column("updated_rows"),
+    column("updated_at"),
+)
+
+def _save_progress(conn: Connection, name: str, last_id: int, rows: int) -> None:
+    saved = conn.execute(
+        update(progress_table)
+        .where(progress_table.c.name == name)
+        .values(last_id=last_id, updated_rows=rows, updated_at=func.now())
+    )
+    if not saved.rowcount:
+        conn.execute(insert(progress_table).values(name=name, last_id=last_id, updated_rows=rows))
+
+def backfill(
+    engine: Engine,
+    name: str,
+    table_name: str,
+    values: Dict[str, Any],
+    where: str,
+    key: str = "id",
+    batch_size: int = 1000,
+    max_rows_per_second: float = 0,
+    progress_interval: float = 10,
+) -> Dict[str, Any]:
+    """按主键范围分批执行 UPDATE table SET values WHERE where，每批一个短事务
+
+    每批取主键之后的 batch_size 个主键作为范围（走主键索引，主键不连续也不会出现空批），
+    只更新范围内满足 where 的行，批次的进度与更新在同一事务中写入 alembic_backfill_progress；
+    中断后以同一 name 重新执行会从上次提交的主键继续，完成后删除进度记录。
+    max_rows_per_second 大于 0 时在批次之间等待，限制回填速度（SQLite 的锁等待不保证先来先得，
+    批次之间不留间隔时应用的写入可能一直拿不到写锁）；每隔 progress_interval 秒记录一次进度、
+    速度和预计剩余时间。
+
+    在迁移中使用时放在 op.get_context().autocommit_block() 中，先提交迁移连接上的事务
+    （SQLite 上否则这里的连接要等待它的写锁），迁移再次执行时之前的步骤需可以重复执行。
+    """
+    target = table(table_name, column(key), *(column(field) for field in values))
+    pk = target.c[key]
+    condition = text(where)
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {BACKFILL_PROGRESS_TABLE} ("
+            "name VARCHAR PRIMARY KEY, last_id INTEGER NOT NULL, updated_rows INTEGER NOT NULL, "
+            "updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        ))
+        saved = conn.execute(
+            select(progress_table.c.last_id, progress_table.c.updated_rows).where(progress_table.c.name == name)
+        ).first()
+        bounds = conn.execute(select(func.min(pk), func.max(pk))).one()
+    report: Dict[str, Any] = {
+        "rows": saved.updated_rows if saved else 0,
+        "batches": 0,
+        "resumed_from": saved.last_id if saved else None,
+    }
+    if bounds[0] is None:
+        return report
+    last = saved.last_id if saved else bounds[0] - 1
+    if saved:
+        logger.info(f"Resuming backfill {name} after {key} {last} ({saved.updated_rows} rows already updated)")
+
+    started = time.perf_counter()
+    logged = started
+    while last < bounds[1]:
+        batch_started = time.perf_counter()
+        with engine.begin() as conn:
+            # 本批的上界：last 之后的第 batch_size 个主键，不足时到开始时的最大主键
+            high = conn.execute(
+                select(pk).where(pk > last).order_by(pk).offset(batch_size - 1).limit(1)
+            ).scalar()
+            if high is None or high > bounds[1]:
+                high = bounds[1]
+            updated = conn.execute(
+                update(target).where(pk > last, pk <= high, condition).values(**values)
+            ).rowcount
+            report["rows"] += updated
+            _save_progress(conn, name, high, report["rows"])
+        last = high
+        report["batches"] += 1
+
+        now = time.perf_counter()
+        if now - logged >= progress_interval:
+            logged = now
+            done = (last - bounds[0] + 1) / (bounds[1] - bounds[0] + 1)
+            elapsed = now - started
+            logger.info(
+                f"Backfill {name}: {done:.0%} of {key} range, {report['rows']} rows updated, "
+                f"{report['rows'] / elapsed:.0f} rows/s, about {elapsed / done - elapsed:.0f} s left"
+            )
+        if max_rows_per_second > 0:
+            time.sleep(max(0.0, updated / max_rows_per_second - (time.perf_counter() - batch_started)))
+
+    with engine.begin() as conn:
+        conn.execute(progress_table.delete().where(progress_table.c.name == name))
+    report["last_id"] = last
+    logger.info(f"Backfill {name} finished: {report['rows']} rows in {report['batches']} batches")
+    return report
+
+def create_index_online(
+    index_name: str,
+    table_name: str,
+    columns: List[Any],
+    where: Optional[str] = None,
+    unique: bool = False,
+) -> None:
+    """在迁移中建立索引，尽量不阻塞应用的写入
+
+    PostgreSQL 上使用 CREATE INDEX CONCURRENTLY（不能在事务中执行，放在 autocommit 块中），
+    先删除上次中断留下的无效索引。SQLite 不支持并发建索引，建索引期间写入会等待
+    （busy_timeout）；这里在单独的短事务中建立，写锁只在建索引期间持有，不会延续到迁移
+    结束。应在数据回填之后建索引，避免回填时每行都要维护索引。
+    """
+    bind = op.get_bind()
+    predicate = text(where) if where is not None else None
+    with op.get_context().autocommit_block():
+        if bind.dialect.name == "postgresql":
+            invalid = bind.execute(text(
+                "SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid "
+                "WHERE pg_class.relname = :name AND NOT pg_index.indisvalid"
+            ), {"name": index_name}).first()
+            if invalid:
+                op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
+            op.create_index(
+                index_name, table_name, columns, unique=unique, if_not_exists=True,
+                postgresql_concurrently=True, postgresql_where=predicate,
+            )
+        else:
+            op.create_index(index_name, table_name, columns, unique=unique, if_not_exists=True, sqlite_where=predicate)
+
+def drop_index_online(index_name: str, table_name: str) -> None:
+    """create_index_online 的逆操作（PostgreSQL 上使用 DROP INDEX CONCURRENTLY）"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name, table_name=table_name, if_exists=True,
+            postgresql_concurrently=op.get_bind().dialect.name == "postgresql",
+        )
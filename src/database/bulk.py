@@ -0,0 +1,110 @@
+from collections import defaultdict
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Tuple, Type
+
+from src.database.schemas.bulk import BulkItemResult, BulkResult
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'item'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+def validate_items(
+    items: List[Any],
+    schema: Type[BaseModel],
+) -> Tuple[List[Tuple[int, BaseModel]], List[BulkItemResult]]:
+    """逐条校验请求中的条目，返回 (通过校验的 (序号, 对象), 未通过的结果)"""
+    valid, failed = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as e:
+            failed.append(BulkItemResult(index=index, status=422, error=_describe(e)))
+    return valid, failed
+
+def bulk_result(results: List[BulkItemResult]) -> BulkResult:
+    results = sorted(results, key=lambda result: result.index)
+    succeeded = sum(1 for result in results if result.error is None)
+    return BulkResult(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+
+async def bulk_insert(
+    db: AsyncSession,
+    entity: Any,
+    rows: List[Tuple[int, Dict[str, Any]]],
+) -> List[BulkItemResult]:
+    """用一条 INSERT ... RETURNING（按批次展开为多行 VALUES）插入所有行，不构造 ORM 对象"""
+    if not rows:
+        return []
+    result = await db.execute(
+        insert(entity).returning(entity.id, sort_by_parameter_order=True),
+        [values for _, values in rows],
+    )
+    return [BulkItemResult(index=index, status=201, id=id) for (index, _), id in zip(rows, result.scalars().all())]
+
+async def _owned_ids(db: AsyncSession, entity: Any, owner_id: int, ids: List[int]) -> set:
+    result = await db.execute(select(entity.id).where(
+        entity.owner_id == owner_id, entity.id.in_(set(ids)), entity.deleted_at.is_(None)
+    ))
+    return set(result.scalars().all())
+
+async def bulk_update(
+    db: AsyncSession,
+    entity: Any,
+    owner_id: int,
+    items: List[Tuple[int, BaseModel]],
+) -> List[BulkItemResult]:
+    """按主键批量更新所有者的行并把行版本号加 1，不存在或不属于所有者的条目返回 404
+
+    按更新的字段集合分组，每组一条 executemany 的 UPDATE。
+    """
+    owned = await _owned_ids(db, entity, owner_id, [item.id for _, item in items])
+    results, groups = [], defaultdict(list)
+    for index, item in items:
+        if item.id not in owned:
+            results.append(BulkItemResult(index=index, status=404, id=item.id, error="Not found"))
+            continue
+        values = item.model_dump(exclude_unset=True)
+        values["b_id"] = values.pop("id")
+        groups[tuple(sorted(values))].append(values)
+        results.append(BulkItemResult(index=index, status=200, id=item.id))
+    table = entity.__table__
+    for fields, params in groups.items():
+        await db.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_id"), table.c.owner_id == owner_id, table.c.deleted_at.is_(None))
+            .values({
+                **{field: bindparam(field) for field in fields if field != "b_id"},
+                "row_version": table.c.row_version + 1,
+            }),
+            params,
+        )
+    return results
+
+async def bulk_delete(
+    db: AsyncSession,
+    entity: Any,
+    owner_id: int,
+    ids: List[int],
+) -> List[BulkItemResult]:
+    """用一条 UPDATE ... RETURNING 软删除所有者的行（由后台任务清理），不存在或不属于所有者的 id 返回 404"""
+    deleted = set()
+    if ids:
+        result = await db.execute(
+            update(entity)
+            .where(entity.owner_id == owner_id, entity.id.in_(set(ids)), entity.deleted_at.is_(None))
+            .values(deleted_at=func.now(), row_version=entity.row_version + 1)
+            .returning(entity.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = set(result.scalars().all())
+    results, seen = [], set()
+    for index, id in enumerate(ids):
+        if id in deleted and id not in seen:
+            results.append(BulkItemResult(index=index, status=204, id=id))
+        else:
+            results.append(BulkItemResult(index=index, status=404, id=id, error="Not found"))
+        seen.add(id)
+    return results
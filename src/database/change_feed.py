@@ -0,0 +1,96 @@
+from sqlalchemy import DDL, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Tuple
+
+from src.database.config import Base
+from src.database.models.change_log import ChangeLogEntry
+from src.database.models.model import Model
+from src.database.models.project import Project
+
+# 写入变更日志的集合（表名即集合名，对应迁移 9e3f5a17c2b8）
+CHANGE_ENTITIES = {"projects": Project, "models": Model}
+
+def _log(table: str, row: str, op: str, condition: str = "") -> str:
+    return (
+        f"INSERT INTO change_log (owner_id, collection, entity_id, op) "
+        f"SELECT {row}.owner_id, '{table}', {row}.id, '{op}' WHERE {row}.owner_id IS NOT NULL{condition};"
+    )
+
+def change_log_triggers_ddl(table: str) -> List[str]:
+    """行的每次增删改都追加一条变更记录
+
+    更换所有者时，旧所有者收到一条删除记录（该行已不在他的集合中）。触发器在写入所在的
+    事务中执行，批量接口和组提交的写入同样会记录。
+    """
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table}_changes_ai AFTER INSERT ON {table} BEGIN "
+        f"{_log(table, 'new', 'insert')} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_changes_ad AFTER DELETE ON {table} BEGIN "
+        f"{_log(table, 'old', 'delete')} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_changes_au AFTER UPDATE ON {table} BEGIN "
+        f"{_log(table, 'new', 'update')} "
+        f"{_log(table, 'old', 'delete', ' AND old.owner_id IS NOT new.owner_id')} END",
+    ]
+
+for _table in CHANGE_ENTITIES:
+    for _statement in change_log_triggers_ddl(_table):
+        event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+def change_feed_supported(db: AsyncSession) -> bool:
+    """变更日志由 SQLite 触发器写入，其他数据库上没有触发器，变更日志不可用"""
+    return db.get_bind().dialect.name == "sqlite"
+
+async def changes_since(
+    db: AsyncSession,
+    owner_id: int,
+    since: int,
+    limit: int,
+) -> Tuple[List[Dict[str, Any]], int, bool]:
+    """获取所有者在 since 之后的变更，返回 (变更列表, 下一次的 since, 是否还有更多)
+
+    每页按 seq 顺序读取 since 之后的 limit 条变更记录（走 (owner_id, seq) 索引），同一行在
+    本页内的多次变更只返回最后一次：删除返回墓碑（data 为 None），否则返回该行的当前内容
+    （op 为 upsert）。以本页最后一条记录的 seq 作为下一页的 since，翻页期间发生的新变更
+    不会遗漏；同一行可能在之后的页中再次出现，按顺序应用即可。每页的读取量与 limit 成正比，
+    与数据总量无关。
+    """
+    result = await db.execute(
+        select(ChangeLogEntry.seq, ChangeLogEntry.collection, ChangeLogEntry.entity_id, ChangeLogEntry.op)
+        .where(ChangeLogEntry.owner_id == owner_id, ChangeLogEntry.seq > since)
+        .order_by(ChangeLogEntry.seq)
+        .limit(limit + 1)
+    )
+    window = result.all()
+    has_more = len(window) > limit
+    window = window[:limit]
+    next_since = window[-1].seq if window else since
+
+    # 同一行只保留本页中的最后一条记录，按该记录的 seq 排序
+    latest: Dict[Tuple[str, int], Any] = {}
+    for entry in window:
+        latest.pop((entry.collection, entry.entity_id), None)
+        latest[(entry.collection, entry.entity_id)] = entry
+    entries = list(latest.values())
+
+    # 每个集合用一次 IN 查询读取需要返回内容的行
+    rows: Dict[Tuple[str, int], Any] = {}
+    for collection, entity in CHANGE_ENTITIES.items():
+        ids = [entry.entity_id for entry in entries if entry.collection == collection and entry.op != "delete"]
+        if ids:
+            found = await db.execute(select(entity).where(
+                entity.id.in_(ids), entity.owner_id == owner_id, entity.deleted_at.is_(None)
+            ))
+            rows.update(((collection, row.id), row) for row in found.scalars())
+
+    changes = []
+    for entry in entries:
+        # 已软删除的行按墓碑返回；读取期间刚被删除或转移的行同样按墓碑返回，对应的删除记录会出现在之后的页中
+        row = rows.get((entry.collection, entry.entity_id))
+        changes.append({
+            "seq": entry.seq,
+            "collection": entry.collection,
+            "id": entry.entity_id,
+            "op": "upsert" if row is not None else "delete",
+            "data": row,
+        })
+    return changes, next_since, has_more
@@ -0,0 +1,48 @@
+from sqlalchemy import DDL, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List
+
+from src.database.config import Base
+from src.database.models.collection_version import CollectionVersion
+
+# 带版本号的集合（表名即集合名，对应迁移 4b7c2e91d0a6）
+VERSIONED_TABLES = ("projects", "models")
+
+def _bump(table: str, row: str, condition: str = "") -> str:
+    return (
+        f"INSERT INTO collection_versions (owner_id, collection, version) "
+        f"SELECT {row}.owner_id, '{table}', 1 WHERE {row}.owner_id IS NOT NULL{condition} "
+        f"ON CONFLICT (owner_id, collection) DO UPDATE SET version = version + 1;"
+    )
+
+def version_triggers_ddl(table: str) -> List[str]:
+    """行的每次增删改都递增所有者的集合版本号（更换所有者时新旧所有者都递增）
+
+    触发器在写入所在的事务中执行，批量接口和组提交的写入同样生效，版本号与数据一起提交。
+    """
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_ai AFTER INSERT ON {table} BEGIN "
+        f"{_bump(table, 'new')} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_ad AFTER DELETE ON {table} BEGIN "
+        f"{_bump(table, 'old')} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_au AFTER UPDATE ON {table} BEGIN "
+        f"{_bump(table, 'new')} {_bump(table, 'old', ' AND old.owner_id IS NOT new.owner_id')} END",
+    ]
+
+for _table in VERSIONED_TABLES:
+    for _statement in version_triggers_ddl(_table):
+        event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+def versions_supported(db: AsyncSession) -> bool:
+    """版本号由 SQLite 触发器维护，其他数据库上没有触发器，版本号不可用"""
+    return db.get_bind().dialect.name == "sqlite"
+
+async def collection_version(db: AsyncSession, entity: Any, owner_id: int) -> int:
+    """获取所有者某个集合的当前版本号（从未写入过时为 0）"""
+    version = await db.scalar(
+        select(CollectionVersion.version).where(
+            CollectionVersion.owner_id == owner_id,
+            CollectionVersion.collection == entity.__tablename__,
+        )
+    )
+    return version or 0
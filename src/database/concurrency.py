@@ -0,0 +1,61 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
+
+class VersionConflict(Exception):
+    """条件更新时行版本号与 If-Match 不一致（行已被其他请求修改）"""
+
+    def __init__(self, current: int):
+        super().__init__(f"行版本号已变为 {current}")
+        self.current = current
+
+class InvalidIfMatch(ValueError):
+    pass
+
+def row_etag(row_version: int) -> str:
+    return f'"{row_version}"'
+
+def parse_if_match(if_match: Optional[str]) -> Optional[List[int]]:
+    """解析 If-Match 中的行版本号，未提供或为 * 时返回 None（不做版本检查）
+
+    If-Match 使用强比较，弱 ETag（W/ 前缀）和无法解析的值抛出 InvalidIfMatch。
+    """
+    if not if_match or if_match.strip() == "*":
+        return None
+    versions = []
+    for candidate in if_match.split(","):
+        candidate = candidate.strip()
+        if len(candidate) < 3 or candidate[0] != '"' or candidate[-1] != '"' or not candidate[1:-1].isdigit():
+            raise InvalidIfMatch(f"无效的 If-Match: {candidate}")
+        versions.append(int(candidate[1:-1]))
+    return versions
+
+async def update_row(
+    db: AsyncSession,
+    entity: Any,
+    id: int,
+    owner_id: int,
+    values: Dict[str, Any],
+    expected: Optional[List[int]] = None,
+) -> Any:
+    """用一条 UPDATE ... RETURNING 更新所有者的一行并把行版本号加 1，返回更新后的 ORM 对象
+
+    expected 不为空时只在行版本号属于其中时更新；未更新时再查一次该行区分两种情况：
+    行存在则抛出 VersionConflict，不存在（或已软删除）返回 None。不加锁，也不需要先读取该行。
+    """
+    condition = [entity.id == id, entity.owner_id == owner_id, entity.deleted_at.is_(None)]
+    if expected is not None:
+        condition.append(entity.row_version.in_(expected))
+    result = await db.execute(
+        update(entity).where(*condition).values(**values, row_version=entity.row_version + 1)
+        .returning(entity).execution_options(synchronize_session=False)
+    )
+    row = result.scalar_one_or_none()
+    if row is None and expected is not None:
+        current = (await db.execute(
+            select(entity.row_version)
+            .where(entity.id == id, entity.owner_id == owner_id, entity.deleted_at.is_(None))
+        )).scalar_one_or_none()
+        if current is not None:
+            raise VersionConflict(current)
+    return row
@@ -1,21 +1,161 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
-from typing import Any
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Union
 
 from src.core.config import settings
+from src.database.instrumentation import instrument_engine
+from src.database.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool, PoolMetrics, pool_metrics
 
-# 创建数据库引擎
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}  # SQLite特定参数
-)
+# 各数据库后端对应的异步驱动
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+def to_async_url(url: str) -> str:
+    """将数据库 URL 转换为对应的异步驱动 URL"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend in ASYNC_DRIVERS:
+        url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return url.render_as_string(hide_password=False)
+
+def to_sync_url(url: str) -> str:
+    """将异步驱动 URL 转换回同步 URL（供脚本和 Alembic 使用）"""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if ASYNC_DRIVERS.get(backend) == url.get_driver_name():
+        url = url.set(drivername=backend)
+    return url.render_as_string(hide_password=False)
+
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+def _is_memory_sqlite(url: str) -> bool:
+    return _is_sqlite(url) and make_url(url).database in (None, "", ":memory:")
+
+def _connect_args(url: str) -> dict:
+    if not _is_sqlite(url):
+        return {}
+    # sqlite3 按连接缓存已编译的语句
+    return {"check_same_thread": False, "cached_statements": settings.DATABASE_STATEMENT_CACHE_SIZE}
+
+def sqlite_pragmas(profile: str = None) -> Dict[str, Any]:
+    """返回 SQLite 配置档对应的 PRAGMA 设置"""
+    profile = profile or settings.SQLITE_PROFILE
+    if profile != "production":
+        return {}
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """在每个新建连接上执行 PRAGMA（同步或异步引擎的 sync_engine 均可）"""
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def engine_options(url: str, is_async: bool = False, name: Optional[str] = None) -> Dict[str, Any]:
+    """引擎参数：连接参数、语句缓存，以及连接池大小、超时、回收时间和预检测"""
+    options: Dict[str, Any] = {
+        "connect_args": _connect_args(url),
+        "query_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+    }
+    # 内存数据库只能使用单连接池
+    if _is_memory_sqlite(url):
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    )
+    if name:
+        options["pool_logging_name"] = name
+    return options
+
+def create_db_engine(
+    url: str,
+    is_async: bool = False,
+    name: Optional[str] = None,
+    poolclass: Any = None,
+) -> Union[Engine, AsyncEngine]:
+    """统一的引擎工厂，所有入口（API、脚本、迁移、后台任务）都通过它创建引擎
+
+    指定 ``name`` 时记录连接池的获取次数和等待时间；指定 ``poolclass``（如迁移使用的
+    NullPool）时不设置连接池大小相关参数。开启 QUERY_INSTRUMENTATION 时记录语句耗时和慢查询。
+    """
+    options = engine_options(url, is_async=is_async, name=name)
+    if poolclass is not None:
+        options = {
+            "connect_args": options["connect_args"],
+            "query_cache_size": options["query_cache_size"],
+            "poolclass": poolclass,
+        }
+    elif name:
+        pool_metrics.setdefault(name, PoolMetrics())
+
+    if is_async:
+        db_engine = create_async_engine(url, **options)
+        sync_engine = db_engine.sync_engine
+    else:
+        db_engine = sync_engine = create_engine(url, **options)
+    if _is_sqlite(url):
+        apply_sqlite_pragmas(sync_engine, sqlite_pragmas())
+    if settings.QUERY_INSTRUMENTATION:
+        instrument_engine(sync_engine, settings.SLOW_QUERY_THRESHOLD_MS, settings.SLOW_QUERY_LOG_PARAMETERS)
+    return db_engine
+
+# 创建数据库引擎（脚本、迁移和后台任务使用）
+SYNC_DATABASE_URL = to_sync_url(settings.DATABASE_URL)
+engine = create_db_engine(SYNC_DATABASE_URL, name="sync")
 
 # 创建会话工厂
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 异步引擎（API 路由使用，查询不会阻塞事件循环）
+ASYNC_DATABASE_URL = to_async_url(settings.DATABASE_URL)
+async_engine = create_db_engine(ASYNC_DATABASE_URL, is_async=True, name="async")
+
+# 异步会话工厂；提交后不过期对象，避免在响应序列化时触发隐式 IO
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# 本请求使用的会话工厂（由读副本路由中间件设置），未设置时使用主库
+routed_session_factory: ContextVar[Optional[Callable[[], AsyncSession]]] = ContextVar(
+    "routed_session_factory", default=None
+)
+
 # 数据库会话依赖项
-def get_db() -> Session:
+async def get_db() -> AsyncIterator[AsyncSession]:
+    session_factory = routed_session_factory.get() or AsyncSessionLocal
+    async with session_factory() as db:
+        yield db
+
+# 同步数据库会话（脚本使用）
+def get_sync_db() -> Session:
     db = SessionLocal()
     try:
         yield db
@@ -27,8 +167,8 @@ def get_db() -> Session:
 class Base:
     id: Any
     __name__: str
-    
+
     # 自动生成表名
     @declared_attr
     def __tablename__(cls) -> str:
-        return cls.__name__.lower() 
\ No newline at end of file
+        return cls.__name__.lower()
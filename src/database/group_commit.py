@@ -0,0 +1,211 @@
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+import threading
+import time
+
+from src.core.config import settings
+from src.database.concurrency import update_row
+from src.database.config import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+WriteOp = Callable[[AsyncSession], Awaitable[Any]]
+
+# 批大小直方图的桶上界（最后一个桶收纳更大的批次）
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+def insert_op(entity: Any, values: Dict[str, Any]) -> WriteOp:
+    """插入一行并返回 ORM 对象（INSERT ... RETURNING）"""
+    async def op(db: AsyncSession) -> Any:
+        result = await db.execute(insert(entity).values(**values).returning(entity))
+        return result.scalar_one()
+    return op
+
+def update_op(
+    entity: Any,
+    id: int,
+    owner_id: int,
+    values: Dict[str, Any],
+    expected: Optional[List[int]] = None,
+) -> WriteOp:
+    """更新所有者的一行并返回 ORM 对象，行不存在时返回 None，版本号不符时抛出 VersionConflict"""
+    async def op(db: AsyncSession) -> Any:
+        return await update_row(db, entity, id, owner_id, values, expected)
+    return op
+
+class _Pending:
+    __slots__ = ("op", "future", "submitted")
+
+    def __init__(self, op: WriteOp, future: asyncio.Future):
+        self.op = op
+        self.future = future
+        self.submitted = time.perf_counter()
+
+class GroupCommitStats:
+    """提交次数、批大小直方图、提交耗时和吞吐量"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.started = time.monotonic()
+            self.commits = 0
+            self.operations = 0
+            self.failed = 0
+            self.total_commit = 0.0
+            self.max_commit = 0.0
+            self.total_wait = 0.0
+            self.histogram = [0] * (len(BATCH_BUCKETS) + 1)
+
+    def record(self, size: int, commit: float, wait: float) -> None:
+        with self._lock:
+            self.commits += 1
+            self.operations += size
+            self.total_commit += commit
+            self.max_commit = max(self.max_commit, commit)
+            self.total_wait += wait
+            bucket = next((i for i, bound in enumerate(BATCH_BUCKETS) if size <= bound), len(BATCH_BUCKETS))
+            self.histogram[bucket] += 1
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = max(time.monotonic() - self.started, 1e-9)
+            labels = [f"<={bound}" for bound in BATCH_BUCKETS] + [f">{BATCH_BUCKETS[-1]}"]
+            return {
+                "commits": self.commits,
+                "operations": self.operations,
+                "failed": self.failed,
+                "commits_per_s": round(self.commits / elapsed, 3),
+                "operations_per_s": round(self.operations / elapsed, 3),
+                "avg_batch": round(self.operations / self.commits, 3) if self.commits else 0.0,
+                "batch_histogram": dict(zip(labels, self.histogram)),
+                "commit_ms_avg": round(self.total_commit * 1000 / self.commits, 3) if self.commits else 0.0,
+                "commit_ms_max": round(self.max_commit * 1000, 3),
+                "wait_ms_avg": round(self.total_wait * 1000 / self.operations, 3) if self.operations else 0.0,
+            }
+
+class GroupCommitter:
+    """把并发请求的写操作合并到同一个事务中提交（组提交）
+
+    写操作进入队列后，后台任务在攒够 max_batch 个或等待 max_delay_ms 后，在一个会话中依次
+    执行并提交一次；每个请求在所在批次提交成功后才拿到结果，确认仍然是持久的。某个操作失败时
+    回滚本批次，该操作返回异常，其余操作重新执行并提交。max_delay_ms 为 0 时不额外等待，
+    只合并上一次提交期间到达的操作。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        enabled: bool = False,
+        max_batch: int = 100,
+        max_delay_ms: float = 2.0,
+    ):
+        self.session_factory = session_factory
+        self.enabled = enabled
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self.stats = GroupCommitStats()
+        self._queue: Optional[asyncio.Queue] = None
+        self._full: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is not None and self._loop is loop and not self._task.done():
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._full = asyncio.Event()
+        self._task = loop.create_task(self._run())
+
+    async def submit(self, op: WriteOp) -> Any:
+        """排队执行写操作，所在批次提交后返回操作的结果"""
+        self._ensure_started()
+        future = self._loop.create_future()
+        self._queue.put_nowait(_Pending(op, future))
+        if self._queue.qsize() >= self.max_batch:
+            self._full.set()
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            if self.max_delay > 0 and self._queue.qsize() + 1 < self.max_batch:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.max_delay)
+                except asyncio.TimeoutError:
+                    pass
+            self._full.clear()
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._commit(batch)
+            except Exception as e:
+                logger.error(f"Group commit failed: {str(e)}")
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _commit(self, batch: List[_Pending]) -> None:
+        # 等待期间已取消的请求不会收到确认，不再写入
+        pending = [entry for entry in batch if not entry.future.cancelled()]
+        while pending:
+            started = time.perf_counter()
+            results, current = [], None
+            async with self.session_factory() as db:
+                try:
+                    for current in pending:
+                        results.append(await current.op(db))
+                    current = None
+                    # 返回的对象在提交前脱离会话，提交后不会过期，可在请求中直接序列化
+                    db.expunge_all()
+                    await db.commit()
+                except Exception as e:
+                    await db.rollback()
+                    if current is None:
+                        raise
+                    self.stats.record_failure()
+                    if not current.future.done():
+                        current.future.set_exception(e)
+                    pending = [entry for entry in pending if entry is not current]
+                    continue
+            finished = time.perf_counter()
+            self.stats.record(
+                len(pending), finished - started, sum(started - entry.submitted for entry in pending)
+            )
+            for entry, result in zip(pending, results):
+                if not entry.future.done():
+                    entry.future.set_result(result)
+            return
+
+    async def close(self) -> None:
+        """提交队列中剩余的操作并停止后台任务"""
+        if self._task is None or self._task.done():
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+group_commit = GroupCommitter(
+    AsyncSessionLocal,
+    enabled=settings.GROUP_COMMIT_ENABLED,
+    max_batch=settings.GROUP_COMMIT_MAX_BATCH,
+    max_delay_ms=settings.GROUP_COMMIT_MAX_DELAY_MS,
+)
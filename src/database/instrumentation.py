@@ -0,0 +1,124 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from typing import Any, Iterator, List, Optional, Tuple
+import logging
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+# 只对这些语句执行 EXPLAIN（不会真正执行语句本身）
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+_MAX_PARAMETERS_LOGGED = 1000
+_WHITESPACE = re.compile(r"\s+")
+# IN 列表展开后的占位符个数随参数变化，归一化为一个
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:\?|%s|\$\d+|:\w+)\s*,)+\s*(?:\?|%s|\$\d+|:\w+)\s*\)")
+
+def statement_shape(statement: str) -> str:
+    """语句形态：合并空白并折叠 IN 列表占位符，参数不同的同一语句形态相同"""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("(?)", statement)
+
+class QueryStats:
+    """单个请求内执行的 SQL 语句数量、总耗时和各语句的执行次数"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        # 按原始语句计数；编译缓存使同一语句通常是同一个字符串，形态在汇总时再计算
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.statements[statement] += 1
+
+    @property
+    def total_ms(self) -> float:
+        return self.total * 1000
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """执行次数超过 threshold 的语句形态（可能的 N+1 查询）"""
+        shapes: Counter = Counter()
+        for statement, count in self.statements.items():
+            shapes[statement_shape(statement)] += count
+        return [(shape, count) for shape, count in shapes.most_common() if count > threshold]
+
+    def server_timing(self) -> str:
+        """Server-Timing 响应头的值"""
+        return f'db;dur={self.total_ms:.2f};desc="{self.count} queries"'
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """在当前上下文（请求）内统计已插桩引擎执行的语句"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+def describe_parameters(parameters: Any) -> str:
+    """参数的个数和类型（不包含参数值，避免把密码哈希、邮箱等写入日志）"""
+    if isinstance(parameters, dict):
+        items = ", ".join(f"{name}: {type(value).__name__}" for name, value in parameters.items())
+    elif isinstance(parameters, (list, tuple)):
+        items = ", ".join(type(value).__name__ for value in parameters)
+    else:
+        return type(parameters).__name__
+    return f"{len(parameters)} parameters ({items})"[:_MAX_PARAMETERS_LOGGED]
+
+def explain(connection: Any, statement: str, parameters: Any) -> List[str]:
+    """用同一个 DBAPI 连接获取语句的查询计划，不触发 SQLAlchemy 事件"""
+    prefix = "EXPLAIN QUERY PLAN " if connection.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = connection.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return [" ".join(str(value) for value in row) for row in cursor.fetchall()]
+    except Exception as e:
+        return [f"EXPLAIN failed: {e}"]
+    finally:
+        cursor.close()
+
+def instrument_engine(engine: Engine, slow_threshold_ms: float, log_parameters: bool = False) -> None:
+    """为引擎（或异步引擎的 sync_engine）注册语句计时事件
+
+    语句计入当前请求的 QueryStats；超过 slow_threshold_ms 的语句连同查询计划记录为警告，
+    slow_threshold_ms 为 0 时不记录慢查询。慢查询日志默认只记录参数的个数和类型，
+    log_parameters 为真时才记录参数值（仅供调试）。
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_started
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        if slow_threshold_ms <= 0 or elapsed * 1000 < slow_threshold_ms:
+            return
+        plan = []
+        if not executemany and statement.lstrip().upper().startswith(_EXPLAINABLE):
+            plan = explain(conn, statement, parameters)
+        # executemany 的参数可能有成千上万组，只记录组数
+        if executemany:
+            shown = f"{len(parameters)} parameter sets"
+        elif log_parameters:
+            shown = repr(parameters)[:_MAX_PARAMETERS_LOGGED]
+        else:
+            shown = describe_parameters(parameters)
+        logger.warning(
+            "Slow query (%.1f ms): %s\nparameters: %s\nplan:\n  %s",
+            elapsed * 1000,
+            statement_shape(statement),
+            shown,
+            "\n  ".join(plan) or "(not available)",
+        )
@@ -0,0 +1,10 @@
+from .user import User
+from .project import Project
+from .model import Model, ModelType, ModelStatus
+from .collection_version import CollectionVersion
+from .change_log import ChangeLogEntry
+from .owner_aggregate import OwnerAggregate
+
+__all__ = [
+    "User", "Project", "Model", "ModelType", "ModelStatus", "CollectionVersion", "ChangeLogEntry", "OwnerAggregate",
+]
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy.sql import func
+
+from src.database.config import Base
+
+class ChangeLogEntry(Base):
+    """项目和模型的增删改记录，由触发器写入（对应迁移 9e3f5a17c2b8）
+
+    seq 使用 AUTOINCREMENT，单调递增且不会复用，客户端可以用它作为增量同步的位置。
+    """
+    __tablename__ = "change_log"
+
+    seq = Column(Integer, primary_key=True)
+    owner_id = Column(Integer, nullable=False)
+    collection = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)
+    changed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 按所有者读取某个位置之后的变更
+    __table_args__ = (
+        Index("ix_change_log_owner_id_seq", owner_id, seq),
+        {"sqlite_autoincrement": True},
+    )
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String
+
+from src.database.config import Base
+
+class CollectionVersion(Base):
+    """每个用户的项目和模型集合的版本号，由触发器在每次增删改时加一（对应迁移 4b7c2e91d0a6）"""
+    __tablename__ = "collection_versions"
+
+    owner_id = Column(Integer, primary_key=True)
+    collection = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
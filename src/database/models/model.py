@@ -0,0 +1,54 @@
+import enum
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from src.database.config import Base
+
+class ModelType(str, enum.Enum):
+    CLASSIFICATION = "classification"
+    REGRESSION = "regression"
+    GENERATIVE = "generative"
+
+class ModelStatus(str, enum.Enum):
+    DRAFT = "draft"
+    TRAINING = "training"
+    READY = "ready"
+    ERROR = "error"
+
+class Model(Base):
+    __tablename__ = "models"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, index=True, nullable=False)
+    type = Column(Enum(ModelType), nullable=False)
+    version = Column(String, nullable=False)
+    status = Column(Enum(ModelStatus), default=ModelStatus.DRAFT)
+    description = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    owner_id = Column(Integer, ForeignKey("users.id"))
+    # 乐观并发控制的行版本号，每次更新加 1（version 列是模型本身的版本，对应迁移 5d2a8c3f7e41）
+    row_version = Column(Integer, nullable=False, default=1, server_default="1")
+    # 软删除时间，非空的行已删除，由后台任务清理（对应迁移 e7b19d4c6a53）
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    owner = relationship("User", back_populates="models")
+
+    # 按所有者查询列表和单条记录的索引只包含未删除的行（部分索引），查询都带 deleted_at IS NULL；
+    # 另一个部分索引只包含已删除的行，供后台清理按删除时间读取（对应迁移 781e843cee68、e7b19d4c6a53）
+    __table_args__ = (
+        Index(
+            "ix_models_owner_id_created_at", owner_id, created_at.desc(), id.desc(),
+            sqlite_where=deleted_at.is_(None), postgresql_where=deleted_at.is_(None),
+        ),
+        Index(
+            "ix_models_owner_id_id", owner_id, id,
+            sqlite_where=deleted_at.is_(None), postgresql_where=deleted_at.is_(None),
+        ),
+        Index(
+            "ix_models_deleted_at", deleted_at,
+            sqlite_where=deleted_at.is_not(None), postgresql_where=deleted_at.is_not(None),
+        ),
+    )
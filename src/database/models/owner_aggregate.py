@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String
+
+from src.database.config import Base
+
+class OwnerAggregate(Base):
+    """每个用户按字段取值统计的项目和模型数量，由触发器在写入的同一事务中维护（对应迁移 c41d8a6e9f20）"""
+    __tablename__ = "owner_aggregates"
+
+    owner_id = Column(Integer, primary_key=True)
+    collection = Column(String, primary_key=True)
+    field = Column(String, primary_key=True)
+    value = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0, server_default="0")
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from src.database.config import Base
+
+class Project(Base):
+    __tablename__ = "projects"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, index=True, nullable=False)
+    description = Column(Text, nullable=True)
+    status = Column(String, nullable=False, default="active", server_default="active")
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # 乐观并发控制的行版本号，每次更新加 1（对应迁移 5d2a8c3f7e41）
+    row_version = Column(Integer, nullable=False, default=1, server_default="1")
+    # 软删除时间，非空的行已删除，由后台任务清理（对应迁移 e7b19d4c6a53）
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    owner = relationship("User", back_populates="projects")
+
+    # 按所有者查询列表和单条记录的索引只包含未删除的行（部分索引），查询都带 deleted_at IS NULL；
+    # 另一个部分索引只包含已删除的行，供后台清理按删除时间读取（对应迁移 781e843cee68、e7b19d4c6a53）
+    __table_args__ = (
+        Index(
+            "ix_projects_owner_id_created_at", owner_id, created_at.desc(), id.desc(),
+            sqlite_where=deleted_at.is_(None), postgresql_where=deleted_at.is_(None),
+        ),
+        Index(
+            "ix_projects_owner_id_id", owner_id, id,
+            sqlite_where=deleted_at.is_(None), postgresql_where=deleted_at.is_(None),
+        ),
+        # 汇总核对按所有者分段统计各状态的行数，按这个索引的顺序分组，不需要临时排序（对应迁移 3f8c2a9d6b17）
+        Index(
+            "ix_projects_owner_id_status", owner_id, status,
+            sqlite_where=deleted_at.is_(None), postgresql_where=deleted_at.is_(None),
+        ),
+        Index(
+            "ix_projects_deleted_at", deleted_at,
+            sqlite_where=deleted_at.is_not(None), postgresql_where=deleted_at.is_not(None),
+        ),
+    )
@@ -0,0 +1,125 @@
+from sqlalchemy import DateTime, String, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from sqlalchemy.types import TypeDecorator
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import base64
+import json
+import threading
+import time
+
+from src.core.config import settings
+from src.database.replicas import is_replica
+
+class InvalidCursor(ValueError):
+    """分页游标无法解析"""
+
+class _CursorTimestamp(TypeDecorator):
+    """按数据库中的存储格式绑定游标时间
+
+    SQLite 中由 CURRENT_TIMESTAMP 写入的时间没有微秒部分，而 SQLAlchemy 默认按带微秒的
+    文本绑定参数，两者对同一时间做文本比较时并不相等。
+    """
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime(timezone=True))
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and dialect.name == "sqlite":
+            return value.strftime("%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S")
+        return value
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """将 (created_at, id) 编码为不透明的游标"""
+    raw = json.dumps([created_at.isoformat(), id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(cursor) from e
+
+def clamp_limit(limit: Optional[int]) -> int:
+    if not limit or limit < 1:
+        return settings.PAGINATION_DEFAULT_LIMIT
+    return min(limit, settings.PAGINATION_MAX_LIMIT)
+
+def keyset_page(query: Select, entity: Any, cursor: Optional[str], limit: int) -> Select:
+    """按 (created_at DESC, id DESC) 排序并从游标之后开始取 limit + 1 行
+
+    多取的一行只用于判断是否还有下一页；配合 (owner_id, created_at DESC, id DESC)
+    索引，无论翻到第几页都只读取 limit + 1 行。
+    """
+    if cursor:
+        created_at, id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(entity.created_at, entity.id) < tuple_(literal(created_at, _CursorTimestamp()), id)
+        )
+    return query.order_by(entity.created_at.desc(), entity.id.desc()).limit(limit + 1)
+
+def page_items(rows: List[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """截取一页数据并生成下一页游标（没有下一页时为 None）"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
+
+class OwnerCountCache:
+    """按 (表名, 所有者) 缓存行数，超过 ttl 秒或数据变更后重新统计"""
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._counts: Dict[Tuple[str, int], Tuple[int, float]] = {}
+        # 统计期间发生变更时不写入缓存
+        self._versions: Dict[Tuple[str, int], int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def count(self, db: AsyncSession, entity: Any, owner_id: int) -> int:
+        key = (entity.__tablename__, owner_id)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached and now - cached[1] < self.ttl:
+                self.hits += 1
+                return cached[0]
+            self.misses += 1
+            version = self._versions.get(key, 0)
+        result = await db.execute(
+            select(func.count()).select_from(entity).where(entity.owner_id == owner_id, entity.deleted_at.is_(None))
+        )
+        total = result.scalar_one()
+        # 副本上读到的行数可能落后于主库，不写入缓存，避免写入后读到旧的缓存值
+        if is_replica(db):
+            return total
+        with self._lock:
+            if self._versions.get(key, 0) == version:
+                self._counts[key] = (total, now)
+        return total
+
+    def invalidate(self, entity: Any, owner_id: int) -> None:
+        key = (entity.__tablename__, owner_id)
+        with self._lock:
+            self._counts.pop(key, None)
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._counts), "hits": self.hits, "misses": self.misses, "ttl": self.ttl}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._versions.clear()
+
+owner_counts = OwnerCountCache(settings.COUNT_CACHE_TTL)
@@ -0,0 +1,77 @@
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from typing import Any, Dict
+import threading
+import time
+
+class PoolMetrics:
+    """连接池获取连接的次数、等待时间和超时统计"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.total_wait * 1000, 3),
+                "wait_ms_avg": round(self.total_wait * 1000 / attempts, 3) if attempts else 0.0,
+                "wait_ms_max": round(self.max_wait * 1000, 3),
+            }
+
+# 按连接池日志名登记的统计；dispose() 重建连接池时会沿用同一日志名
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+class _InstrumentedPoolMixin:
+    """记录每次获取连接的耗时（包括排队等待、新建连接和预检测）"""
+
+    def connect(self):
+        metrics = pool_metrics.get(self._orig_logging_name)
+        if metrics is None:
+            return super().connect()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        metrics.record(time.perf_counter() - started)
+        return connection
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """连接池当前状态及累计的获取连接统计"""
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, name):
+            status[name] = getattr(pool, name)()
+    metrics = pool_metrics.get(pool._orig_logging_name)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
@@ -0,0 +1,128 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+import hashlib
+import sqlite3
+import threading
+import time
+
+from src.core.config import settings
+from src.database.config import AsyncSessionLocal, create_db_engine, to_async_url, to_sync_url
+
+SessionFactory = Callable[[], AsyncSession]
+
+# 不修改数据的请求方法，可以由副本处理
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+class ReplicaRouter:
+    """为每个请求选择会话工厂：读请求轮询分配到只读副本，写请求使用主库
+
+    客户端写入后 read_your_writes 秒内的读请求同样使用主库，避免读到副本上尚未同步的数据。
+    客户端由调用方给出的键区分（见 client_key），记录的客户端数受 max_clients 限制（LRU）。
+    没有配置副本时所有请求都使用主库。
+    """
+
+    def __init__(
+        self,
+        primary: SessionFactory,
+        replicas: List[SessionFactory],
+        read_your_writes: float = 5,
+        max_clients: int = 10000,
+    ):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.read_your_writes = read_your_writes
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        self._next = 0
+        self._recent_writes: "OrderedDict[str, float]" = OrderedDict()
+        self.primary_reads = 0
+        self.writes = 0
+        self.replica_reads = [0] * len(self.replicas)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def route(self, method: str, client: Optional[str]) -> SessionFactory:
+        """返回本请求使用的会话工厂"""
+        now = time.monotonic()
+        with self._lock:
+            if method.upper() not in SAFE_METHODS:
+                self.writes += 1
+                return self.primary
+            wrote = self._recent_writes.get(client) if client is not None else None
+            if not self.replicas or (wrote is not None and now - wrote < self.read_your_writes):
+                self.primary_reads += 1
+                return self.primary
+            index = self._next % len(self.replicas)
+            self._next += 1
+            self.replica_reads[index] += 1
+            return self.replicas[index]
+
+    def mark_write(self, client: Optional[str]) -> None:
+        """记录客户端的写请求（在请求结束、写入提交之后调用）"""
+        if client is None or self.read_your_writes <= 0:
+            return
+        with self._lock:
+            self._recent_writes[client] = time.monotonic()
+            self._recent_writes.move_to_end(client)
+            while len(self._recent_writes) > self.max_clients:
+                self._recent_writes.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "replicas": len(self.replicas),
+                "writes": self.writes,
+                "primary_reads": self.primary_reads,
+                "replica_reads": list(self.replica_reads),
+                "read_your_writes_seconds": self.read_your_writes,
+                "tracked_clients": len(self._recent_writes),
+            }
+
+    async def dispose(self) -> None:
+        """关闭各副本的连接池"""
+        for replica in self.replicas:
+            engine = getattr(replica, "kw", {}).get("bind")
+            if engine is not None:
+                await engine.dispose()
+
+def client_key(scope: Dict[str, Any]) -> Optional[str]:
+    """读己之写的客户端键：Authorization 头的摘要（同一令牌即同一客户端），没有时用客户端地址"""
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            return hashlib.sha256(value).hexdigest()[:32]
+    client = scope.get("client")
+    return client[0] if client else None
+
+def replica_session_factory(url: str, name: Optional[str] = None) -> async_sessionmaker:
+    """副本的异步会话工厂；会话的 info 中标记 replica，进程内缓存据此不保存副本上读到的值"""
+    return async_sessionmaker(
+        bind=create_db_engine(to_async_url(url), is_async=True, name=name),
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+        info={"replica": True},
+    )
+
+def is_replica(db: AsyncSession) -> bool:
+    """会话是否来自只读副本（见 replica_session_factory）"""
+    return bool(db.info.get("replica"))
+
+def copy_sqlite_database(source_url: str, target_url: str) -> None:
+    """用 SQLite 在线备份把主库复制为本地副本（开发和测试时模拟一次副本同步）"""
+    source = sqlite3.connect(make_url(to_sync_url(source_url)).database)
+    target = sqlite3.connect(make_url(to_sync_url(target_url)).database)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+replica_router = ReplicaRouter(
+    AsyncSessionLocal,
+    [replica_session_factory(url, name=f"replica{index}") for index, url in enumerate(settings.DATABASE_REPLICA_URLS)],
+    read_your_writes=settings.REPLICA_READ_YOUR_WRITES_SECONDS,
+)
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import List, Literal, Optional, Union
+
+from src.database.schemas.model import ModelInDB
+from src.database.schemas.project import ProjectInDB
+
+class Change(BaseModel):
+    seq: int
+    collection: Literal["projects", "models"]
+    id: int
+    op: Literal["upsert", "delete"]
+    data: Optional[Union[ProjectInDB, ModelInDB]] = None
+
+class ChangePage(BaseModel):
+    changes: List[Change]
+    next_since: int
+    has_more: bool
@@ -16,12 +16,16 @@ class ModelCreate(ModelBase):
 class ModelUpdate(ModelBase):
     status: Optional[ModelStatus] = None
 
+class ModelBulkUpdate(ModelUpdate):
+    id: int
+
 class ModelInDB(ModelBase):
     id: int
     status: ModelStatus
     owner_id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
+    row_version: int = 1
 
     class Config:
         from_attributes = True
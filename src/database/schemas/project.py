@@ -13,11 +13,15 @@ class ProjectCreate(ProjectBase):
 class ProjectUpdate(ProjectBase):
     pass
 
+class ProjectBulkUpdate(ProjectUpdate):
+    id: int
+
 class ProjectInDB(ProjectBase):
     id: int
     owner_id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
+    row_version: int = 1
 
     class Config:
         from_attributes = True
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Literal, Optional
+
+class SearchResult(BaseModel):
+    kind: Literal["project", "model"]
+    id: int
+    name: str
+    description: Optional[str] = None
+    version: Optional[str] = None
+    rank: float
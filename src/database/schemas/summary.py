@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Dict
+
+class ProjectSummary(BaseModel):
+    total: int
+    by_status: Dict[str, int]
+
+class ModelSummary(BaseModel):
+    total: int
+    by_type: Dict[str, int]
+    by_status: Dict[str, int]
+
+class Summary(BaseModel):
+    projects: ProjectSummary
+    models: ModelSummary
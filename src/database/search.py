@@ -0,0 +1,111 @@
+from sqlalchemy import DDL, event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional, Tuple
+import base64
+import json
+import re
+
+from src.database.config import Base
+from src.database.pagination import InvalidCursor
+
+# 项目和模型的 FTS5 外部内容表（对应迁移 20e5033af50f），rowid 即源表 id
+FTS_TABLES = ("projects_fts", "models_fts")
+
+# 与迁移中的 SQL 一致；create_all 创建的数据库（测试、首次启动）也需要这些表和触发器
+_FTS_SCHEMA = {
+    "projects": ("name", "description", "owner_id"),
+    "models": ("name", "description", "version", "owner_id"),
+}
+
+def fts_ddl(table: str, columns: Tuple[str, ...]) -> List[str]:
+    """FTS5 虚拟表及保持同步的触发器（仅在索引列变化时更新）"""
+    fts = f"{table}_fts"
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+    ]
+
+for _table, _columns in _FTS_SCHEMA.items():
+    for _statement in fts_ddl(_table, _columns):
+        event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+    # 外部内容表不会随源表删除，drop_all 时一并删除，避免重建后残留旧索引
+    event.listen(Base.metadata, "before_drop", DDL(f"DROP TABLE IF EXISTS {_table}_fts").execute_if(dialect="sqlite"))
+
+_TOKEN = re.compile(r"\w+")
+
+def match_expression(q: str, owner_id: int, columns: Tuple[str, ...]) -> Optional[str]:
+    """把用户输入转换为 FTS5 查询：限定所有者，各词都需出现，最后一个词按前缀匹配
+
+    只保留词字符并逐个加引号，用户输入中的 FTS5 语法（引号、AND/OR、列过滤等）不会生效。
+    """
+    tokens = _TOKEN.findall(q)
+    if not tokens:
+        return None
+    terms = " ".join(f'"{token}"' for token in tokens) + "*"
+    return f'owner_id : "{owner_id}" AND {{{" ".join(columns)}}} : ({terms})'
+
+# bm25 权重按列顺序：名称最重要，owner_id 只用于过滤不参与评分；
+# 软删除的行仍在全文索引中，按 deleted_at 部分索引排除
+_SEARCH_SQL = text("""
+SELECT 'project' AS kind, rowid AS id, name, description, NULL AS version,
+       bm25(projects_fts, 10.0, 1.0, 0.0) AS rank
+FROM projects_fts WHERE projects_fts MATCH :project_query
+  AND rowid NOT IN (SELECT id FROM projects WHERE deleted_at IS NOT NULL)
+UNION ALL
+SELECT 'model' AS kind, rowid AS id, name, description, version,
+       bm25(models_fts, 10.0, 1.0, 5.0, 0.0) AS rank
+FROM models_fts WHERE models_fts MATCH :model_query
+  AND rowid NOT IN (SELECT id FROM models WHERE deleted_at IS NOT NULL)
+ORDER BY rank, kind, id
+LIMIT :limit OFFSET :offset
+""")
+
+def encode_offset(offset: int) -> str:
+    raw = json.dumps({"offset": offset}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_offset(cursor: str) -> int:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        offset = int(json.loads(raw)["offset"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursor(cursor) from e
+    if offset < 0:
+        raise InvalidCursor(cursor)
+    return offset
+
+async def search_catalog(
+    db: AsyncSession,
+    owner_id: int,
+    q: str,
+    cursor: Optional[str],
+    limit: int,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """在所有者的项目和模型中全文搜索，按相关度排序分页
+
+    rank 为 bm25 得分，越小越相关。相关度排序没有稳定的键集游标，游标中记录的是偏移量。
+    """
+    offset = decode_offset(cursor) if cursor else 0
+    project_query = match_expression(q, owner_id, _FTS_SCHEMA["projects"][:-1])
+    if project_query is None:
+        return [], None
+    result = await db.execute(_SEARCH_SQL, {
+        "project_query": project_query,
+        "model_query": match_expression(q, owner_id, _FTS_SCHEMA["models"][:-1]),
+        "limit": limit + 1,
+        "offset": offset,
+    })
+    rows = [row._asdict() for row in result]
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], encode_offset(offset + limit)
@@ -0,0 +1,133 @@
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Engine
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+import math
+import random
+import time
+
+from src.database.models.model import Model, ModelStatus, ModelType
+from src.database.models.project import Project
+from src.database.models.user import User
+
+# 名称和描述的词表，组合后接近真实数据的长度和用词分布（搜索基准也依赖这些常见词）
+WORDS = [
+    "image", "text", "audio", "vision", "speech", "resnet", "bert", "gpt", "detector", "classifier",
+    "segmentation", "translation", "summary", "embedding", "ranking", "forecast", "tabular", "graph",
+    "diffusion", "tokenizer", "sentiment", "ocr", "tracking", "pose", "depth", "anomaly", "retrieval",
+    "pipeline", "baseline", "finetune", "distilled", "multilingual", "realtime", "edge", "batch", "v2",
+]
+
+PROJECT_STATUSES = (("active", 0.75), ("archived", 0.2), ("paused", 0.05))
+MODEL_TYPES = ((ModelType.CLASSIFICATION, 0.5), (ModelType.REGRESSION, 0.2), (ModelType.GENERATIVE, 0.3))
+MODEL_STATUSES = (
+    (ModelStatus.READY, 0.6), (ModelStatus.DRAFT, 0.2), (ModelStatus.TRAINING, 0.15), (ModelStatus.ERROR, 0.05),
+)
+
+def _choose(rng: random.Random, weighted) -> Any:
+    values, weights = zip(*weighted)
+    return rng.choices(values, weights)[0]
+
+def _per_user(rng: random.Random, mean: float, sigma: float = 1.0) -> int:
+    """每个用户拥有的行数：对数正态分布，多数用户只有少量数据，少数用户拥有大量数据"""
+    if mean <= 0:
+        return 0
+    return int(rng.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma))
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+def _timestamp(rng: random.Random, start: datetime, end: datetime) -> datetime:
+    # 微秒部分不为 0：SQLite 中带微秒的时间总是按完整格式存储，与分页游标的绑定格式一致
+    seconds = int((end - start).total_seconds())
+    moment = start.replace(microsecond=0) + timedelta(seconds=rng.randint(0, max(seconds - 1, 0)))
+    return moment.replace(microsecond=rng.randint(1, 999999))
+
+def _batches(rows: List[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+def seed_database(
+    engine: Engine,
+    users: int = 1000,
+    projects_per_user: float = 20,
+    models_per_user: float = 10,
+    days: int = 365,
+    hashed_password: str = "x",
+    prefix: str = "seed",
+    seed: Optional[int] = 0,
+    batch_size: int = 5000,
+) -> Dict[str, Any]:
+    """批量生成用户、项目和模型，返回各表的行数和耗时
+
+    每个用户的项目和模型数量服从对数正态分布（均值为 projects_per_user/models_per_user），
+    创建时间分布在最近 days 天内且晚于用户注册时间，约三成的行有更新时间；状态和类型按
+    常见比例抽样。所有行按创建时间排序后用 executemany 分批插入，自增 id 与时间顺序一致，
+    全文索引、集合版本号、变更日志和汇总计数由触发器同步写入。用户名为 "{prefix}{序号}"，已存在同名
+    用户时抛出 ValueError。
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    started = time.perf_counter()
+
+    with engine.connect() as conn:
+        taken = conn.execute(
+            select(func.count()).select_from(User).where(User.username.like(f"{prefix}%"))
+        ).scalar_one()
+    if taken:
+        raise ValueError(f"已存在 {taken} 个以 {prefix!r} 开头的用户，请更换前缀")
+
+    signups = sorted(_timestamp(rng, now - timedelta(days=days), now) for _ in range(users))
+    user_rows = [
+        {
+            "username": f"{prefix}{i:06d}",
+            "email": f"{prefix}{i:06d}@example.com",
+            "hashed_password": hashed_password,
+            "is_active": rng.random() < 0.98,
+            "is_superuser": False,
+            "created_at": signup,
+        }
+        for i, signup in enumerate(signups)
+    ]
+    counts = {"users": 0, "projects": 0, "models": 0}
+    with engine.begin() as conn:
+        for batch in _batches(user_rows, batch_size):
+            conn.execute(insert(User), batch)
+        owners = conn.execute(
+            select(User.id, User.created_at).where(User.username.like(f"{prefix}%")).order_by(User.id)
+        ).all()
+    counts["users"] = len(owners)
+
+    projects, models = [], []
+    for owner_id, signup in owners:
+        for _ in range(_per_user(rng, projects_per_user)):
+            created = _timestamp(rng, signup, now)
+            projects.append({
+                "name": f"{_phrase(rng, rng.randint(1, 3))} {rng.randrange(10000)}",
+                "description": _phrase(rng, rng.randint(3, 30)) if rng.random() < 0.8 else None,
+                "status": _choose(rng, PROJECT_STATUSES),
+                "owner_id": owner_id,
+                "created_at": created,
+                "updated_at": _timestamp(rng, created, now) if rng.random() < 0.3 else None,
+            })
+        for _ in range(_per_user(rng, models_per_user)):
+            created = _timestamp(rng, signup, now)
+            models.append({
+                "name": f"{_phrase(rng, rng.randint(1, 2)).replace(' ', '-')}-{rng.randrange(10000)}",
+                "type": _choose(rng, MODEL_TYPES),
+                "version": f"{rng.randint(0, 3)}.{rng.randint(0, 9)}.{rng.randint(0, 20)}",
+                "status": _choose(rng, MODEL_STATUSES),
+                "description": _phrase(rng, rng.randint(3, 20)) if rng.random() < 0.7 else None,
+                "owner_id": owner_id,
+                "created_at": created,
+                "updated_at": _timestamp(rng, created, now) if rng.random() < 0.3 else None,
+            })
+
+    for entity, rows in ((Project, projects), (Model, models)):
+        rows.sort(key=lambda row: row["created_at"])
+        with engine.begin() as conn:
+            for batch in _batches(rows, batch_size):
+                conn.execute(insert(entity), batch)
+        counts[entity.__tablename__] = len(rows)
+
+    return {**counts, "seconds": round(time.perf_counter() - started, 3)}
@@ -0,0 +1,134 @@
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Optional, Set, Tuple
+import asyncio
+import fcntl
+import hashlib
+import logging
+import tempfile
+import time
+
+from src.database.models.model import Model
+from src.database.models.project import Project
+
+logger = logging.getLogger(__name__)
+
+# 软删除的集合，按此顺序清理
+PURGE_ENTITIES = {"projects": Project, "models": Model}
+
+async def soft_delete(db: AsyncSession, entity: Any, owner_id: int, *conditions: Any) -> int:
+    """用一条 UPDATE 把所有者满足条件的未删除行标记为已删除（行版本号加 1），返回标记的行数
+
+    标记后所有查询都不再返回这些行，统计、全文搜索和变更日志按删除处理；行和关联的存储由
+    purge_deleted 在后台清理。
+    """
+    result = await db.execute(
+        update(entity)
+        .where(entity.owner_id == owner_id, entity.deleted_at.is_(None), *conditions)
+        .values(deleted_at=func.now(), row_version=entity.row_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+def _purge_batch(
+    engine: Engine,
+    entity: Any,
+    cutoff: datetime,
+    batch_size: int,
+) -> Tuple[int, Set[str]]:
+    """删除一批已软删除的行，返回 (删除的行数, 不再被任何未删除的行引用的模型名称)"""
+    with engine.begin() as conn:
+        columns = (entity.id, entity.name) if entity is Model else (entity.id,)
+        rows = conn.execute(
+            select(*columns)
+            .where(entity.deleted_at.is_not(None), entity.deleted_at <= cutoff)
+            .order_by(entity.deleted_at)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return 0, set()
+        conn.execute(delete(entity).where(entity.id.in_([row.id for row in rows])))
+        if entity is not Model:
+            return len(rows), set()
+        names = {row.name for row in rows}
+        live = conn.execute(
+            select(Model.name).where(Model.name.in_(names), Model.deleted_at.is_(None)).distinct()
+        ).scalars().all()
+        return len(rows), names - set(live)
+
+def purge_deleted(
+    engine: Engine,
+    remove_storage: Optional[Callable[[str], Any]] = None,
+    retention: float = 0,
+    batch_size: int = 500,
+    max_rows_per_second: float = 0,
+    max_batches: Optional[int] = None,
+) -> Dict[str, Any]:
+    """清理删除时间早于 retention 秒之前的软删除行
+
+    每批一个短事务，删除最多 batch_size 行（走 deleted_at 部分索引），不会长时间占用写锁；
+    max_rows_per_second 大于 0 时在批次之间等待，限制清理速度，避免挤占请求的写入。
+    模型行删除后，名称不再被任何未删除的模型引用时调用 remove_storage 删除模型存储
+    （在事务提交之后执行）。max_batches 限制本次最多处理的批数。
+    """
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=retention)
+    report: Dict[str, Any] = {collection: 0 for collection in PURGE_ENTITIES}
+    report.update({"batches": 0, "storage_removed": 0, "errors": []})
+    for collection, entity in PURGE_ENTITIES.items():
+        while max_batches is None or report["batches"] < max_batches:
+            started = time.perf_counter()
+            purged, names = _purge_batch(engine, entity, cutoff, batch_size)
+            if not purged:
+                break
+            report[collection] += purged
+            report["batches"] += 1
+            for name in sorted(names) if remove_storage is not None else ():
+                try:
+                    if remove_storage(name):
+                        report["storage_removed"] += 1
+                except Exception as e:
+                    report["errors"].append({"name": name, "error": str(e)})
+            if purged < batch_size:
+                break
+            if max_rows_per_second > 0:
+                time.sleep(max(0.0, purged / max_rows_per_second - (time.perf_counter() - started)))
+    if report["batches"]:
+        logger.info(
+            f"Purged {report['projects']} projects and {report['models']} models, "
+            f"removed storage of {report['storage_removed']} models"
+        )
+    return report
+
+def acquire_purge_lock(database_url: str) -> Optional[IO]:
+    """同一数据库只由一个 worker 运行后台清理：对按数据库地址命名的锁文件加进程间排他锁
+
+    返回持有锁的文件，需在进程存活期间保持打开（进程退出时锁自动释放）；锁已被其他 worker
+    持有时返回 None。
+    """
+    digest = hashlib.sha256(database_url.encode()).hexdigest()[:16]
+    lock_file = open(Path(tempfile.gettempdir()) / f"ai_codehub_purge_{digest}.lock", "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        logger.info("Soft delete purge is running in another worker")
+        return None
+    return lock_file
+
+async def run_periodic_purge(
+    engine: Engine,
+    interval: float,
+    remove_storage: Optional[Callable[[str], Any]] = None,
+    **options: Any,
+) -> None:
+    """后台任务：每隔 interval 秒清理一次软删除的行"""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await loop.run_in_executor(None, lambda: purge_deleted(engine, remove_storage, **options))
+        except Exception as e:
+            logger.error(f"Soft delete purge failed: {str(e)}")
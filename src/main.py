@@ -1,12 +1,13 @@
 from fastapi import FastAPI, Depends, HTTPException, status, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, Response, JSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import Optional
 import os
+import asyncio
 from pathlib import Path
 from fastapi.templating import Jinja2Templates
 from fastapi.openapi.docs import get_swagger_ui_html
@@ -17,7 +18,14 @@ from src.api.routers import auth_router
 from src.api.routers.model_router import router as model_router
 from src.api.routers.project_router import router as project_router
 from src.api.routers.example_router import router as example_router
-from src.database import Base, engine, SessionLocal
+from src.api.routers.admin_router import router as admin_router
+from src.api.routers.search_router import router as search_router
+from src.api.routers.change_router import router as change_router
+from src.api.routers.summary_router import router as summary_router
+from src.api.middleware import QueryStatsMiddleware, ReplicaRoutingMiddleware
+from src.database import Base, engine, SessionLocal, async_engine
+from src.database.group_commit import group_commit
+from src.database.replicas import replica_router
 from src.core.security import (
     create_access_token,
     get_password_hash,
@@ -28,6 +36,13 @@ from src.core.security import (
 from src.database.schemas.user import UserCreate, UserInDB, Token
 from src.database.models.user import User
 from src.translations import get_error_response
+from src.models.memory_ledger import MemoryLimitExceeded
+from src.core.password_hasher import PasswordHasherBusy
+from src.models.inference import DeadlineExceeded, RequestCancelled
+from src.models.model_manager import ModelManager
+from src.models.storage_gc import run_periodic_gc
+from src.database.aggregates import run_periodic_reconcile
+from src.database.soft_delete import acquire_purge_lock, run_periodic_purge
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
@@ -43,7 +58,11 @@ app = FastAPI(
         {"name": "auth", "description": "认证相关接口"},
         {"name": "models", "description": "模型相关接口"},
         {"name": "projects", "description": "项目相关接口"},
-        {"name": "examples", "description": "示例相关接口"}
+        {"name": "examples", "description": "示例相关接口"},
+        {"name": "search", "description": "搜索相关接口"},
+        {"name": "changes", "description": "增量同步相关接口"},
+        {"name": "summary", "description": "统计汇总相关接口"},
+        {"name": "admin", "description": "管理相关接口"}
     ]
 )
 
@@ -56,11 +75,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 每个请求的 SQL 语句数量和耗时（Server-Timing 响应头）及 N+1 查询警告
+if settings.QUERY_INSTRUMENTATION:
+    app.add_middleware(QueryStatsMiddleware, n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD)
+# 配置了只读副本时，读请求分配到副本，写请求和写入后的短时间内的读请求使用主库
+if replica_router.enabled:
+    app.add_middleware(ReplicaRoutingMiddleware, router=replica_router)
+
 # Include routers
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["auth"])
 app.include_router(model_router, prefix="/api/v1/models", tags=["models"])
 app.include_router(project_router, prefix="/api/v1/projects", tags=["projects"])
 app.include_router(example_router, prefix="/api/v1", tags=["examples"])
+app.include_router(search_router, prefix="/api/v1/search", tags=["search"])
+app.include_router(change_router, prefix="/api/v1/changes", tags=["changes"])
+app.include_router(summary_router, prefix="/api/v1/summary", tags=["summary"])
+app.include_router(admin_router, prefix="/api/v1/admin", tags=["admin"])
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -68,6 +98,52 @@ app.mount("/components", StaticFiles(directory="static/components"), name="compo
 app.mount("/js", StaticFiles(directory="static/js"), name="js")
 app.mount("/css", StaticFiles(directory="static/css"), name="css")
 
+@app.on_event("startup")
+async def start_storage_gc():
+    """按配置启动模型存储的后台垃圾回收"""
+    if settings.STORAGE_GC_INTERVAL > 0:
+        app.state.storage_gc_task = asyncio.create_task(run_periodic_gc(
+            Path(settings.MODEL_SAVE_PATH),
+            SessionLocal,
+            settings.STORAGE_GC_INTERVAL,
+            min_age=settings.STORAGE_GC_MIN_AGE,
+            batch_size=settings.STORAGE_GC_BATCH_SIZE,
+            pause=settings.STORAGE_GC_PAUSE,
+        ))
+
+@app.on_event("startup")
+async def start_aggregate_reconcile():
+    """按配置启动统计汇总表的定期核对"""
+    if settings.AGGREGATE_RECONCILE_INTERVAL > 0:
+        app.state.aggregate_reconcile_task = asyncio.create_task(run_periodic_reconcile(
+            engine,
+            settings.AGGREGATE_RECONCILE_INTERVAL,
+            batch_size=settings.AGGREGATE_RECONCILE_BATCH_SIZE,
+        ))
+
+@app.on_event("startup")
+async def start_soft_delete_purge():
+    """按配置启动软删除项目和模型的后台清理（同时删除不再使用的模型存储），多个 worker 时只在其中一个运行"""
+    if settings.SOFT_DELETE_PURGE_INTERVAL > 0:
+        app.state.soft_delete_purge_lock = acquire_purge_lock(settings.DATABASE_URL)
+        if app.state.soft_delete_purge_lock is None:
+            return
+        app.state.soft_delete_purge_task = asyncio.create_task(run_periodic_purge(
+            engine,
+            settings.SOFT_DELETE_PURGE_INTERVAL,
+            ModelManager(settings.MODEL_SAVE_PATH).delete_model,
+            retention=settings.SOFT_DELETE_RETENTION,
+            batch_size=settings.SOFT_DELETE_PURGE_BATCH_SIZE,
+            max_rows_per_second=settings.SOFT_DELETE_PURGE_MAX_ROWS_PER_SECOND,
+        ))
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    """提交组提交队列中剩余的写操作，再关闭异步连接池（aiosqlite 的连接线程会阻止进程退出）"""
+    await group_commit.close()
+    await async_engine.dispose()
+    await replica_router.dispose()
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -122,14 +198,6 @@ async def serve_components(path: str):
         return FileResponse(str(component_path))
     raise HTTPException(status_code=404, detail="File not found")
 
-# 依赖项
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 # 配置模板
@@ -137,7 +205,14 @@ templates = Jinja2Templates(directory="static")
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    """处理 HTTP 异常，返回多语言错误消息"""
+    """处理 HTTP 异常：API 请求返回 JSON，页面请求返回多语言错误页；都保留异常的响应头（如 409 时的 ETag）"""
+    if request.url.path.startswith("/api/"):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={"detail": exc.detail},
+            headers=exc.headers,
+        )
+
     lang = request.headers.get("Accept-Language", "zh")
     if lang not in ["en", "zh"]:
         lang = "zh"
@@ -152,9 +227,41 @@ async def http_exception_handler(request: Request, exc: HTTPException):
                 status_code=exc.status_code
             )
         },
-        status_code=exc.status_code
+        status_code=exc.status_code,
+        headers=exc.headers
     )
 
+@app.exception_handler(MemoryLimitExceeded)
+async def memory_limit_exception_handler(request: Request, exc: MemoryLimitExceeded):
+    """模型内存不足时返回 503，提示客户端稍后重试"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    """密码哈希线程池已满时返回 503，提示客户端稍后重试"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exception_handler(request: Request, exc: DeadlineExceeded):
+    """推理请求超过截止时间"""
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": str(exc)},
+    )
+
+@app.exception_handler(RequestCancelled)
+async def cancelled_exception_handler(request: Request, exc: RequestCancelled):
+    """客户端已断开，结果不会被读取"""
+    return JSONResponse(status_code=499, content={"detail": str(exc)})
+
 # 添加用户路由
 @app.get("/api/v1/users/me", response_model=UserInDB)
 async def get_user_me(current_user: User = Depends(get_current_active_user)):
@@ -0,0 +1,143 @@
+from typing import Optional, Dict, Any, List, Sequence, Callable, Awaitable
+import asyncio
+import logging
+import math
+import time
+
+import torch
+from fastapi import HTTPException, Request, status
+
+from src.core.config import settings
+
+class DeadlineExceeded(Exception):
+    """请求的截止时间在推理完成前已过"""
+
+class RequestCancelled(Exception):
+    """推理排队或执行期间客户端已断开连接"""
+
+class Deadline:
+    """请求的截止时间（单调时钟上的绝对时间点），过了这个时间结果不再有用"""
+
+    HEADER = "X-Request-Timeout-Ms"
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.expires_at = time.monotonic() + timeout if timeout else None
+
+    @classmethod
+    def from_request(cls, request: Request, default_timeout_ms: Optional[float] = None) -> "Deadline":
+        """从请求头读取超时时间（毫秒），没有请求头时使用模型的默认超时
+
+        请求头的值必须是正数，0、负数和非数字返回 400，避免请求一到就超时或被当作没有截止时间。
+        """
+        timeout_ms = default_timeout_ms
+        header = request.headers.get(cls.HEADER)
+        if header is not None:
+            try:
+                timeout_ms = float(header)
+            except ValueError:
+                timeout_ms = None
+            if timeout_ms is None or not math.isfinite(timeout_ms) or timeout_ms <= 0:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"{cls.HEADER} 必须是正数（毫秒）",
+                )
+        return cls(timeout_ms / 1000 if timeout_ms else None)
+
+    def remaining(self) -> Optional[float]:
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+def model_timeout_ms(metadata: Optional[Dict[str, Any]]) -> Optional[float]:
+    """模型元数据中的默认超时，没有时使用全局默认值"""
+    if metadata and metadata.get("timeout_ms"):
+        return float(metadata["timeout_ms"])
+    return settings.INFERENCE_DEFAULT_TIMEOUT_MS or None
+
+class InferenceRunner:
+    """限制并发地执行分批前向推理，并支持协作式取消
+
+    在排队前、等待执行槽位期间以及每两批之间检查截止时间和客户端连接，
+    被放弃的请求在下一个批次边界即停止占用推理资源。
+    """
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, max_concurrency: int = 1):
+        self.max_concurrency = max_concurrency
+        self.logger = logging.getLogger(__name__)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.expired = 0
+        self.cancelled = 0
+
+    async def run(
+        self,
+        model: torch.nn.Module,
+        batches: Sequence[torch.Tensor],
+        deadline: Optional[Deadline] = None,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> List[torch.Tensor]:
+        deadline = deadline or Deadline()
+        await self._check(deadline, is_disconnected)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.queued += 1
+        try:
+            await self._acquire(deadline, is_disconnected)
+        finally:
+            self.queued -= 1
+
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            outputs = []
+            for batch in batches:
+                await self._check(deadline, is_disconnected)
+                outputs.append(await loop.run_in_executor(None, self._forward, model, batch))
+            self.completed += 1
+            return outputs
+        finally:
+            self.running -= 1
+            self._semaphore.release()
+
+    async def _acquire(self, deadline: Deadline, is_disconnected: Optional[Callable[[], Awaitable[bool]]]) -> None:
+        while True:
+            remaining = deadline.remaining()
+            timeout = self.POLL_INTERVAL if remaining is None else min(self.POLL_INTERVAL, remaining)
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout)
+                return
+            except asyncio.TimeoutError:
+                await self._check(deadline, is_disconnected)
+
+    async def _check(self, deadline: Deadline, is_disconnected: Optional[Callable[[], Awaitable[bool]]]) -> None:
+        if deadline.expired():
+            self.expired += 1
+            raise DeadlineExceeded("Request deadline exceeded")
+        if is_disconnected is not None and await is_disconnected():
+            self.cancelled += 1
+            raise RequestCancelled("Client disconnected")
+
+    @staticmethod
+    def _forward(model: torch.nn.Module, batch: torch.Tensor) -> torch.Tensor:
+        with torch.no_grad():
+            return model(batch)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "expired": self.expired,
+            "cancelled": self.cancelled,
+        }
+
+inference_runner = InferenceRunner(max_concurrency=settings.INFERENCE_MAX_CONCURRENCY)
@@ -0,0 +1,188 @@
+from typing import Optional, Dict, Any
+from collections import OrderedDict
+import itertools
+import threading
+import logging
+import time
+
+import torch
+
+from src.core.config import settings
+
+class MemoryLimitExceeded(Exception):
+    """Raised when a model cannot be admitted under the configured memory limit."""
+
+    def __init__(self, key: str, requested: int, available: int, retry_after: int):
+        self.key = key
+        self.requested = requested
+        self.available = available
+        self.retry_after = retry_after
+        super().__init__(
+            f"Loading {key} needs {requested} bytes but only {available} bytes are available"
+        )
+
+def resident_bytes(model: torch.nn.Module) -> int:
+    """Bytes held by a module's parameters and buffers, counting shared storage once."""
+    seen = set()
+    total = 0
+    for tensor in list(model.parameters()) + list(model.buffers()):
+        storage = tensor.untyped_storage()
+        key = (storage.data_ptr(), tensor.device)
+        if key in seen:
+            continue
+        seen.add(key)
+        total += storage.nbytes()
+    return total
+
+class MemoryLedger:
+    """Process-wide record of shared models and the bytes they keep resident.
+
+    When admitting a model would exceed ``limit_bytes`` the ledger applies
+    ``policy``: ``evict`` drops least recently used models, ``queue`` waits up to
+    ``queue_timeout`` seconds for other models to be released, and ``reject``
+    fails immediately. A limit of 0 disables admission control.
+
+    Every admitted load holds its own reservation until it is committed or
+    cancelled, so concurrent loads of the same model each count against the
+    limit and the first one committed becomes the shared instance.
+
+    Evicting a model only stops tracking and sharing it: a caller that still
+    holds the instance keeps its memory resident until it drops the reference,
+    so while requests finish with an evicted model actual usage can exceed the
+    limit.
+    """
+
+    POLICIES = ("evict", "queue", "reject")
+
+    def __init__(self, limit_bytes: int = 0, policy: str = "evict", queue_timeout: float = 30.0, retry_after: int = 5):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown memory policy: {policy}")
+        self.limit_bytes = limit_bytes
+        self.policy = policy
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.logger = logging.getLogger(__name__)
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Loads in progress: reservation id -> bytes
+        self._reservations: Dict[int, int] = {}
+        self._reservation_ids = itertools.count(1)
+        self._cond = threading.Condition()
+        self.evictions = 0
+        self.rejections = 0
+
+    @property
+    def used_bytes(self) -> int:
+        return sum(entry["bytes"] for entry in self._entries.values()) + sum(self._reservations.values())
+
+    def get(self, key: str) -> Optional[torch.nn.Module]:
+        with self._cond:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            entry["last_used"] = time.time()
+            return entry["model"]
+
+    def admit(self, key: str, nbytes: int) -> int:
+        """Reserve ``nbytes`` for a load of ``key``, applying the policy.
+
+        Returns a reservation to pass to ``commit`` or ``cancel``. Under the
+        ``queue`` policy this blocks the calling thread for up to
+        ``queue_timeout`` seconds; async code must call it through
+        ``run_in_threadpool`` rather than on the event loop.
+        """
+        with self._cond:
+            if self.limit_bytes and nbytes > self.limit_bytes:
+                self.rejections += 1
+                raise MemoryLimitExceeded(key, nbytes, self.limit_bytes - self.used_bytes, self.retry_after)
+
+            deadline = time.monotonic() + self.queue_timeout
+            while self.limit_bytes and self.used_bytes + nbytes > self.limit_bytes:
+                if self.policy == "evict" and self._evict_one_locked():
+                    continue
+                remaining = deadline - time.monotonic()
+                if self.policy != "queue" or remaining <= 0:
+                    self.rejections += 1
+                    raise MemoryLimitExceeded(key, nbytes, self.limit_bytes - self.used_bytes, self.retry_after)
+                self._cond.wait(remaining)
+
+            reservation = next(self._reservation_ids)
+            self._reservations[reservation] = nbytes
+            return reservation
+
+    def commit(self, reservation: int, key: str, model: torch.nn.Module) -> torch.nn.Module:
+        """Replace a reservation with the loaded model at its measured size.
+
+        Returns the shared instance for ``key``: ``model``, or the instance a
+        concurrent load committed first (``model`` is then discarded).
+        """
+        nbytes = resident_bytes(model)
+        with self._cond:
+            self._reservations.pop(reservation, None)
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {
+                    "bytes": nbytes,
+                    "model": model,
+                    "device": str(next(model.parameters(), torch.empty(0)).device),
+                    "last_used": time.time(),
+                }
+            self._entries.move_to_end(key)
+            self._cond.notify_all()
+            return entry["model"]
+
+    def cancel(self, reservation: int) -> None:
+        """Give back a reservation whose load failed."""
+        with self._cond:
+            self._reservations.pop(reservation, None)
+            self._cond.notify_all()
+
+    def release(self, key: str) -> bool:
+        with self._cond:
+            released = self._entries.pop(key, None) is not None
+            self._cond.notify_all()
+        return released
+
+    def clear(self) -> None:
+        with self._cond:
+            self._entries.clear()
+            self._reservations.clear()
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "limit_bytes": self.limit_bytes,
+                "used_bytes": self.used_bytes,
+                "reserved_bytes": sum(self._reservations.values()),
+                "policy": self.policy,
+                "evictions": self.evictions,
+                "rejections": self.rejections,
+                "models": [
+                    {
+                        "key": key,
+                        "bytes": entry["bytes"],
+                        "device": entry["device"],
+                        "last_used": entry["last_used"],
+                    }
+                    for key, entry in self._entries.items()
+                ],
+            }
+
+    def _evict_one_locked(self) -> bool:
+        # Drops the ledger's reference only; the memory is freed once callers still using the model let go of it.
+        # Reservations are loads in progress and cannot be evicted
+        if not self._entries:
+            return False
+        key, entry = self._entries.popitem(last=False)
+        self.evictions += 1
+        self.logger.info(f"Evicted model {key} to free {entry['bytes']} bytes")
+        return True
+
+memory_ledger = MemoryLedger(
+    limit_bytes=settings.MODEL_MEMORY_LIMIT_MB * 1024 * 1024,
+    policy=settings.MODEL_MEMORY_POLICY,
+    queue_timeout=settings.MODEL_MEMORY_QUEUE_TIMEOUT,
+    retry_after=settings.MODEL_MEMORY_RETRY_AFTER,
+)
@@ -0,0 +1,322 @@
+from typing import Optional, Dict, Any, List, BinaryIO, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, Future
+from collections import deque
+from pathlib import Path
+import hashlib
+import io
+import json
+import logging
+import os
+import queue
+import tarfile
+import threading
+import time
+
+CHUNK_SIZE = 1024 * 1024
+QUEUE_CHUNKS = 8
+MANIFEST_NAME = "MANIFEST.json"
+COMPRESSIONS = ("", "gz", "bz2", "xz")
+PARTIAL_SUFFIX = ".partial"
+
+logger = logging.getLogger(__name__)
+
+class ArchiveError(Exception):
+    """Raised for malformed archives or unsafe member paths."""
+
+class _PrefetchedFile(io.RawIOBase):
+    """File-like view of a file that a pool thread reads and hashes ahead of the tar writer."""
+
+    def __init__(self, path: Path, size: int):
+        self.path = path
+        self.size = size
+        self.sha256 = hashlib.sha256()
+        self._queue: "queue.Queue" = queue.Queue(QUEUE_CHUNKS)
+        self._buffer = bytearray()
+        self._eof = False
+        self._cancelled = threading.Event()
+
+    def fill(self) -> None:
+        try:
+            remaining = self.size
+            with open(self.path, "rb") as f:
+                while remaining > 0 and not self._cancelled.is_set():
+                    chunk = f.read(min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    self.sha256.update(chunk)
+                    self._put(chunk)
+            self._put(None)
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item: Any) -> None:
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        # tarfile expects exactly ``size`` bytes until the end of the member
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                raise item
+            if item is None:
+                self._eof = True
+            else:
+                self._buffer += item
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+class _PooledWriter:
+    """Writes a member to a partial file on a pool thread, hashing in the same pass."""
+
+    def __init__(self, executor: ThreadPoolExecutor, partial_path: Path):
+        self.partial_path = partial_path
+        self._queue: "queue.Queue" = queue.Queue(QUEUE_CHUNKS)
+        self.future: Future = executor.submit(self._drain)
+
+    def put(self, chunk: Optional[bytes]) -> None:
+        self._queue.put(chunk)
+
+    def _drain(self) -> str:
+        sha256 = hashlib.sha256()
+        self.partial_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.partial_path, "wb") as f:
+            while True:
+                chunk = self._queue.get()
+                if chunk is None:
+                    break
+                sha256.update(chunk)
+                f.write(chunk)
+        return sha256.hexdigest()
+
+def _iter_model_files(storage_path: Path, model_names: Iterable[str]) -> List[Path]:
+    files = []
+    for name in model_names:
+        model_path = storage_path / name
+        if not model_path.is_dir():
+            raise FileNotFoundError(f"Model {name} not found in {storage_path}")
+        files.extend(sorted(
+            path for path in model_path.rglob("*")
+            if path.is_file() and not path.name.endswith(PARTIAL_SUFFIX)
+        ))
+    return files
+
+def _safe_target(storage_path: Path, member_name: str) -> Path:
+    root = storage_path.resolve()
+    target = (root / member_name).resolve()
+    if os.path.isabs(member_name) or root not in target.parents or target.parent == root:
+        raise ArchiveError(f"Unsafe archive member: {member_name}")
+    return target
+
+def export_models(
+    storage_path: Path,
+    model_names: Iterable[str],
+    fileobj: BinaryIO,
+    compression: str = "",
+    workers: int = 4,
+) -> Dict[str, Any]:
+    """Stream ``model_names`` from ``storage_path`` into a tar archive on ``fileobj``.
+
+    Files are read and hashed on a pool of ``workers`` threads, up to ``workers``
+    files ahead of the writer. A manifest of sizes and sha256 checksums is
+    appended as the last member.
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression}")
+    storage_path = Path(storage_path)
+    model_names = list(model_names)
+    files = _iter_model_files(storage_path, model_names)
+    manifest: Dict[str, Any] = {"created_at": time.time(), "models": model_names, "files": {}}
+    total_bytes = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor, \
+            tarfile.open(fileobj=fileobj, mode=f"w|{compression}") as tar:
+        pending: deque = deque()
+        remaining = iter(files)
+
+        def prefetch() -> None:
+            path = next(remaining, None)
+            if path is not None:
+                stat = path.stat()
+                reader = _PrefetchedFile(path, stat.st_size)
+                executor.submit(reader.fill)
+                pending.append((path, stat, reader))
+
+        for _ in range(workers):
+            prefetch()
+        try:
+            while pending:
+                path, stat, reader = pending[0]
+                arcname = path.relative_to(storage_path).as_posix()
+                info = tarfile.TarInfo(arcname)
+                info.size = stat.st_size
+                info.mtime = int(stat.st_mtime)
+                info.mode = 0o644
+                tar.addfile(info, fileobj=reader)
+                pending.popleft()
+                manifest["files"][arcname] = {"size": stat.st_size, "mtime": info.mtime, "sha256": reader.sha256.hexdigest()}
+                total_bytes += stat.st_size
+                prefetch()
+        except BaseException:
+            # Unblock readers still filling so the pool can shut down
+            for _, _, reader in pending:
+                reader.cancel()
+            raise
+
+        data = json.dumps(manifest, indent=2).encode()
+        info = tarfile.TarInfo(MANIFEST_NAME)
+        info.size = len(data)
+        info.mtime = int(manifest["created_at"])
+        tar.addfile(info, fileobj=io.BytesIO(data))
+
+    logger.info(f"Exported {len(files)} files ({total_bytes} bytes) for {len(model_names)} models")
+    return {"models": model_names, "files": len(files), "bytes": total_bytes}
+
+class _ExportCancelled(Exception):
+    """Raised on the export thread once the consumer of :func:`stream_export` has gone away."""
+
+def _put_unless_cancelled(chunks: "queue.Queue", item: Any, cancelled: threading.Event) -> None:
+    while True:
+        if cancelled.is_set():
+            raise _ExportCancelled()
+        try:
+            chunks.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+class _QueueWriter(io.RawIOBase):
+    def __init__(self, chunks: "queue.Queue", cancelled: threading.Event):
+        self._chunks = chunks
+        self._cancelled = cancelled
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        _put_unless_cancelled(self._chunks, bytes(data), self._cancelled)
+        return len(data)
+
+def stream_export(
+    storage_path: Path,
+    model_names: Iterable[str],
+    compression: str = "",
+    workers: int = 4,
+) -> Iterator[bytes]:
+    """Run :func:`export_models` on a background thread and yield the archive bytes.
+
+    Missing models are reported before any bytes are produced. An error during
+    the export is re-raised from the iterator instead of ending the archive
+    early, and closing the iterator stops the export thread.
+    """
+    model_names = list(model_names)
+    _iter_model_files(Path(storage_path), model_names)
+    chunks: "queue.Queue" = queue.Queue(QUEUE_CHUNKS * 4)
+    cancelled = threading.Event()
+
+    def run() -> None:
+        try:
+            export_models(storage_path, model_names, _QueueWriter(chunks, cancelled), compression, workers)
+            _put_unless_cancelled(chunks, None, cancelled)
+        except _ExportCancelled:
+            logger.info(f"Export of models {model_names} cancelled by the client")
+        except Exception as e:
+            logger.error(f"Error exporting models {model_names}: {str(e)}")
+            try:
+                _put_unless_cancelled(chunks, e, cancelled)
+            except _ExportCancelled:
+                pass
+
+    def iter_chunks() -> Iterator[bytes]:
+        threading.Thread(target=run, daemon=True).start()
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            cancelled.set()
+
+    return iter_chunks()
+
+def import_models(storage_path: Path, fileobj: BinaryIO, workers: int = 4) -> Dict[str, Any]:
+    """Unpack an archive produced by :func:`export_models` into ``storage_path``.
+
+    Files whose size and mtime already match are skipped. Others are written to
+    ``.partial`` files on a thread pool and hashed while written; they replace
+    the target only after their checksum matches the manifest.
+    """
+    storage_path = Path(storage_path)
+    storage_path.mkdir(parents=True, exist_ok=True)
+    manifest: Optional[Dict[str, Any]] = None
+    written: Dict[str, Any] = {}
+    skipped: List[str] = []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor, \
+            tarfile.open(fileobj=fileobj, mode="r|*") as tar:
+        for member in tar:
+            if member.name == MANIFEST_NAME:
+                manifest = json.load(tar.extractfile(member))
+                continue
+            if not member.isfile():
+                continue
+            target = _safe_target(storage_path, member.name)
+            if target.exists():
+                stat = target.stat()
+                if stat.st_size == member.size and int(stat.st_mtime) == member.mtime:
+                    skipped.append(member.name)
+                    continue
+
+            writer = _PooledWriter(executor, target.with_name(target.name + PARTIAL_SUFFIX))
+            source = tar.extractfile(member)
+            try:
+                while True:
+                    chunk = source.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    writer.put(chunk)
+            finally:
+                # Always terminate the writer so the pool can shut down on errors
+                writer.put(None)
+            written[member.name] = (target, writer, member.mtime)
+
+        if manifest is None:
+            for _, writer, _ in written.values():
+                writer.future.result()
+                writer.partial_path.unlink()
+            raise ArchiveError("Archive has no manifest")
+
+        imported: List[str] = []
+        failed: List[str] = []
+        for name, (target, writer, mtime) in written.items():
+            digest = writer.future.result()
+            expected = manifest["files"].get(name, {}).get("sha256")
+            if digest != expected:
+                writer.partial_path.unlink()
+                failed.append(name)
+                logger.error(f"Checksum mismatch for {name}")
+                continue
+            os.replace(writer.partial_path, target)
+            os.utime(target, (mtime, mtime))
+            imported.append(name)
+
+    models = sorted({name.split("/", 1)[0] for name in manifest["files"]})
+    logger.info(f"Imported {len(imported)} files, skipped {len(skipped)}, failed {len(failed)}")
+    return {"models": models, "imported": imported, "skipped": skipped, "failed": failed}
@@ -1,8 +1,12 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, BinaryIO, List, Iterator
 import torch
 from pathlib import Path
 import json
 import logging
+import shutil
+
+from src.models.memory_ledger import memory_ledger, resident_bytes, MemoryLimitExceeded
+from src.models import model_archive
 
 class ModelManager:
     def __init__(self, storage_path: str = "models/", device: str = None):
@@ -17,11 +21,20 @@ class ModelManager:
             self.device = torch.device(device)
         self.logger.info(f"Using device: {self.device}")
 
+    def _ledger_key(self, model_name: str) -> str:
+        return str((self.storage_path / model_name).resolve())
+
+    def _is_on_device(self, model: torch.nn.Module) -> bool:
+        return all(param.device.type == self.device.type for param in model.parameters())
+
     def save_model(self, model: torch.nn.Module, model_name: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
         try:
             model_path = self.storage_path / model_name
             model_path.mkdir(exist_ok=True)
             
+            # A loaded copy of the previous weights is now stale
+            memory_ledger.release(self._ledger_key(model_name))
+            
             # Move model to CPU before saving
             model = model.to("cpu")
             
@@ -60,6 +73,62 @@ class ModelManager:
             self.logger.error(f"Error loading model {model_name}: {str(e)}")
             return None
 
+    def get_shared_model(self, model_name: str, model_class: torch.nn.Module) -> Optional[torch.nn.Module]:
+        """Return the process-wide shared instance of a model for inference, loading it if needed.
+
+        The instance is tracked by the memory ledger and handed to every caller,
+        so it is put in eval mode with gradients disabled, and callers must not
+        move it, train it or change its weights; use load_model for a private
+        copy. Eviction from the ledger does not free an instance callers still
+        hold. Loading blocks (and may wait under the queue policy), so async
+        code should call this through run_in_threadpool.
+        """
+        try:
+            model_path = self.storage_path / model_name
+            if not model_path.exists():
+                self.logger.error(f"Model {model_name} not found")
+                return None
+            
+            key = self._ledger_key(model_name)
+            cached = memory_ledger.get(key)
+            if cached is not None:
+                if isinstance(cached, model_class) and self._is_on_device(cached):
+                    return cached
+                # Loaded as another class or on another device: replace it
+                memory_ledger.release(key)
+            
+            # The serialized state dict size is a close estimate of resident bytes
+            reservation = memory_ledger.admit(key, (model_path / "weights.pt").stat().st_size)
+            try:
+                model = model_class()
+                model.load_state_dict(torch.load(model_path / "weights.pt"))
+                model = model.to(self.device).eval().requires_grad_(False)
+            except Exception:
+                memory_ledger.cancel(reservation)
+                raise
+            
+            shared = memory_ledger.commit(reservation, key, model)
+            self.logger.info(f"Model {model_name} shared on {self.device} ({resident_bytes(shared)} bytes)")
+            return shared
+        except MemoryLimitExceeded:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error loading model {model_name}: {str(e)}")
+            return None
+
+    def unload_model(self, model_name: str) -> bool:
+        return memory_ledger.release(self._ledger_key(model_name))
+
+    def delete_model(self, model_name: str) -> bool:
+        """Remove a model's directory from storage, releasing any loaded copy first."""
+        model_path = self.storage_path / model_name
+        if not model_path.is_dir() or model_path.resolve().parent != self.storage_path.resolve():
+            return False
+        memory_ledger.release(self._ledger_key(model_name))
+        shutil.rmtree(model_path)
+        self.logger.info(f"Model {model_name} deleted from storage")
+        return True
+
     def get_model_metadata(self, model_name: str) -> Optional[Dict[str, Any]]:
         try:
             metadata_path = self.storage_path / model_name / "metadata.json"
@@ -77,4 +146,17 @@ class ModelManager:
             return [d.name for d in self.storage_path.iterdir() if d.is_dir()]
         except Exception as e:
             self.logger.error(f"Error listing models: {str(e)}")
-            return [] 
\ No newline at end of file
+            return []
+
+    def export_models(self, model_names: List[str], fileobj: BinaryIO, compression: str = "", workers: int = 4) -> Dict[str, Any]:
+        return model_archive.export_models(self.storage_path, model_names, fileobj, compression, workers)
+
+    def stream_export(self, model_names: List[str], compression: str = "", workers: int = 4) -> Iterator[bytes]:
+        return model_archive.stream_export(self.storage_path, model_names, compression, workers)
+
+    def import_models(self, fileobj: BinaryIO, workers: int = 4) -> Dict[str, Any]:
+        report = model_archive.import_models(self.storage_path, fileobj, workers)
+        # Weights on disk may have changed underneath any loaded copy
+        for model_name in report["models"]:
+            self.unload_model(model_name)
+        return report
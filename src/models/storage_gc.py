@@ -0,0 +1,170 @@
+from typing import Dict, Any, List, Iterable, Set
+from pathlib import Path
+import asyncio
+import json
+import logging
+import shutil
+import time
+
+from sqlalchemy.orm import Session
+
+from src.database import Model
+from src.models.memory_ledger import memory_ledger
+
+TEMP_SUFFIXES = (".partial", ".tmp")
+
+logger = logging.getLogger(__name__)
+
+def referenced_model_names(db: Session) -> Set[str]:
+    """Names of models that still have a row in the Model table."""
+    return {name for (name,) in db.query(Model.name).distinct()}
+
+def _size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+def _mtime(path: Path) -> float:
+    if path.is_file():
+        return path.stat().st_mtime
+    return max([path.stat().st_mtime] + [f.stat().st_mtime for f in path.rglob("*")])
+
+def _is_catalog_entry(model_path: Path) -> bool:
+    metadata_path = model_path / "metadata.json"
+    if metadata_path.exists():
+        try:
+            with open(metadata_path, "r") as f:
+                json.load(f)
+        except (OSError, ValueError):
+            return False
+        return True
+    return (model_path / "weights.pt").exists()
+
+def _catalog_file_paths(model_dirs: Iterable[Path]) -> Set[Path]:
+    referenced = set()
+    for model_path in model_dirs:
+        try:
+            with open(model_path / "metadata.json", "r") as f:
+                file_path = json.load(f).get("file_path")
+        except (OSError, ValueError, AttributeError):
+            continue
+        if file_path:
+            referenced.add(Path(file_path).resolve())
+    return referenced
+
+def find_orphans(
+    storage_path: Path,
+    referenced_names: Iterable[str],
+    min_age: float = 3600,
+    keep_catalog_entries: bool = False,
+) -> List[Dict[str, Any]]:
+    """Compare the storage tree against the Model table.
+
+    The Model table is the source of truth: candidates are model directories
+    without a Model row (including those left behind by deleted rows), stale
+    temporary files inside the kept directories, and loose files at the
+    storage root that no kept directory's metadata.json points to. With
+    ``keep_catalog_entries`` a directory holding a readable metadata.json or
+    a weights.pt is kept even without a Model row. Anything modified within
+    ``min_age`` seconds is left alone so in-progress saves and uploads are
+    not touched.
+    """
+    storage_path = Path(storage_path)
+    referenced_names = set(referenced_names)
+    cutoff = time.time() - min_age
+    orphans = []
+    kept_dirs = []
+
+    entries = sorted(storage_path.iterdir())
+    for path in entries:
+        if not path.is_dir():
+            continue
+        referenced = path.name in referenced_names or (keep_catalog_entries and _is_catalog_entry(path))
+        if referenced or _mtime(path) >= cutoff:
+            kept_dirs.append(path)
+        if not referenced:
+            if _mtime(path) < cutoff:
+                orphans.append({"path": path, "kind": "directory", "bytes": _size(path)})
+            continue
+        for temp in path.rglob("*"):
+            if temp.is_file() and temp.name.endswith(TEMP_SUFFIXES) and temp.stat().st_mtime < cutoff:
+                orphans.append({"path": temp, "kind": "temp", "bytes": temp.stat().st_size})
+
+    catalog_files = _catalog_file_paths(kept_dirs)
+    for path in entries:
+        if not path.is_file():
+            continue
+        if path.resolve() in catalog_files or path.stat().st_mtime >= cutoff:
+            continue
+        kind = "temp" if path.name.endswith(TEMP_SUFFIXES) else "file"
+        orphans.append({"path": path, "kind": kind, "bytes": path.stat().st_size})
+    return orphans
+
+def collect_garbage(
+    storage_path: Path,
+    referenced_names: Iterable[str],
+    dry_run: bool = True,
+    min_age: float = 3600,
+    keep_catalog_entries: bool = False,
+    batch_size: int = 100,
+    pause: float = 0.1,
+) -> Dict[str, Any]:
+    """Find orphans and, unless ``dry_run``, delete them ``batch_size`` at a time.
+
+    Sleeping ``pause`` seconds between batches keeps deletion I/O from starving
+    the serving path.
+    """
+    storage_path = Path(storage_path)
+    orphans = find_orphans(storage_path, referenced_names, min_age, keep_catalog_entries)
+    report: Dict[str, Any] = {
+        "dry_run": dry_run,
+        "candidates": [
+            {"path": str(o["path"].relative_to(storage_path)), "kind": o["kind"], "bytes": o["bytes"]}
+            for o in orphans
+        ],
+        "candidate_bytes": sum(o["bytes"] for o in orphans),
+        "removed": 0,
+        "reclaimed_bytes": 0,
+        "errors": [],
+    }
+    if dry_run:
+        return report
+
+    for start in range(0, len(orphans), batch_size):
+        if start:
+            time.sleep(pause)
+        for orphan in orphans[start:start + batch_size]:
+            path = orphan["path"]
+            try:
+                if orphan["kind"] == "directory":
+                    memory_ledger.release(str(path.resolve()))
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+            except OSError as e:
+                report["errors"].append({"path": str(path), "error": str(e)})
+                continue
+            report["removed"] += 1
+            report["reclaimed_bytes"] += orphan["bytes"]
+
+    logger.info(f"Storage GC removed {report['removed']} items, reclaimed {report['reclaimed_bytes']} bytes")
+    return report
+
+async def run_periodic_gc(storage_path: Path, session_factory, interval: float, **options: Any) -> None:
+    """Background task that collects garbage every ``interval`` seconds."""
+    loop = asyncio.get_running_loop()
+
+    def run_once() -> Dict[str, Any]:
+        db = session_factory()
+        try:
+            names = referenced_model_names(db)
+        finally:
+            db.close()
+        return collect_garbage(storage_path, names, dry_run=False, **options)
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await loop.run_in_executor(None, run_once)
+        except Exception as e:
+            logger.error(f"Storage GC failed: {str(e)}")
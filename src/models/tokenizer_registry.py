@@ -0,0 +1,201 @@
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+from collections import OrderedDict
+from pathlib import Path
+import asyncio
+import threading
+import logging
+
+import torch
+from transformers import AutoTokenizer
+
+from src.core.config import settings
+
+DEFAULT_BUCKETS = (16, 32, 64, 128, 256, 512)
+
+class TokenizerRegistry:
+    """从本地模型存储按名称加载分词器（每个只加载一次），并用 LRU 缓存常见文本的 token id"""
+
+    def __init__(
+        self,
+        storage_path: str = "models/",
+        cache_size: int = 10000,
+        buckets: Sequence[int] = DEFAULT_BUCKETS,
+    ):
+        self.storage_path = Path(storage_path)
+        self.cache_size = cache_size
+        self.buckets = tuple(sorted(buckets))
+        self.logger = logging.getLogger(__name__)
+
+        self._tokenizers: Dict[str, Any] = {}
+        self._load_lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, str], List[int]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str):
+        """返回已加载的分词器，未加载时从 storage_path 下的同名目录加载
+
+        名称必须是 storage_path 下的一级目录，包含 .. 或绝对路径等指向存储目录之外的名称抛出 ValueError。
+        """
+        tokenizer = self._tokenizers.get(name)
+        if tokenizer is not None:
+            return tokenizer
+        with self._load_lock:
+            tokenizer = self._tokenizers.get(name)
+            if tokenizer is None:
+                tokenizer_path = (self.storage_path / name).resolve()
+                if tokenizer_path.parent != self.storage_path.resolve():
+                    raise ValueError(f"Invalid tokenizer name: {name}")
+                if not tokenizer_path.exists():
+                    raise FileNotFoundError(f"Tokenizer {name} not found in {self.storage_path}")
+                tokenizer = AutoTokenizer.from_pretrained(str(tokenizer_path), local_files_only=True)
+                self._tokenizers[name] = tokenizer
+                self.logger.info(f"Tokenizer {name} loaded from {tokenizer_path}")
+        return tokenizer
+
+    def unload(self, name: str) -> bool:
+        with self._load_lock:
+            removed = self._tokenizers.pop(name, None) is not None
+        with self._cache_lock:
+            for key in [key for key in self._cache if key[0] == name]:
+                del self._cache[key]
+        return removed
+
+    def bucket_length(self, length: int) -> int:
+        """能容纳 length 的最小长度桶，超过最大的桶时取最大的桶"""
+        for bucket in self.buckets:
+            if length <= bucket:
+                return bucket
+        return self.buckets[-1]
+
+    def encode(self, name: str, texts: Sequence[str]) -> List[List[int]]:
+        """texts 的 token id；未命中缓存的文本（去重后）在一次批量调用中分词"""
+        results: List[Optional[List[int]]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}
+        with self._cache_lock:
+            for i, text in enumerate(texts):
+                ids = self._cache.get((name, text))
+                if ids is not None:
+                    self._cache.move_to_end((name, text))
+                    results[i] = ids
+                    self.hits += 1
+                else:
+                    missing.setdefault(text, []).append(i)
+                    self.misses += 1
+
+        if missing:
+            tokenizer = self.get(name)
+            unique_texts = list(missing)
+            encoded = tokenizer(
+                unique_texts,
+                truncation=True,
+                max_length=self.buckets[-1],
+                padding=False,
+            )["input_ids"]
+            with self._cache_lock:
+                for text, ids in zip(unique_texts, encoded):
+                    for i in missing[text]:
+                        results[i] = ids
+                    self._cache[(name, text)] = ids
+                    self._cache.move_to_end((name, text))
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return results
+
+    def pad(self, name: str, batch_ids: List[List[int]]) -> Dict[str, torch.Tensor]:
+        """把一批 token id 右侧补齐到所在的长度桶，使各次调用的张量形状重复出现"""
+        pad_id = self.get(name).pad_token_id or 0
+        length = self.bucket_length(max((len(ids) for ids in batch_ids), default=1))
+        input_ids = torch.full((len(batch_ids), length), pad_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(batch_ids), length), dtype=torch.long)
+        for row, ids in enumerate(batch_ids):
+            ids = ids[:length]
+            input_ids[row, :len(ids)] = torch.tensor(ids, dtype=torch.long)
+            attention_mask[row, :len(ids)] = 1
+        return {"input_ids": input_ids, "attention_mask": attention_mask}
+
+    def tokenize(self, name: str, texts: Sequence[str]) -> Dict[str, torch.Tensor]:
+        return self.pad(name, self.encode(name, texts))
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "loaded": sorted(self._tokenizers),
+            "cache_entries": len(self._cache),
+            "cache_size": self.cache_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+class BatchTokenizer:
+    """把并发的单条文本分词请求合并为批量的 registry 调用
+
+    同一分词器的请求在 max_wait_ms 内或达到 max_batch_size 条时合为一批，在线程池中分词。
+    """
+
+    def __init__(self, registry: TokenizerRegistry, max_batch_size: int = 64, max_wait_ms: float = 2.0):
+        self.registry = registry
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._pending: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+        self._flushers: Dict[str, asyncio.Task] = {}
+        self._running: set = set()
+
+    async def encode(self, name: str, text: str) -> List[int]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(name, [])
+        pending.append((text, future))
+        if len(pending) >= self.max_batch_size:
+            self._flush(name)
+        elif name not in self._flushers:
+            self._flushers[name] = loop.create_task(self._flush_later(name))
+        return await future
+
+    async def tokenize(self, name: str, texts: Sequence[str]) -> Dict[str, torch.Tensor]:
+        batch_ids = await asyncio.gather(*(self.encode(name, text) for text in texts))
+        return self.registry.pad(name, list(batch_ids))
+
+    async def _flush_later(self, name: str) -> None:
+        await asyncio.sleep(self.max_wait)
+        self._flushers.pop(name, None)
+        self._flush(name)
+
+    def _flush(self, name: str) -> None:
+        batch = self._pending.pop(name, [])
+        flusher = self._flushers.pop(name, None)
+        if flusher is not None and flusher is not asyncio.current_task():
+            flusher.cancel()
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(name, batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, name: str, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            # 快速分词器执行时释放 GIL，批量分词放到线程池中执行，不阻塞事件循环
+            encoded = await asyncio.get_running_loop().run_in_executor(
+                None, self.registry.encode, name, texts
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), ids in zip(batch, encoded):
+            if not future.done():
+                future.set_result(ids)
+
+# 进程内共享的分词器和编码缓存，供模型路由的分词接口使用
+tokenizer_registry = TokenizerRegistry(
+    storage_path=settings.MODEL_SAVE_PATH,
+    cache_size=settings.TOKENIZER_CACHE_SIZE,
+)
+batch_tokenizer = BatchTokenizer(
+    tokenizer_registry,
+    max_batch_size=settings.TOKENIZER_BATCH_SIZE,
+    max_wait_ms=settings.TOKENIZER_BATCH_WAIT_MS,
+)
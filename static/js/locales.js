@@ -15,6 +15,7 @@ const locales = {
         'create': 'Create',
         'search': 'Search',
         'loading': 'Loading...',
+        'load_more': 'Load more',
         'error': 'Error',
         'success': 'Success',
         'warning': 'Warning',
@@ -146,6 +147,7 @@ const locales = {
         'create': '创建',
         'search': '搜索',
         'loading': '加载中...',
+        'load_more': '加载更多',
         'error': '错误',
         'success': '成功',
         'warning': '警告',
@@ -4,9 +4,24 @@ import logging
 import sys
 import platform
 import os
+import asyncio
 import subprocess
 from pathlib import Path
 
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.api.listing_cache import listing_cache
+from src.core.security import create_access_token
+from src.core.user_cache import user_cache
+from src.database import Base, User, get_db
+from src.database.config import to_async_url
+from src.database.pagination import owner_counts
+from src.main import app
+
 # Configure logging for tests
 logging.basicConfig(
     level=logging.INFO,
@@ -129,4 +144,82 @@ def test_device():
 @pytest.fixture(scope="session")
 def project_root():
     """Provide project root directory"""
-    return Path(__file__).parent.parent 
\ No newline at end of file
+    return Path(__file__).parent.parent
+
+class ApiClient:
+    """Calls src.main.app in-process as a seeded user; see the api_client fixture
+
+    asgi is what requests are sent to; a test can wrap app in extra middleware there.
+    """
+
+    def __init__(self, app, url, engine, async_engine):
+        self.app = app
+        self.asgi = app
+        self.url = url
+        self.engine = engine
+        self.async_engine = async_engine
+        # One token per user, like a real client; tokens minted per call differ once the second changes
+        self.tokens = {}
+
+    def __call__(self, method, path, json=None, headers=None, user="owner"):
+        if user not in self.tokens:
+            self.tokens[user] = create_access_token({"sub": user})
+
+        async def run():
+            transport = httpx.ASGITransport(app=self.asgi)
+            auth = {"Authorization": f"Bearer {self.tokens[user]}"}
+            async with httpx.AsyncClient(transport=transport, base_url="http://test", headers=auth) as http:
+                return await http.request(method, path, json=json, headers=headers)
+        return asyncio.run(run())
+
+@pytest.fixture
+def api_client(tmp_path):
+    """Factory for clients of src.main.app backed by a fresh SQLite file in tmp_path
+
+    api_client(users, override_db) creates the schema, seeds the users and overrides
+    get_db on the app, so requests go through the app's middleware and exception
+    handlers. With override_db=False get_db is left alone for a test that routes
+    sessions itself (e.g. by wrapping client.asgi in ReplicaRoutingMiddleware).
+    The startup tasks are not run: they work on the configured database, not this one.
+    """
+    created = []
+    # Test modules may install their own override at import time (test_auth); restore it afterwards
+    previous = app.dependency_overrides.get(get_db)
+
+    def make(users=("owner", "other"), override_db=True):
+        url = f"sqlite:///{tmp_path / f'api{len(created)}.db'}"
+        engine = create_engine(url)
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as db:
+            db.add_all([User(username=username, hashed_password="x") for username in users])
+            db.commit()
+
+        async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+        session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+        async def override_get_db():
+            async with session_factory() as db:
+                yield db
+
+        if override_db:
+            app.dependency_overrides[get_db] = override_get_db
+        else:
+            app.dependency_overrides.pop(get_db, None)
+        client = ApiClient(app, url, engine, async_engine)
+        created.append(client)
+        return client
+
+    user_cache.clear()
+    owner_counts.clear()
+    listing_cache.clear()
+    yield make
+    if previous is None:
+        app.dependency_overrides.pop(get_db, None)
+    else:
+        app.dependency_overrides[get_db] = previous
+    for client in created:
+        client.engine.dispose()
+        asyncio.run(client.async_engine.dispose())
+    user_cache.clear()
+    owner_counts.clear()
+    listing_cache.clear()
@@ -1,31 +1,36 @@
+import os
+import tempfile
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 from src.main import app
 from src.database import Base, get_db
+from src.database.config import to_async_url
 from src.database.models.user import User
 from src.core.config import settings
 from src.core.security import get_password_hash, create_access_token
+from src.core.user_cache import user_cache
 
-# 创建测试数据库
-SQLALCHEMY_DATABASE_URL = "sqlite://"
+# 创建测试数据库（同步会话用于准备数据，异步会话供路由使用，因此使用同一个文件数据库）
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(tempfile.gettempdir(), 'ai_codehub_test_auth.db')}"
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def override_get_db():
-    db = TestingSessionLocal()
-    try:
+# TestClient 可能在不同的事件循环中处理请求，异步连接不做池化
+async_engine = create_async_engine(to_async_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+async def override_get_db():
+    async with TestingAsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 app.dependency_overrides[get_db] = override_get_db
 
@@ -49,7 +54,8 @@ def session():
 
 @pytest.fixture(autouse=True)
 def setup_database():
-    """自动设置和清理数据库"""
+    """自动设置和清理数据库（同时清空用户缓存，避免沿用上一个测试的用户）"""
+    user_cache.clear()
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
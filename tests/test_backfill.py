@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.orm import Session
+
+from src.database import Base, Project, User
+from src.database.backfill import BACKFILL_PROGRESS_TABLE, backfill, progress_table
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'backfill.db'}")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add(User(username="owner", hashed_password="x"))
+        db.commit()
+    with engine.begin() as conn:
+        # Sparse ids, every third row still missing its status
+        conn.execute(insert(Project), [
+            {"id": i * 10, "name": str(i), "owner_id": 1, "status": "" if i % 3 == 0 else "archived"}
+            for i in range(1, 31)
+        ])
+    yield engine
+    engine.dispose()
+
+def statuses(engine):
+    with engine.connect() as conn:
+        return dict(conn.execute(select(Project.id, Project.status)).all())
+
+def test_backfill_updates_in_primary_key_batches(engine):
+    report = backfill(engine, "projects_status", "projects", {"status": "active"}, "status = ''", batch_size=4)
+    assert (report["rows"], report["batches"], report["last_id"]) == (10, 8, 300)
+
+    after = statuses(engine)
+    assert sorted(after.values()).count("active") == 10
+    assert "" not in after.values()
+    with engine.connect() as conn:
+        assert conn.execute(select(progress_table)).all() == []
+        # The aggregate triggers moved the counts along with the rows
+        counts = dict(conn.execute(text(
+            "SELECT value, count FROM owner_aggregates WHERE collection = 'projects' AND count != 0"
+        )).all())
+    assert counts == {"active": 10, "archived": 20}
+
+    assert backfill(engine, "projects_status", "projects", {"status": "active"}, "status = ''")["rows"] == 0
+
+def test_backfill_resumes_after_the_last_committed_batch(engine):
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE TABLE {BACKFILL_PROGRESS_TABLE} (name VARCHAR PRIMARY KEY, last_id INTEGER NOT NULL, "
+            "updated_rows INTEGER NOT NULL, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        ))
+        conn.execute(insert(progress_table).values(name="projects_status", last_id=150, updated_rows=5))
+
+    report = backfill(engine, "projects_status", "projects", {"status": "active"}, "status = ''", batch_size=100)
+    assert (report["resumed_from"], report["rows"], report["batches"]) == (150, 10, 1)
+    after = statuses(engine)
+    assert [id for id, status in after.items() if status == ""] == [30, 60, 90, 120, 150]
+    assert all(after[id] == "active" for id in (180, 210, 240, 270, 300))
@@ -0,0 +1,86 @@
+import sys
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.database import Model, Project, User
+
+@pytest.fixture
+def client(api_client):
+    client = api_client()
+    with Session(client.engine) as db:
+        other_id = db.execute(select(User.id).where(User.username == "other")).scalar_one()
+        foreign = Project(name="foreign", owner_id=other_id)
+        db.add(foreign)
+        db.commit()
+        foreign_id = foreign.id
+    return client, client.engine, foreign_id
+
+def test_bulk_create_reports_per_item_results(client):
+    call, engine, _ = client
+    response = call("POST", "/api/v1/projects/bulk", [
+        {"name": "a", "description": "first"},
+        {"description": "missing name"},
+        {"name": "b"},
+        "not an object",
+    ])
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (2, 2)
+    assert [result["status"] for result in body["results"]] == [201, 422, 201, 422]
+    assert "name" in body["results"][1]["error"]
+
+    with Session(engine) as db:
+        names = dict(db.execute(select(Project.id, Project.name).where(Project.name.in_(["a", "b"]))).all())
+    assert names == {body["results"][0]["id"]: "a", body["results"][2]["id"]: "b"}
+
+    models = call("POST", "/api/v1/models/bulk", [
+        {"name": "m1", "type": "classification", "version": "1.0"},
+        {"name": "m2", "type": "unknown", "version": "1.0"},
+    ]).json()
+    assert [result["status"] for result in models["results"]] == [201, 422]
+    with Session(engine) as db:
+        assert db.get(Model, models["results"][0]["id"]).status.value == "draft"
+
+def test_bulk_update_and_delete_skip_foreign_and_missing_rows(client):
+    call, engine, foreign_id = client
+    created = call("POST", "/api/v1/projects/bulk", [{"name": "a"}, {"name": "b"}]).json()
+    a, b = (result["id"] for result in created["results"])
+
+    updated = call("PUT", "/api/v1/projects/bulk", [
+        {"id": a, "name": "a2", "status": "archived"},
+        {"id": foreign_id, "name": "stolen"},
+        {"id": 999, "name": "missing"},
+        {"name": "no id"},
+    ]).json()
+    assert [result["status"] for result in updated["results"]] == [200, 404, 404, 422]
+
+    deleted = call("POST", "/api/v1/projects/bulk/delete", {"ids": [b, foreign_id, b]}).json()
+    assert [result["status"] for result in deleted["results"]] == [204, 404, 404]
+
+    with Session(engine) as db:
+        rows = dict(db.execute(select(Project.id, Project.name).where(Project.deleted_at.is_(None))).all())
+        project = db.get(Project, a)
+    assert rows == {a: "a2", foreign_id: "foreign"}
+    assert project.status == "archived" and project.updated_at is not None
+
+def test_bulk_rejects_oversized_batches(client):
+    call, _, _ = client
+    response = call("POST", "/api/v1/projects/bulk", [{"name": str(i)} for i in range(settings.BULK_MAX_ITEMS + 1)])
+    assert response.status_code == 422
+    response = call("POST", "/api/v1/models/bulk/delete", {"ids": list(range(settings.BULK_MAX_ITEMS + 1))})
+    assert response.status_code == 422
+
+@pytest.mark.parametrize("collection", ["projects", "models"])
+def test_bulk_failures_roll_back_without_leaking_errors(client, monkeypatch, collection):
+    call, _, _ = client
+
+    async def failing_delete(*args):
+        raise RuntimeError("database detail")
+
+    # src.api.routers re-exports the router objects under the module names, so patch through sys.modules
+    monkeypatch.setattr(sys.modules[f"src.api.routers.{collection[:-1]}_router"], "bulk_delete", failing_delete)
+    response = call("POST", f"/api/v1/{collection}/bulk/delete", {"ids": [1]})
+    assert response.status_code == 500
+    assert "database detail" not in response.text
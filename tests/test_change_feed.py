@@ -0,0 +1,56 @@
+import pytest
+
+@pytest.fixture
+def client(api_client):
+    return api_client()
+
+def sync(call, since, limit=50):
+    """Follow the feed until has_more is false, like a mirroring client."""
+    changes, pages = [], 0
+    while True:
+        page = call("GET", f"/api/v1/changes?since={since}&limit={limit}").json()
+        changes += page["changes"]
+        since, pages = page["next_since"], pages + 1
+        if not page["has_more"]:
+            return changes, since, pages
+
+def test_feed_returns_latest_state_and_tombstones_since_a_sequence(client):
+    call = client
+    a = call("POST", "/api/v1/projects", {"name": "a"}).json()
+    b = call("POST", "/api/v1/projects", {"name": "b"}).json()
+    model = call("POST", "/api/v1/models/db/create", {"name": "m", "type": "classification", "version": "1.0"}).json()
+    call("POST", "/api/v1/projects", {"name": "theirs"}, user="other")
+
+    changes, since, _ = sync(call, 0)
+    assert [(c["collection"], c["id"], c["op"]) for c in changes] == [
+        ("projects", a["id"], "upsert"), ("projects", b["id"], "upsert"), ("models", model["id"], "upsert"),
+    ]
+    assert changes[2]["data"]["name"] == "m" and changes[2]["data"]["type"] == "classification"
+
+    # Nothing changed: an empty page that keeps the position
+    assert call("GET", f"/api/v1/changes?since={since}").json() == {"changes": [], "next_since": since, "has_more": False}
+
+    call("PUT", f"/api/v1/projects/{a['id']}", {"name": "a1"})
+    call("PUT", f"/api/v1/projects/{a['id']}", {"name": "a2"})
+    call("DELETE", f"/api/v1/projects/{b['id']}")
+    changes, _, _ = sync(call, since)
+    # Repeated updates collapse into the current row; the delete is a tombstone
+    assert [(c["id"], c["op"], c["data"] and c["data"]["name"]) for c in changes] == [
+        (a["id"], "upsert", "a2"), (b["id"], "delete", None),
+    ]
+
+def test_feed_pages_do_not_skip_concurrent_changes(client):
+    call = client
+    created = call("POST", "/api/v1/projects/bulk", [{"name": f"p{i}"} for i in range(5)]).json()
+    ids = [result["id"] for result in created["results"]]
+
+    first = call("GET", "/api/v1/changes?since=0&limit=2").json()
+    assert [c["id"] for c in first["changes"]] == ids[:2] and first["has_more"]
+    # A row from the first page changes while the client is still paging
+    call("PUT", f"/api/v1/projects/{ids[0]}", {"name": "changed"})
+    rest, _, pages = sync(call, first["next_since"], limit=2)
+    assert [c["id"] for c in rest] == ids[2:] + [ids[0]] and pages == 2
+    assert rest[-1]["data"]["name"] == "changed"
+
+def test_feed_rejects_negative_positions(client):
+    assert client("GET", "/api/v1/changes?since=-1").status_code == 422
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import event
+
+@pytest.fixture
+def client(api_client):
+    client = api_client(users=("owner",))
+    statements = []
+    event.listen(client.async_engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return client, statements
+
+def test_if_match_rejects_stale_project_updates(client):
+    call, statements = client
+    project = call("POST", "/api/v1/projects", {"name": "a"}).json()
+    path = f"/api/v1/projects/{project['id']}"
+    fetched = call("GET", path)
+    assert fetched.headers["ETag"] == '"1"' and fetched.json()["row_version"] == 1
+
+    del statements[:]
+    first = call("PUT", path, {"name": "first"}, headers={"If-Match": '"1"'})
+    assert first.status_code == 200
+    assert (first.headers["ETag"], first.json()["row_version"]) == ('"2"', 2)
+    assert len(statements) == 1 and statements[0].startswith("UPDATE projects")
+
+    # A second writer holding the same version loses instead of overwriting
+    stale = call("PUT", path, {"name": "second"}, headers={"If-Match": '"1"'})
+    assert stale.status_code == 409 and stale.headers["ETag"] == '"2"'
+    assert call("GET", path).json()["name"] == "first"
+
+    assert call("PUT", path, {"name": "any"}, headers={"If-Match": "*"}).json()["row_version"] == 3
+    assert call("PUT", path, {"name": "unconditional"}).json()["row_version"] == 4
+    assert call("GET", "/api/v1/projects").json()["items"][0]["row_version"] == 4
+    assert call("PUT", path, {"name": "x"}, headers={"If-Match": 'W/"4"'}).status_code == 400
+    assert call("PUT", "/api/v1/projects/999", {"name": "x"}, headers={"If-Match": '"1"'}).status_code == 404
+
+def test_model_versions_advance_on_single_and_bulk_updates(client):
+    call, _ = client
+    model = call("POST", "/api/v1/models/db/create", {"name": "m", "type": "classification", "version": "1"}).json()
+    path = f"/api/v1/models/db/{model['id']}"
+    body = {"name": "m", "type": "regression", "version": "2"}
+
+    assert call("PUT", path, body, headers={"If-Match": '"1"'}).headers["ETag"] == '"2"'
+    assert call("PUT", path, body, headers={"If-Match": '"1"'}).status_code == 409
+    results = call("PUT", "/api/v1/models/bulk", [
+        {**body, "id": model["id"], "status": "ready"},
+        {"id": 999, "name": "missing", "type": "regression", "version": "1"},
+    ]).json()["results"]
+    assert [result["status"] for result in results] == [200, 404]
+
+    fetched = call("GET", path)
+    assert fetched.headers["ETag"] == '"3"'
+    assert (fetched.json()["status"], fetched.json()["type"]) == ("ready", "regression")
+    assert call("PUT", path, body, headers={"If-Match": '"2", "3"'}).status_code == 200
+
+@pytest.mark.parametrize("collection", ["projects", "models"])
+def test_conflicts_keep_the_etag_through_the_app(api_client, collection):
+    call = api_client(users=("owner",))
+    if collection == "projects":
+        path = f"/api/v1/projects/{call('POST', '/api/v1/projects', {'name': 'a'}).json()['id']}"
+        body = {"name": "b"}
+    else:
+        created = call("POST", "/api/v1/models/db/create", {"name": "m", "type": "classification", "version": "1"})
+        path = f"/api/v1/models/db/{created.json()['id']}"
+        body = {"name": "m", "type": "regression", "version": "2"}
+    assert call("PUT", path, body, headers={"If-Match": '"1"'}).status_code == 200
+
+    stale = call("PUT", path, body, headers={"If-Match": '"1"'})
+    assert stale.status_code == 409
+    assert stale.headers["content-type"] == "application/json"
+    assert stale.headers["ETag"] == '"2"' and stale.json()["detail"]
+    retried = call("PUT", path, body, headers={"If-Match": stale.headers["ETag"]})
+    assert retried.status_code == 200
@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool
+
+from src.core.config import settings
+from src.database.config import create_db_engine, to_async_url
+from src.database.pool import pool_metrics, pool_status
+
+@pytest.fixture
+def small_pool(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "DATABASE_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "DATABASE_POOL_TIMEOUT", 0.05)
+    yield
+    for name in ("test_sync", "test_async"):
+        pool_metrics.pop(name, None)
+
+def test_sync_engine_records_checkouts_and_timeouts(tmp_path, small_pool):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", name="test_sync")
+    try:
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # The only pooled connection is checked out, so the next checkout times out
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        status = pool_status(engine)
+        assert status["pool"] == "InstrumentedQueuePool"
+        assert status["size"] == 1
+        assert status["checkedout"] == 0
+        assert status["checkouts"] == 1
+        assert status["timeouts"] == 1
+        assert status["wait_ms_max"] >= 50
+        assert engine.pool._pre_ping is settings.DATABASE_POOL_PRE_PING
+    finally:
+        engine.dispose()
+
+    # Metrics survive the pool being recreated by dispose()
+    with engine.connect():
+        pass
+    assert pool_status(engine)["checkouts"] == 2
+    engine.dispose()
+
+def test_async_engine_shares_factory(tmp_path, small_pool):
+    engine = create_db_engine(to_async_url(f"sqlite:///{tmp_path / 'pool.db'}"), is_async=True, name="test_async")
+
+    async def run():
+        async with engine.connect() as conn:
+            mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+        await engine.dispose()
+        return mode
+
+    assert asyncio.run(run()) == "wal"
+    status = pool_status(engine.sync_engine)
+    assert status["pool"] == "InstrumentedAsyncAdaptedQueuePool"
+    assert status["checkouts"] == 1
+
+def test_explicit_poolclass_skips_pool_sizing(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=NullPool)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == settings.SQLITE_BUSY_TIMEOUT
+    assert pool_status(engine) == {"pool": "NullPool"}
+    engine.dispose()
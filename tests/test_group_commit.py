@@ -0,0 +1,80 @@
+import asyncio
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.database import Base, Project, User
+from src.database.config import to_async_url
+from src.database.group_commit import GroupCommitter, insert_op, update_op
+
+@pytest.fixture
+def database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'group.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        owner = User(username="owner", hashed_password="x")
+        db.add(owner)
+        db.commit()
+        owner_id = owner.id
+    async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+    yield engine, async_sessionmaker(bind=async_engine), owner_id
+    engine.dispose()
+
+def project_count(engine):
+    with Session(engine) as db:
+        return db.execute(select(func.count()).select_from(Project)).scalar_one()
+
+def test_concurrent_writes_share_commits(database):
+    engine, session_factory, owner_id = database
+    committer = GroupCommitter(session_factory, enabled=True, max_batch=8, max_delay_ms=20)
+
+    async def run():
+        projects = await asyncio.gather(*(
+            committer.submit(insert_op(Project, {"name": f"p{i}", "owner_id": owner_id})) for i in range(20)
+        ))
+        renamed = await committer.submit(update_op(Project, projects[0].id, owner_id, {"name": "renamed"}))
+        missing = await committer.submit(update_op(Project, 999, owner_id, {"name": "missing"}))
+        await committer.close()
+        return projects, renamed, missing
+
+    projects, renamed, missing = asyncio.run(run())
+    # Results are detached but loaded, so they serialize after the batch session closed
+    assert [project.name for project in projects] == [f"p{i}" for i in range(20)]
+    assert all(project.id and project.created_at for project in projects)
+    assert renamed.name == "renamed" and missing is None
+    assert project_count(engine) == 20
+
+    stats = committer.stats.snapshot()
+    assert stats["operations"] == 22
+    assert stats["commits"] == 5
+    # 20 inserts flushed as 8 + 8 + 4, then the two updates one by one
+    histogram = stats["batch_histogram"]
+    assert (histogram["<=1"], histogram["<=4"], histogram["<=8"]) == (2, 1, 2)
+
+def test_failed_operation_does_not_fail_its_batch(database):
+    engine, session_factory, owner_id = database
+    committer = GroupCommitter(session_factory, enabled=True, max_batch=10, max_delay_ms=20)
+
+    async def broken(db):
+        await db.execute(select(Project))
+        raise RuntimeError("broken write")
+
+    async def run():
+        results = await asyncio.gather(
+            committer.submit(insert_op(Project, {"name": "a", "owner_id": owner_id})),
+            committer.submit(broken),
+            committer.submit(insert_op(Project, {"name": "b", "owner_id": owner_id})),
+            return_exceptions=True,
+        )
+        await committer.close()
+        return results
+
+    a, error, b = asyncio.run(run())
+    assert isinstance(error, RuntimeError)
+    assert (a.name, b.name) == ("a", "b")
+    assert project_count(engine) == 2
+    stats = committer.stats.snapshot()
+    assert (stats["commits"], stats["operations"], stats["failed"]) == (1, 2, 1)
@@ -0,0 +1,125 @@
+import asyncio
+import time
+import httpx
+import pytest
+import torch
+import torch.nn as nn
+from fastapi import FastAPI, HTTPException
+from starlette.requests import Request
+from src.main import deadline_exception_handler
+from src.models.inference import (
+    Deadline,
+    DeadlineExceeded,
+    InferenceRunner,
+    RequestCancelled,
+    model_timeout_ms,
+)
+
+class SlowModel(nn.Module):
+    def __init__(self, delay=0.05):
+        super(SlowModel, self).__init__()
+        self.fc = nn.Linear(5, 2)
+        self.delay = delay
+
+    def forward(self, x):
+        time.sleep(self.delay)
+        return self.fc(x)
+
+def make_request(headers):
+    scope = {
+        "type": "http",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+    return Request(scope)
+
+def test_deadline_from_header_overrides_default():
+    deadline = Deadline.from_request(make_request({"X-Request-Timeout-Ms": "50"}), default_timeout_ms=10000)
+    assert 0 < deadline.remaining() <= 0.05
+
+    deadline = Deadline.from_request(make_request({}), default_timeout_ms=None)
+    assert deadline.remaining() is None
+    assert not deadline.expired()
+
+@pytest.mark.parametrize("value", ["0", "-50", "abc", "inf"])
+def test_deadline_rejects_non_positive_header(value):
+    with pytest.raises(HTTPException) as exc_info:
+        Deadline.from_request(make_request({"X-Request-Timeout-Ms": value}), default_timeout_ms=10000)
+    assert exc_info.value.status_code == 400
+
+def test_deadline_from_header_through_a_request():
+    app = FastAPI()
+    app.add_exception_handler(DeadlineExceeded, deadline_exception_handler)
+    runner = InferenceRunner()
+    model = SlowModel(delay=0.05)
+
+    @app.post("/infer")
+    async def infer(request: Request):
+        deadline = Deadline.from_request(request, default_timeout_ms=10000)
+        outputs = await runner.run(model, [torch.randn(1, 5)] * 3, deadline, request.is_disconnected)
+        return {"batches": len(outputs)}
+
+    async def call(headers):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/infer", headers=headers)
+
+    assert asyncio.run(call({})).json() == {"batches": 3}
+    assert asyncio.run(call({"X-Request-Timeout-Ms": "80"})).status_code == 504
+    for value in ("0", "-1"):
+        response = asyncio.run(call({"X-Request-Timeout-Ms": value}))
+        assert response.status_code == 400
+    # 非法请求头在排队前就被拒绝，没有占用推理资源
+    assert runner.completed == 1
+    assert runner.expired == 1
+
+def test_model_timeout_from_metadata():
+    assert model_timeout_ms({"timeout_ms": 250}) == 250.0
+
+def test_runner_completes_batches():
+    runner = InferenceRunner()
+    batches = [torch.randn(4, 5), torch.randn(4, 5)]
+    outputs = asyncio.run(runner.run(SlowModel(delay=0), batches, Deadline(5)))
+    assert [output.shape for output in outputs] == [(4, 2), (4, 2)]
+    assert runner.stats()["completed"] == 1
+
+def test_runner_stops_between_batches_after_deadline():
+    runner = InferenceRunner()
+    batches = [torch.randn(4, 5) for _ in range(10)]
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(runner.run(SlowModel(delay=0.05), batches, Deadline(0.08)))
+    assert runner.expired == 1
+    assert runner.running == 0
+
+def test_runner_rejects_expired_request_before_queuing():
+    runner = InferenceRunner()
+    deadline = Deadline(0.001)
+    time.sleep(0.01)
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(runner.run(SlowModel(delay=0), [torch.randn(1, 5)], deadline))
+    assert runner.stats()["queued"] == 0
+
+def test_runner_drops_queued_work_of_disconnected_client():
+    runner = InferenceRunner(max_concurrency=1)
+    disconnected = False
+
+    async def is_disconnected():
+        return disconnected
+
+    async def run():
+        nonlocal disconnected
+        busy = asyncio.ensure_future(
+            runner.run(SlowModel(delay=0.1), [torch.randn(1, 5)] * 3)
+        )
+        await asyncio.sleep(0.01)
+        waiting = asyncio.ensure_future(
+            runner.run(SlowModel(delay=0), [torch.randn(1, 5)], is_disconnected=is_disconnected)
+        )
+        await asyncio.sleep(0.01)
+        disconnected = True
+        with pytest.raises(RequestCancelled):
+            await waiting
+        await busy
+
+    asyncio.run(run())
+    assert runner.cancelled == 1
+    assert runner.completed == 1
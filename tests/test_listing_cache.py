@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from src.api.listing_cache import ListingCache, etag_matches, listing_cache
+from src.database import CollectionVersion
+from src.database.instrumentation import instrument_engine
+
+@pytest.fixture
+def client(api_client):
+    client = api_client()
+    instrument_engine(client.async_engine.sync_engine, slow_threshold_ms=0)
+    return client, client.engine
+
+def versions(engine):
+    with Session(engine) as db:
+        rows = db.execute(select(CollectionVersion.owner_id, CollectionVersion.collection, CollectionVersion.version))
+        return {(owner_id, collection): version for owner_id, collection, version in rows}
+
+def test_writes_bump_the_owner_collection_version(client):
+    call, engine = client
+    project = call("POST", "/api/v1/projects", {"name": "a"}).json()
+    call("PUT", f"/api/v1/projects/{project['id']}", {"name": "a", "description": "changed"})
+    call("POST", "/api/v1/projects/bulk", [{"name": "b"}, {"name": "c"}])
+    call("POST", "/api/v1/models/db/create", {"name": "m", "type": "classification", "version": "1.0"})
+    call("DELETE", f"/api/v1/projects/{project['id']}")
+    call("POST", "/api/v1/projects", {"name": "theirs"}, user="other")
+    owner, other = 1, 2
+    assert versions(engine) == {
+        (owner, "projects"): 5,
+        (owner, "models"): 1,
+        (other, "projects"): 1,
+    }
+
+def test_conditional_get_returns_304_until_the_collection_changes(client):
+    call, _ = client
+    call("POST", "/api/v1/projects", {"name": "a"})
+    first = call("GET", "/api/v1/projects")
+    etag = first.headers["etag"]
+    assert first.status_code == 200 and [item["name"] for item in first.json()["items"]] == ["a"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    statements = []
+    event.listen(call.async_engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    response = call("GET", "/api/v1/projects", headers={"If-None-Match": f'W/"x", {etag}'})
+    assert response.status_code == 304 and response.headers["etag"] == etag and response.content == b""
+    # Only the version lookup runs; the rows are never read
+    assert response.headers["server-timing"].endswith('desc="1 queries"')
+    assert len(statements) == 1 and "collection_versions" in statements[0]
+
+    # Another user's writes leave this user's ETag alone
+    call("POST", "/api/v1/projects", {"name": "theirs"}, user="other")
+    assert call("GET", "/api/v1/projects", headers={"If-None-Match": etag}).status_code == 304
+
+    call("POST", "/api/v1/projects", {"name": "b"})
+    changed = call("GET", "/api/v1/projects", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert [item["name"] for item in changed.json()["items"]] == ["b", "a"]
+
+    # Invalid cursors are rejected even when the ETag matches
+    invalid = call("GET", "/api/v1/projects?cursor=bad", headers={"If-None-Match": "*"})
+    assert invalid.status_code == 400
+
+def test_cache_serves_repeated_listings_per_version_and_query(client):
+    call, _ = client
+    call("POST", "/api/v1/models/db/create", {"name": "m", "type": "classification", "version": "1.0"})
+    before = listing_cache.stats()
+    bodies = [call("GET", path).json() for path in ("/api/v1/models/", "/api/v1/models/", "/api/v1/models/?limit=1")]
+    assert bodies[0] == bodies[1] == bodies[2]
+    assert bodies[0]["items"][0]["name"] == "m"
+    stats = listing_cache.stats()
+    assert (stats["hits"] - before["hits"], stats["misses"] - before["misses"], stats["entries"]) == (1, 2, 2)
+
+    changes = {"name": "m", "type": "classification", "version": "1.0", "description": "changed"}
+    call("PUT", f"/api/v1/models/db/{bodies[0]['items'][0]['id']}", changes)
+    assert call("GET", "/api/v1/models/").json()["items"][0]["description"] == "changed"
+    assert listing_cache.stats()["misses"] - before["misses"] == 3
+
+def test_listing_cache_evicts_least_recently_used():
+    cache = ListingCache(max_size=2)
+    cache.put(("projects", 1, 1, ""), b"a")
+    cache.put(("projects", 2, 1, ""), b"b")
+    assert cache.get(("projects", 1, 1, "")) == b"a"
+    cache.put(("projects", 3, 1, ""), b"c")
+    assert cache.get(("projects", 2, 1, "")) is None
+    assert cache.stats()["evictions"] == 1
+    assert etag_matches('W/"projects-1-3"', '"projects-1-3"') and not etag_matches('"projects-1-4"', '"projects-1-3"')
@@ -0,0 +1,113 @@
+import io
+import os
+import tarfile
+import threading
+import pytest
+import torch.nn as nn
+from src.models.model_manager import ModelManager
+from src.models import model_archive
+from src.models.model_archive import ArchiveError, MANIFEST_NAME
+
+class TestModel(nn.Module):
+    def __init__(self):
+        super(TestModel, self).__init__()
+        self.fc = nn.Linear(5, 2)
+
+    def forward(self, x):
+        return self.fc(x)
+
+@pytest.fixture
+def source_manager(tmp_path):
+    manager = ModelManager(storage_path=str(tmp_path / "source"))
+    manager.save_model(TestModel(), "model1", {"name": "model1", "version": "1.0.0"})
+    manager.save_model(TestModel(), "model2", {"name": "model2", "version": "1.0.0"})
+    return manager
+
+@pytest.fixture
+def target_manager(tmp_path):
+    return ModelManager(storage_path=str(tmp_path / "target"))
+
+@pytest.mark.parametrize("compression", ["", "gz"])
+def test_export_import_roundtrip(source_manager, target_manager, compression):
+    archive = io.BytesIO()
+    report = source_manager.export_models(["model1", "model2"], archive, compression=compression, workers=2)
+    assert report["files"] == 4
+
+    archive.seek(0)
+    report = target_manager.import_models(archive, workers=2)
+    assert sorted(report["models"]) == ["model1", "model2"]
+    assert len(report["imported"]) == 4
+    assert report["failed"] == []
+    assert sorted(target_manager.list_models()) == ["model1", "model2"]
+    assert target_manager.get_model_metadata("model1")["name"] == "model1"
+    assert target_manager.load_model("model2", TestModel) is not None
+
+def test_import_skips_present_files(source_manager, target_manager):
+    archive = io.BytesIO()
+    source_manager.export_models(["model1"], archive)
+    archive.seek(0)
+    target_manager.import_models(archive)
+
+    archive.seek(0)
+    report = target_manager.import_models(archive)
+    assert report["imported"] == []
+    assert sorted(report["skipped"]) == ["model1/metadata.json", "model1/weights.pt"]
+
+def test_import_rejects_checksum_mismatch(source_manager, target_manager):
+    archive = io.BytesIO()
+    source_manager.export_models(["model1"], archive)
+
+    # Flip a byte inside the first member's data block
+    data = bytearray(archive.getvalue())
+    data[512] ^= 0xFF
+    report = target_manager.import_models(io.BytesIO(bytes(data)))
+    assert len(report["failed"]) == 1
+    assert not any(path.name.endswith(".partial") for path in target_manager.storage_path.rglob("*"))
+
+def test_export_missing_model(source_manager):
+    with pytest.raises(FileNotFoundError):
+        source_manager.export_models(["non_existent"], io.BytesIO())
+
+def test_import_rejects_unsafe_paths(target_manager):
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w") as tar:
+        info = tarfile.TarInfo("../escape.txt")
+        info.size = 1
+        tar.addfile(info, io.BytesIO(b"x"))
+    archive.seek(0)
+    with pytest.raises(ArchiveError):
+        target_manager.import_models(archive)
+
+def test_stream_export_yields_archive(source_manager):
+    data = b"".join(source_manager.stream_export(["model1"], compression="gz"))
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+        names = tar.getnames()
+    assert names[-1] == MANIFEST_NAME
+    assert "model1/weights.pt" in names
+
+def test_stream_export_raises_export_errors(source_manager, monkeypatch):
+    def failing_export(storage_path, model_names, fileobj, compression, workers):
+        fileobj.write(b"partial")
+        raise OSError("disk read failed")
+
+    monkeypatch.setattr(model_archive, "export_models", failing_export)
+    chunks = source_manager.stream_export(["model1"])
+    assert next(chunks) == b"partial"
+    with pytest.raises(OSError, match="disk read failed"):
+        next(chunks)
+
+def test_closing_stream_export_stops_the_export(source_manager, monkeypatch):
+    stopped = threading.Event()
+
+    def endless_export(storage_path, model_names, fileobj, compression, workers):
+        try:
+            while True:
+                fileobj.write(b"x" * 1024)
+        finally:
+            stopped.set()
+
+    monkeypatch.setattr(model_archive, "export_models", endless_export)
+    chunks = source_manager.stream_export(["model1"])
+    next(chunks)
+    chunks.close()
+    assert stopped.wait(timeout=5)
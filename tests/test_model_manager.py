@@ -3,8 +3,10 @@ import torch
 import torch.nn as nn
 import os
 import shutil
+import threading
 from pathlib import Path
 from src.models.model_manager import ModelManager
+from src.models.memory_ledger import MemoryLedger, MemoryLimitExceeded, memory_ledger, resident_bytes
 
 # Test model class
 class TestModel(nn.Module):
@@ -100,4 +102,75 @@ def test_invalid_model_operations(model_manager):
     
     # Test getting metadata for non-existent model
     metadata = model_manager.get_model_metadata("non_existent")
-    assert metadata is None, "Should return None for non-existent model metadata" 
\ No newline at end of file
+    assert metadata is None, "Should return None for non-existent model metadata" 
+
+
+def test_memory_ledger_accounting(model_manager, test_model, test_metadata):
+    model_manager.save_model(test_model, "test_model", test_metadata)
+    shared = model_manager.get_shared_model("test_model", TestModel)
+
+    # Linear(5, 2): 10 weights + 2 biases as float32
+    assert resident_bytes(shared) == 12 * 4
+    key = model_manager._ledger_key("test_model")
+    entries = {entry["key"]: entry for entry in memory_ledger.snapshot()["models"]}
+    assert entries[key]["bytes"] == 48
+
+    # The shared instance is served from the ledger and is read-only
+    assert model_manager.get_shared_model("test_model", TestModel) is shared
+    assert not shared.training and not any(param.requires_grad for param in shared.parameters())
+
+    # load_model still hands each caller its own copy
+    private = model_manager.load_model("test_model", TestModel)
+    assert private is not shared and private is not model_manager.load_model("test_model", TestModel)
+    with torch.no_grad():
+        private.fc.weight.zero_()
+    assert shared.fc.weight.abs().sum() > 0
+    assert model_manager.unload_model("test_model")
+
+def test_memory_ledger_reject_policy():
+    ledger = MemoryLedger(limit_bytes=100, policy="reject", retry_after=7)
+    ledger.admit("a", 80)
+    with pytest.raises(MemoryLimitExceeded) as exc_info:
+        ledger.admit("b", 40)
+    assert exc_info.value.retry_after == 7
+    assert ledger.rejections == 1
+
+def test_memory_ledger_evict_policy():
+    ledger = MemoryLedger(limit_bytes=100, policy="evict")
+    ledger.commit(ledger.admit("a", 48), "a", TestModel())
+    ledger.commit(ledger.admit("b", 48), "b", TestModel())
+    ledger.get("a")
+
+    # "b" is least recently used and is evicted to make room
+    ledger.admit("c", 48)
+    snapshot = ledger.snapshot()
+    assert [entry["key"] for entry in snapshot["models"]] == ["a"]
+    assert snapshot["reserved_bytes"] == 48
+    assert ledger.evictions == 1
+
+def test_memory_ledger_queue_policy_times_out():
+    ledger = MemoryLedger(limit_bytes=100, policy="queue", queue_timeout=0.05)
+    reservation = ledger.admit("a", 80)
+    with pytest.raises(MemoryLimitExceeded):
+        ledger.admit("b", 40)
+    ledger.cancel(reservation)
+    ledger.admit("b", 40)
+    assert ledger.used_bytes == 40
+
+def test_memory_ledger_queue_policy_waits_for_a_release():
+    ledger = MemoryLedger(limit_bytes=100, policy="queue", queue_timeout=5)
+    reservation = ledger.admit("a", 80)
+    threading.Timer(0.05, ledger.cancel, [reservation]).start()
+    ledger.admit("b", 40)
+    assert ledger.used_bytes == 40
+
+def test_concurrent_loads_of_one_model_keep_their_own_reservations():
+    ledger = MemoryLedger(limit_bytes=100, policy="reject")
+    first, second = ledger.admit("a", 48), ledger.admit("a", 48)
+    assert ledger.used_bytes == 96
+
+    shared = TestModel()
+    assert ledger.commit(first, "a", shared) is shared
+    # The slower load gets the instance committed first and its reservation is returned
+    assert ledger.commit(second, "a", TestModel()) is shared
+    assert ledger.used_bytes == 48
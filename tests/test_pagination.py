@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.database import Base, Project, User
+from src.database.config import to_async_url
+from src.database.pagination import (
+    InvalidCursor, OwnerCountCache, decode_cursor, encode_cursor, keyset_page, page_items,
+)
+
+@pytest.fixture
+def database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'pagination.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        owner, other = User(username="owner", hashed_password="x"), User(username="other", hashed_password="x")
+        db.add_all([owner, other])
+        db.flush()
+        # Rows from the server default share the same second; two carry microseconds
+        db.add_all([Project(name=f"p{i}", owner_id=owner.id) for i in range(7)])
+        db.add_all([
+            Project(name="micro-1", owner_id=owner.id, created_at=datetime(2020, 1, 1, 0, 0, 0, 500)),
+            Project(name="micro-2", owner_id=owner.id, created_at=datetime(2020, 1, 1, 0, 0, 0, 500)),
+            Project(name="foreign", owner_id=other.id),
+        ])
+        db.commit()
+        owner_id = owner.id
+    engine.dispose()
+
+    async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+    yield async_sessionmaker(bind=async_engine), owner_id
+    asyncio.run(async_engine.dispose())
+
+def walk(session_factory, owner_id, limit):
+    async def run():
+        names, cursor = [], None
+        async with session_factory() as db:
+            while True:
+                query = keyset_page(select(Project).filter(Project.owner_id == owner_id), Project, cursor, limit)
+                rows, cursor = page_items((await db.execute(query)).scalars().all(), limit)
+                assert len(rows) <= limit
+                names.extend(project.name for project in rows)
+                if cursor is None:
+                    return names
+    return asyncio.run(run())
+
+def test_keyset_pages_cover_every_row_once(database):
+    session_factory, owner_id = database
+    names = walk(session_factory, owner_id, limit=2)
+    assert names == walk(session_factory, owner_id, limit=100)
+    assert names == [f"p{i}" for i in reversed(range(7))] + ["micro-2", "micro-1"]
+
+def test_cursor_round_trip_and_invalid_cursor():
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 250)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+    for cursor in ("not-a-cursor", encode_cursor(created_at, 42)[:-3], ""):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor)
+
+def test_count_cache_hits_and_invalidation(database):
+    session_factory, owner_id = database
+    cache = OwnerCountCache(ttl=60)
+
+    async def run():
+        async with session_factory() as db:
+            first = await cache.count(db, Project, owner_id)
+            second = await cache.count(db, Project, owner_id)
+            db.add(Project(name="new", owner_id=owner_id))
+            await db.commit()
+            stale = await cache.count(db, Project, owner_id)
+            cache.invalidate(Project, owner_id)
+            fresh = await cache.count(db, Project, owner_id)
+        return first, second, stale, fresh
+
+    assert asyncio.run(run()) == (9, 9, 9, 10)
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
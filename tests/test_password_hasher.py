@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import pytest
+from passlib.context import CryptContext
+
+from src.core.password_hasher import PasswordHasher, PasswordHasherBusy
+
+class BlockingContext:
+    """Stands in for CryptContext; every call waits until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def hash(self, password):
+        self.release.wait(5)
+        return f"hashed:{password}"
+
+    def verify(self, password, hashed):
+        self.release.wait(5)
+        return hashed == f"hashed:{password}"
+
+def test_hash_and_verify_with_bcrypt():
+    hasher = PasswordHasher(CryptContext(schemes=["bcrypt"], bcrypt__rounds=4), workers=2, queue_limit=2)
+
+    async def run():
+        hashed = await hasher.hash("secret")
+        return await hasher.verify("secret", hashed), await hasher.verify("wrong", hashed)
+
+    assert asyncio.run(run()) == (True, False)
+    assert hasher.stats()["completed"] == 3
+
+def test_rejects_when_saturated_and_recovers():
+    context = BlockingContext()
+    hasher = PasswordHasher(context, workers=1, queue_limit=1, retry_after=3)
+
+    async def run():
+        running = [asyncio.ensure_future(hasher.hash(f"p{i}")) for i in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(PasswordHasherBusy) as excinfo:
+            await hasher.verify("p0", "hashed:p0")
+        assert excinfo.value.retry_after == 3
+        context.release.set()
+        hashes = await asyncio.gather(*running)
+        return hashes, await hasher.verify("p0", "hashed:p0")
+
+    hashes, verified = asyncio.run(run())
+    assert hashes == ["hashed:p0", "hashed:p1"]
+    assert verified is True
+    stats = hasher.stats()
+    assert (stats["in_flight"], stats["rejected"], stats["max_in_flight"]) == (0, 1, 2)
+
+def test_cancelled_waiter_releases_its_slot():
+    context = BlockingContext()
+    hasher = PasswordHasher(context, workers=1, queue_limit=1)
+
+    async def run():
+        running = asyncio.ensure_future(hasher.hash("a"))
+        queued = asyncio.ensure_future(hasher.hash("b"))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        await asyncio.sleep(0.05)
+        in_flight = hasher.stats()["in_flight"]
+        context.release.set()
+        await running
+        return in_flight
+
+    assert asyncio.run(run()) == 1
+    assert hasher.stats()["in_flight"] == 0
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from src.core.config import settings
+from src.api.middleware import QueryStatsMiddleware
+from src.database.config import create_db_engine, to_async_url
+from src.database.instrumentation import instrument_engine, statement_shape, track_queries
+
+def test_statement_shape_collapses_whitespace_and_in_lists():
+    assert statement_shape("SELECT id\n  FROM models WHERE id IN (?, ?, ?)") == "SELECT id FROM models WHERE id IN (?)"
+    assert statement_shape("SELECT 1 WHERE x IN (%s,%s)") == "SELECT 1 WHERE x IN (?)"
+
+def test_slow_query_is_logged_with_plan(tmp_path, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_INSTRUMENTATION", False)
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'slow.db'}")
+    # Every statement counts as slow
+    instrument_engine(engine, slow_threshold_ms=1e-9)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, owner_id INTEGER)"))
+            with caplog.at_level(logging.WARNING, logger="src.database.instrumentation"), track_queries() as stats:
+                rows = conn.execute(text("SELECT id FROM items WHERE owner_id = :owner"), {"owner": 4242}).all()
+    finally:
+        engine.dispose()
+
+    assert rows == []
+    assert stats.count == 1
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("SELECT id FROM items WHERE owner_id = ?" in m and "SCAN items" in m for m in messages)
+    # Parameter values stay out of the log unless explicitly enabled
+    assert any("1 parameters (int)" in m for m in messages)
+    assert not any("4242" in m for m in messages)
+
+def test_middleware_adds_server_timing_and_warns_on_repeats(tmp_path, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+    engine = create_db_engine(to_async_url(f"sqlite:///{tmp_path / 'n1.db'}"), is_async=True)
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, n_plus_one_threshold=3)
+
+    @app.get("/items")
+    async def items(n: int):
+        async with engine.connect() as conn:
+            for i in range(n):
+                await conn.execute(text("SELECT :i"), {"i": i})
+        return {"ok": True}
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            few = await client.get("/items", params={"n": 2})
+            many = await client.get("/items", params={"n": 5})
+        await engine.dispose()
+        return few, many
+
+    with caplog.at_level(logging.WARNING, logger="src.api.middleware"):
+        few, many = asyncio.run(run())
+
+    assert few.headers["Server-Timing"].startswith("db;dur=")
+    assert few.headers["Server-Timing"].endswith('desc="2 queries"')
+    assert many.headers["Server-Timing"].endswith('desc="5 queries"')
+    warnings = [record.getMessage() for record in caplog.records]
+    assert len(warnings) == 1
+    assert "5 executions in GET /items" in warnings[0]
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.api.middleware import ReplicaRoutingMiddleware
+from src.core.user_cache import user_cache
+from src.database.config import to_async_url
+from src.database.replicas import ReplicaRouter, copy_sqlite_database
+import src.database.replicas as replicas
+
+@pytest.fixture
+def client(api_client, tmp_path):
+    # get_db is not overridden: the middleware picks the session factory for each request
+    client = api_client(override_db=False)
+    replica_urls = [f"sqlite:///{tmp_path / f'replica{i}.db'}" for i in range(2)]
+
+    def sync_replicas():
+        for url in replica_urls:
+            copy_sqlite_database(client.url, url)
+
+    def factory(url, replica=False):
+        engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+        return async_sessionmaker(bind=engine, expire_on_commit=False, info={"replica": True} if replica else {})
+
+    router = ReplicaRouter(factory(client.url), [factory(url, replica=True) for url in replica_urls], read_your_writes=5)
+    sync_replicas()
+    client.asgi = ReplicaRoutingMiddleware(client.app, router=router)
+    yield client, router, sync_replicas
+    asyncio.run(router.dispose())
+
+def names(response):
+    return [item["name"] for item in response.json()["items"]]
+
+def test_reads_go_to_replicas_except_right_after_a_write(client, monkeypatch):
+    call, router, sync_replicas = client
+    now = [1000.0]
+    # Replace the module's clock only; patching time.monotonic would stop every other clock in the process
+    monkeypatch.setattr(replicas, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    assert call("POST", "/api/v1/projects", {"name": "fresh"}).status_code == 200
+    # The writer reads its own write from the primary; the replicas have not caught up yet
+    assert names(call("GET", "/api/v1/projects")) == ["fresh"]
+    assert router.stats()["primary_reads"] == 1
+
+    assert names(call("GET", "/api/v1/projects", user="other")) == []
+    assert names(call("GET", "/api/v1/projects", user="other")) == []
+    assert router.stats()["replica_reads"] == [1, 1]
+    # A user row read on a replica may be stale and is not cached
+    assert user_cache.get("owner") is not None and user_cache.get("other") is None
+
+    now[0] += 10
+    assert names(call("GET", "/api/v1/projects")) == []
+    assert call("GET", "/api/v1/projects/count").json()["total"] == 0
+    sync_replicas()
+    assert names(call("GET", "/api/v1/projects")) == ["fresh"]
+    # The stale count read on a replica was not cached
+    assert call("GET", "/api/v1/projects/count").json()["total"] == 1
+    assert router.stats() == {
+        "replicas": 2,
+        "writes": 1,
+        "primary_reads": 1,
+        "replica_reads": [3, 3],
+        "read_your_writes_seconds": 5,
+        "tracked_clients": 1,
+    }
+
+def test_router_without_replicas_uses_primary():
+    primary = object()
+    router = ReplicaRouter(primary, [], read_your_writes=5)
+    assert not router.enabled
+    assert router.route("GET", "client") is primary
+    assert router.route("DELETE", "client") is primary
+    router.mark_write("client")
+
+    limited = ReplicaRouter(primary, [object()], max_clients=2)
+    for client in ("a", "b", "c"):
+        limited.mark_write(client)
+    assert limited.stats()["tracked_clients"] == 2
+    assert limited.route("GET", "a") is not primary
+    assert limited.route("GET", "c") is primary
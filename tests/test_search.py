@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+from sqlalchemy import create_engine, delete, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.database import Base, Model, Project, User
+from src.database.config import to_async_url
+from src.database.models.model import ModelType
+from src.database.pagination import InvalidCursor
+from src.database.search import match_expression, search_catalog
+
+@pytest.fixture
+def database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'search.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        owner, other = User(username="owner", hashed_password="x"), User(username="other", hashed_password="x")
+        db.add_all([owner, other])
+        db.flush()
+        db.add_all([
+            Project(name="Image classifier", description="Fine-tune ResNet on product photos", owner_id=owner.id),
+            Project(name="Chatbot", description="Support bot that answers image questions", owner_id=owner.id),
+            Project(name="Image pipeline", owner_id=other.id),
+            Model(name="resnet-image", type=ModelType.CLASSIFICATION, version="2.1", owner_id=owner.id),
+            Model(name="gpt-small", type=ModelType.GENERATIVE, version="1.0", description="Text model", owner_id=owner.id),
+        ])
+        db.commit()
+        owner_id = owner.id
+    yield engine, async_sessionmaker(bind=create_async_engine(to_async_url(url), poolclass=NullPool)), owner_id
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+def search(session_factory, owner_id, q, cursor=None, limit=10):
+    async def run():
+        async with session_factory() as db:
+            return await search_catalog(db, owner_id, q, cursor, limit)
+    return asyncio.run(run())
+
+def test_search_ranks_name_matches_and_scopes_to_owner(database):
+    engine, session_factory, owner_id = database
+    items, next_cursor = search(session_factory, owner_id, "image")
+    assert next_cursor is None
+    # Name matches outrank the description-only match; the other user's project is excluded
+    assert [(item["kind"], item["name"]) for item in items][-1] == ("project", "Chatbot")
+    assert {item["name"] for item in items[:-1]} == {"Image classifier", "resnet-image"}
+    assert search(session_factory, owner_id, "2.1")[0][0]["name"] == "resnet-image"
+    # Last term matches as a prefix, earlier terms must all be present
+    assert [item["name"] for item in search(session_factory, owner_id, "fine prod")[0]] == ["Image classifier"]
+
+def test_search_pages_and_follows_updates(database):
+    engine, session_factory, owner_id = database
+    first, cursor = search(session_factory, owner_id, "image", limit=2)
+    second, last_cursor = search(session_factory, owner_id, "image", cursor=cursor, limit=2)
+    assert len(first) == 2 and len(second) == 1 and last_cursor is None
+    assert first + second == search(session_factory, owner_id, "image")[0]
+
+    with engine.begin() as conn:
+        conn.execute(update(Project).where(Project.name == "Chatbot").values(description="Support bot"))
+        conn.execute(delete(Model).where(Model.name == "resnet-image"))
+    assert [item["name"] for item in search(session_factory, owner_id, "image")[0]] == ["Image classifier"]
+
+    with pytest.raises(InvalidCursor):
+        search(session_factory, owner_id, "image", cursor="bm90LWpzb24")
+
+def test_match_expression_ignores_query_syntax():
+    assert match_expression('"image" OR name:*', 7, ("name",)) == 'owner_id : "7" AND {name} : ("image" "OR" "name"*)'
+    assert match_expression(" -* ", 7, ("name",)) is None
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from src.database import Base, Model, Project, User
+from src.database.pagination import keyset_page, page_items
+from src.database.seeding import seed_database
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+def owner_counts(engine, entity):
+    with Session(engine) as db:
+        return dict(db.execute(select(entity.owner_id, func.count()).group_by(entity.owner_id)).all())
+
+def test_seeder_generates_skewed_owner_distributions(engine):
+    report = seed_database(engine, users=200, projects_per_user=10, models_per_user=5, batch_size=300)
+    assert report["users"] == 200
+    with Session(engine) as db:
+        assert db.execute(select(func.count()).select_from(Project)).scalar_one() == report["projects"]
+        assert db.execute(select(func.count()).select_from(Model)).scalar_one() == report["models"]
+        assert db.execute(select(func.count()).where(Project.created_at > func.current_timestamp())).scalar_one() == 0
+
+    projects = sorted(owner_counts(engine, Project).values())
+    assert 7 <= report["projects"] / 200 <= 13
+    # Heavy tail: the busiest owner has several times the mean
+    assert projects[-1] > 3 * report["projects"] / 200
+
+    # The same seed produces the same data set
+    other = create_engine(str(engine.url).replace("seed.db", "again.db"))
+    Base.metadata.create_all(bind=other)
+    again = seed_database(other, users=200, projects_per_user=10, models_per_user=5)
+    other.dispose()
+    assert (again["projects"], again["models"]) == (report["projects"], report["models"])
+
+def test_seeded_rows_page_like_rows_created_through_the_api(engine):
+    # days=0 puts every row in the same second, so the cursor comparisons rely on ties
+    seed_database(engine, users=5, projects_per_user=40, models_per_user=0, days=0)
+    owner_id, total = max(owner_counts(engine, Project).items(), key=lambda item: item[1])
+    with Session(engine) as db:
+        db.add(Project(name="created through the api", owner_id=owner_id))
+        db.commit()
+        seen, cursor = [], None
+        while True:
+            query = keyset_page(select(Project).filter(Project.owner_id == owner_id), Project, cursor, 7)
+            rows, cursor = page_items(db.execute(query).scalars().all(), 7)
+            seen += [row.id for row in rows]
+            if not cursor:
+                break
+    assert len(seen) == len(set(seen)) == total + 1
+
+def test_seeder_refuses_a_prefix_in_use(engine):
+    with Session(engine) as db:
+        db.add(User(username="seed000000", hashed_password="x"))
+        db.commit()
+    with pytest.raises(ValueError):
+        seed_database(engine, users=1)
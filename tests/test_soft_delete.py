@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.database import Model, Project
+from src.database.aggregates import reconcile_aggregates
+from src.database.models.model import ModelType
+from src.database.soft_delete import acquire_purge_lock, purge_deleted
+from src.models.model_manager import ModelManager
+
+@pytest.fixture
+def client(api_client):
+    client = api_client()
+    return client, client.engine
+
+def rows(engine, entity):
+    with Session(engine) as db:
+        return db.execute(select(func.count()).select_from(entity)).scalar_one()
+
+def test_deleted_projects_disappear_everywhere_until_purged(client):
+    call, engine = client
+    keep = call("POST", "/api/v1/projects", {"name": "keep vision"}).json()
+    gone = call("POST", "/api/v1/projects", {"name": "gone vision"}).json()
+    call("POST", "/api/v1/projects/bulk", [{"name": "bulk vision"}])
+    bulk_id = call("GET", "/api/v1/search?q=bulk").json()["items"][0]["id"]
+    since = call("GET", "/api/v1/changes").json()["next_since"]
+
+    assert call("DELETE", f"/api/v1/projects/{gone['id']}").status_code == 200
+    assert call("POST", "/api/v1/projects/bulk/delete", {"ids": [bulk_id]}).json()["succeeded"] == 1
+    assert call("DELETE", f"/api/v1/projects/{gone['id']}").status_code == 404
+    assert call("GET", f"/api/v1/projects/{gone['id']}").status_code == 404
+    assert call("PUT", f"/api/v1/projects/{gone['id']}", {"name": "back"}).status_code == 404
+    assert [item["id"] for item in call("GET", "/api/v1/projects").json()["items"]] == [keep["id"]]
+    assert call("GET", "/api/v1/projects/count").json()["total"] == 1
+    assert [item["id"] for item in call("GET", "/api/v1/search?q=vision").json()["items"]] == [keep["id"]]
+    assert call("GET", "/api/v1/summary").json()["projects"] == {"total": 1, "by_status": {"active": 1}}
+    changes = call("GET", f"/api/v1/changes?since={since}").json()["changes"]
+    assert {(change["id"], change["op"]) for change in changes} == {(gone["id"], "delete"), (bulk_id, "delete")}
+
+    # The rows stay until the purge, which leaves the counts alone
+    assert rows(engine, Project) == 3
+    report = purge_deleted(engine, batch_size=1)
+    assert (report["projects"], report["batches"]) == (2, 2)
+    assert rows(engine, Project) == 1
+    assert reconcile_aggregates(engine)["drifted"] == 0
+    assert [item["id"] for item in call("GET", "/api/v1/search?q=vision").json()["items"]] == [keep["id"]]
+
+def test_purge_removes_model_storage_no_longer_in_use(client, tmp_path):
+    call, engine = client
+    manager = ModelManager(storage_path=str(tmp_path / "models"))
+    for name in ("solo", "shared"):
+        (manager.storage_path / name).mkdir()
+        (manager.storage_path / name / "weights.pt").write_bytes(b"weights")
+        call("POST", "/api/v1/models/db/create", {"name": name, "type": "classification", "version": "1"})
+    call("POST", "/api/v1/models/db/create", {"name": "shared", "type": "generative", "version": "1"}, user="other")
+    shared = call("GET", "/api/v1/models/db/list").json()["items"][0]
+    assert shared["name"] == "shared"
+
+    assert call("DELETE", "/api/v1/models/solo").status_code == 200
+    assert call("DELETE", "/api/v1/models/solo").status_code == 404
+    assert call("DELETE", f"/api/v1/models/{shared['id']}").status_code == 200
+    assert call("GET", "/api/v1/models/").json()["items"] == []
+    assert call("GET", "/api/v1/summary").json()["models"]["total"] == 0
+    assert (manager.storage_path / "solo").exists()
+
+    # Rows deleted within the retention period are kept
+    assert purge_deleted(engine, manager.delete_model, retention=3600)["models"] == 0
+    report = purge_deleted(engine, manager.delete_model)
+    assert (report["models"], report["storage_removed"]) == (2, 1)
+    assert not (manager.storage_path / "solo").exists()
+    # Another user's model still uses the shared directory
+    assert (manager.storage_path / "shared").exists()
+    with Session(engine) as db:
+        assert db.execute(select(Model.type)).scalars().all() == [ModelType.GENERATIVE]
+
+def test_only_one_worker_holds_the_purge_lock(tmp_path):
+    url = f"sqlite:///{tmp_path / 'purge.db'}"
+    first = acquire_purge_lock(url)
+    assert first is not None
+    # Another worker on the same database skips the purge
+    assert acquire_purge_lock(url) is None
+    other = acquire_purge_lock(f"sqlite:///{tmp_path / 'other.db'}")
+    assert other is not None
+    other.close()
+
+    first.close()
+    second = acquire_purge_lock(url)
+    assert second is not None
+    second.close()
@@ -0,0 +1,93 @@
+import os
+import time
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.database import User
+from src.models.storage_gc import collect_garbage, find_orphans
+
+def age(path, seconds=7200):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+@pytest.fixture
+def storage(tmp_path):
+    root = tmp_path / "models"
+    root.mkdir()
+
+    # Complete catalog entry without a database row
+    (root / "catalog_only").mkdir()
+    (root / "catalog_only" / "weights.pt").write_bytes(b"w" * 10)
+    (root / "catalog_only" / "metadata.json").write_text('{"file_path": "%s"}' % (root / "upload.bin"))
+
+    # Referenced by a Model row, with a stale partial file inside
+    (root / "registered").mkdir()
+    (root / "registered" / "weights.pt").write_bytes(b"w" * 10)
+    (root / "registered" / "weights.pt.partial").write_bytes(b"p" * 5)
+
+    # Failed save: directory with nothing usable in it
+    (root / "failed_save").mkdir()
+    (root / "failed_save" / "metadata.json").write_text("{not json")
+
+    # Loose files at the root: one referenced by the catalog, one not
+    (root / "upload.bin").write_bytes(b"u" * 20)
+    (root / "stray.bin").write_bytes(b"s" * 30)
+
+    for path in root.rglob("*"):
+        age(path)
+    return root
+
+def test_find_orphans(storage):
+    orphans = {o["path"].relative_to(storage).as_posix(): o for o in find_orphans(storage, {"registered"})}
+    # Without a Model row the catalog entry is an orphan, and so is the file only it pointed to
+    assert sorted(orphans) == [
+        "catalog_only", "failed_save", "registered/weights.pt.partial", "stray.bin", "upload.bin",
+    ]
+    assert orphans["catalog_only"]["kind"] == "directory"
+    assert orphans["failed_save"]["kind"] == "directory"
+    assert orphans["registered/weights.pt.partial"]["kind"] == "temp"
+    assert orphans["stray.bin"]["bytes"] == 30
+
+def test_keep_catalog_entries(storage):
+    orphans = [o["path"].name for o in find_orphans(storage, {"registered"}, keep_catalog_entries=True)]
+    assert sorted(orphans) == ["failed_save", "stray.bin", "weights.pt.partial"]
+
+def test_recent_items_are_kept(storage):
+    (storage / "in_progress").mkdir()
+    (storage / "in_progress" / "weights.pt.tmp").write_bytes(b"t")
+    orphans = [o["path"].name for o in find_orphans(storage, {"registered"})]
+    assert "in_progress" not in orphans
+
+def test_dry_run_does_not_delete(storage):
+    report = collect_garbage(storage, {"registered"}, dry_run=True)
+    catalog_only = sum(f.stat().st_size for f in (storage / "catalog_only").iterdir())
+    assert report["candidate_bytes"] == catalog_only + len("{not json") + 5 + 30 + 20
+    assert report["removed"] == 0
+    assert (storage / "stray.bin").exists()
+
+def test_collect_garbage_in_batches(storage):
+    report = collect_garbage(storage, {"registered"}, dry_run=False, batch_size=1, pause=0)
+    assert report["removed"] == 5
+    assert report["errors"] == []
+    assert not (storage / "failed_save").exists()
+    assert not (storage / "catalog_only").exists()
+    assert not (storage / "stray.bin").exists()
+    assert not (storage / "upload.bin").exists()
+    assert (storage / "registered" / "weights.pt").exists()
+
+def test_admin_gc_scans_the_configured_storage(api_client, tmp_path, monkeypatch):
+    call = api_client()
+    with Session(call.engine) as db:
+        db.execute(update(User).values(is_superuser=True))
+        db.commit()
+    storage = tmp_path / "custom_models"
+    (storage / "left_behind").mkdir(parents=True)
+    (storage / "left_behind" / "weights.pt").write_bytes(b"w")
+    for path in storage.rglob("*"):
+        age(path)
+    monkeypatch.setattr(settings, "MODEL_SAVE_PATH", str(storage))
+
+    report = call("POST", "/api/v1/admin/storage/gc").json()
+    assert [candidate["path"] for candidate in report["candidates"]] == ["left_behind"]
@@ -0,0 +1,94 @@
+import asyncio
+import sys
+import pytest
+from tokenizers import Tokenizer, models, pre_tokenizers, processors
+from transformers import PreTrainedTokenizerFast
+from src.models.tokenizer_registry import TokenizerRegistry, BatchTokenizer
+
+VOCAB = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "hello", "world", "model", "hub"]
+
+@pytest.fixture
+def registry(tmp_path):
+    storage_path = tmp_path / "models"
+    tokenizer_dir = storage_path / "tiny_bert"
+    tokenizer_dir.mkdir(parents=True)
+    backend = Tokenizer(models.WordLevel({token: i for i, token in enumerate(VOCAB)}, unk_token="[UNK]"))
+    backend.pre_tokenizer = pre_tokenizers.Whitespace()
+    backend.post_processor = processors.TemplateProcessing(
+        single="[CLS] $A [SEP]", special_tokens=[("[CLS]", 2), ("[SEP]", 3)]
+    )
+    PreTrainedTokenizerFast(
+        tokenizer_object=backend, pad_token="[PAD]", unk_token="[UNK]"
+    ).save_pretrained(str(tokenizer_dir))
+    return TokenizerRegistry(storage_path=str(storage_path), cache_size=2, buckets=(4, 8))
+
+def test_tokenizer_loaded_once(registry):
+    first = registry.get("tiny_bert")
+    second = registry.get("tiny_bert")
+    assert first is second
+    assert registry.stats()["loaded"] == ["tiny_bert"]
+
+def test_missing_tokenizer(registry):
+    with pytest.raises(FileNotFoundError):
+        registry.get("non_existent")
+
+def test_encode_uses_lru_cache(registry):
+    registry.encode("tiny_bert", ["hello world", "model hub"])
+    assert registry.misses == 2
+    registry.encode("tiny_bert", ["hello world"])
+    assert registry.hits == 1
+
+    # Cache holds two entries; "model hub" is least recently used and gets evicted
+    registry.encode("tiny_bert", ["hello"])
+    registry.encode("tiny_bert", ["model hub"])
+    assert registry.misses == 4
+    assert registry.stats()["cache_entries"] == 2
+
+def test_padding_to_bucket(registry):
+    batch = registry.tokenize("tiny_bert", ["hello", "hello world model"])
+    # [CLS] hello world model [SEP] is 5 tokens, padded to the 8 bucket
+    assert batch["input_ids"].shape == (2, 8)
+    assert batch["attention_mask"][0].tolist() == [1, 1, 1, 0, 0, 0, 0, 0]
+    assert batch["attention_mask"][1].sum().item() == 5
+
+def test_batch_tokenizer_coalesces_requests(registry):
+    batcher = BatchTokenizer(registry, max_batch_size=8, max_wait_ms=5)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.encode("tiny_bert", "hello"),
+            batcher.encode("tiny_bert", "world"),
+            batcher.encode("tiny_bert", "hello"),
+        )
+
+    results = asyncio.run(run())
+    assert results[0] == results[2]
+    assert results[1] != results[0]
+    # Both distinct texts were encoded together and duplicates collapsed
+    assert registry.misses == 3
+    assert registry.stats()["cache_entries"] == 2
+
+@pytest.mark.parametrize("name", ["../tiny_bert", "tiny_bert/..", "/etc"])
+def test_names_outside_storage_are_rejected(registry, name):
+    with pytest.raises(ValueError):
+        registry.get(name)
+    assert registry.stats()["loaded"] == []
+
+def test_tokenize_endpoint_uses_shared_batcher(registry, api_client, monkeypatch):
+    model_router = sys.modules["src.api.routers.model_router"]
+    monkeypatch.setattr(model_router, "batch_tokenizer", BatchTokenizer(registry, max_wait_ms=1))
+    client = api_client()
+
+    response = client("POST", "/api/v1/models/tokenizers/tiny_bert/tokenize", json={"texts": ["hello", "hello world"]})
+    assert response.status_code == 200
+    assert response.json()["input_ids"] == [[2, 5, 3, 0], [2, 5, 6, 3]]
+    assert response.json()["attention_mask"] == [[1, 1, 1, 0], [1, 1, 1, 1]]
+
+    # 第二次请求命中编码缓存
+    client("POST", "/api/v1/models/tokenizers/tiny_bert/tokenize", json={"texts": ["hello"]})
+    assert registry.hits == 1
+
+    response = client("POST", "/api/v1/models/tokenizers/missing/tokenize", json={"texts": ["hello"]})
+    assert response.status_code == 404
+    response = client("POST", "/api/v1/models/tokenizers/%2E%2E/tokenize", json={"texts": ["hello"]})
+    assert response.status_code == 400
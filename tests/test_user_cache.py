@@ -0,0 +1,81 @@
+import asyncio
+import time
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.core.security import create_access_token, get_current_user
+from src.core.user_cache import UserCache, user_cache
+from src.database import Base, User
+from src.database.config import to_async_url
+
+def test_ttl_lru_and_stats():
+    cache = UserCache(ttl=0.05, max_size=2)
+    for name in ("a", "b"):
+        cache.put(name, {"username": name}, cache.generation)
+    assert cache.get("a") == {"username": "a"}
+    cache.put("c", {"username": "c"}, cache.generation)
+    # "b" was least recently used
+    assert cache.get("b") is None
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 1)
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-3)
+
+def test_put_skipped_after_concurrent_invalidation():
+    cache = UserCache(ttl=60, max_size=10)
+    generation = cache.generation
+    cache.invalidate("a")
+    cache.put("a", {"username": "a"}, generation)
+    assert cache.get("a") is None
+
+def test_disabled_cache():
+    cache = UserCache(ttl=0, max_size=10)
+    cache.put("a", {"username": "a"}, cache.generation)
+    assert cache.get("a") is None
+    assert cache.stats()["misses"] == 0
+
+@pytest.fixture
+def session_factory(tmp_path):
+    url = f"sqlite:///{tmp_path / 'users.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add(User(username="cached", email="cached@example.com", hashed_password="x"))
+        db.commit()
+    engine.dispose()
+
+    async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+    statements = []
+    event.listen(async_engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    user_cache.clear()
+    yield async_sessionmaker(bind=async_engine, expire_on_commit=False), statements
+    user_cache.clear()
+    asyncio.run(async_engine.dispose())
+
+def test_get_current_user_hits_cache_and_stays_writable(session_factory):
+    factory, statements = session_factory
+    token = create_access_token({"sub": "cached"})
+
+    async def run():
+        async with factory() as db:
+            first = await get_current_user(token, db)
+        queries = len(statements)
+        async with factory() as db:
+            user = await get_current_user(token, db)
+            assert len(statements) == queries
+            # The cached user is attached to this session, so updates are persisted
+            user.email = "changed@example.com"
+            await db.commit()
+        user_cache.invalidate("cached")
+        async with factory() as db:
+            reloaded = await get_current_user(token, db)
+        return first.id, user.id, reloaded.email
+
+    first_id, cached_id, email = asyncio.run(run())
+    assert first_id == cached_id
+    assert email == "changed@example.com"